@@ -17,13 +17,16 @@ Dependências:
 
 from src.generators.cython.cy_channel_generator import create_random_channel
 from src.generators.feature_generators.channel_name_generator import generate_channel_name
+from src.initialization.schema import conform
 import pandas as pd
+import numpy as np
 
 def create_random_channel_py(
     users: pd.DataFrame,
     new_channel_ratio: float,
     initial_id: int,
-    current_date_time: float
+    current_date_time: float,
+    rng: np.random.Generator = None
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Cria canais aleatórios utilizando um DataFrame de usuários e metadados fornecidos,
@@ -34,6 +37,7 @@ def create_random_channel_py(
     - new_channel_ratio (float): Proporção de usuários que devem criar novos canais.
     - initial_id (int): ID inicial para os canais criados.
     - current_date_time (float): Timestamp atual (como float) para marcar a criação.
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
 
     Retorno:
     - tuple:
@@ -41,4 +45,8 @@ def create_random_channel_py(
         - channels (pandas.DataFrame): DataFrame com os canais criados em formato analítico.
         - CHANNEL (pandas.DataFrame): DataFrame no formato compatível com a tabela de banco `CHANNEL`.
     """
-    return create_random_channel(users, new_channel_ratio, initial_id, current_date_time, generate_channel_name)
\ No newline at end of file
+    users, channels, CHANNEL = create_random_channel(
+        users, new_channel_ratio, initial_id, current_date_time, generate_channel_name, rng
+    )
+    # O kernel Cython devolve datas categóricas e, sem canais novos, colunas sem tipo
+    return conform('users', users), conform('channels', channels), conform('CHANNEL', CHANNEL)
\ No newline at end of file
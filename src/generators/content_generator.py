@@ -9,7 +9,7 @@ O conteúdo gerado inclui informações como título, categoria, status, idioma,
 para vídeos, shorts, lives e tags associadas. A geração é vetorizada e otimizada para escalabilidade.
 
 Dependências:
-- to_base62_fast, fast_hash: Funções otimizadas para codificação e hashing.
+- hash_titles_ids: Hash em lote (XXH64 + base62) dos títulos e IDs, sem o GIL.
 - generate_languages_nogil: Geração de idiomas com Cython sem GIL.
 - generate_tags_fast: Geração vetorizada de tags por categoria.
 - generate_content_tags: Mapeamento de conteúdo para tags.
@@ -17,20 +17,20 @@ Dependências:
 
 import pandas as pd
 import numpy as np
-import os
-from src import DATA_PATH, BASE_PATH
+from src.initialization.schema import conform
+from src.initialization.vocabularies import CONTENT_STATUS, RATING, CONTENT_TYPE, SHORT_BODY, LANGUAGE
+from src.indexes.content_types import ContentTypeRegistry, VIDEO_CODE, SHORT_CODE, LIVE_CODE
+from src.indexes.content_attributes import ContentAttributeStore
 from src.generators.feature_generators.cython.content_optimized import (
-    to_base62_fast,
-    fast_hash,
+    hash_titles_ids,
     generate_languages_nogil,
     generate_tags_fast,
     generate_content_tags
 )
 import time
 
-# Pré-carrega dados de país e extrai lista única de idiomas
-country_data = pd.read_parquet(os.path.join(DATA_PATH, 'behavior_generated', 'country_data_cleaned.parquet'))
-languages = np.unique(np.concatenate(country_data['Languages'].str.split(',')))
+# Idiomas disponíveis (os mesmos dos países, já semeados em `LANGUAGE`)
+languages = LANGUAGE.values.astype(str)
 
 # Categorias disponíveis
 CATEGORIES = np.arange(1, 16, dtype=np.int8)
@@ -62,7 +62,10 @@ def create_random_content(
     categories: np.ndarray,
     content_ratio: float,
     initial_id: int,
-    current_date: float
+    current_date: float,
+    rng: np.random.Generator = None,
+    content_types: ContentTypeRegistry = None,
+    content_attributes: ContentAttributeStore = None
 ) -> dict:
     """
     Gera conteúdos sintéticos com base em canais fornecidos, utilizando funções otimizadas para gerar
@@ -74,6 +77,10 @@ def create_random_content(
     - content_ratio (float): Proporção de canais a serem usados para gerar conteúdo.
     - initial_id (int): ID inicial para o conteúdo.
     - current_date (float): Timestamp (float) representando a data de criação do conteúdo.
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
+    - content_types (ContentTypeRegistry, opcional): Registro de tipos, estendido com os conteúdos gerados.
+    - content_attributes (ContentAttributeStore, opcional): Atributos por ContentID, estendidos com os conteúdos
+      gerados.
 
     Retorno:
     - dict: Dicionário com os DataFrames gerados (conteúdo, tags, vídeos, lives, etc.) e métricas de tempo.
@@ -81,7 +88,8 @@ def create_random_content(
     timings = {}
     t0 = time.perf_counter()
     num_content = int(len(channels) * content_ratio)
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
 
     # Seleção aleatória
     shuffled_idx = rng.choice(len(channels), size=num_content, replace=False)
@@ -97,12 +105,13 @@ def create_random_content(
     # Títulos e data
     t1 = time.perf_counter()
     content_title = np.char.add(channel_names, ' Content ' + str(current_date))
-    content_creation_date = np.full(num_content, current_date)
+    content_creation_date = np.full(num_content, current_date, dtype=np.float64)
     timings['titles_and_data'] = time.perf_counter() - t1
 
     # Status
     t1 = time.perf_counter()
-    content_status = rng.choice(['Public', 'Private', 'Unlisted'], size=num_content, p=[0.8, 0.1, 0.1])
+    # Códigos direto no vocabulário global ('Public', 'Private', 'Unlisted')
+    content_status = CONTENT_STATUS.categorical(rng.choice(len(CONTENT_STATUS), size=num_content, p=[0.8, 0.1, 0.1]))
     timings['status'] = time.perf_counter() - t1
 
     # Categorias
@@ -127,7 +136,9 @@ def create_random_content(
     fallback_langs = np.array(rng.choice(languages, size=num_content), dtype='S')
     timings['languages_rng'] = time.perf_counter() - t1
     t1 = time.perf_counter()
-    content_language = generate_languages_nogil(use_channel_lang, channel_langs, fallback_langs)
+    content_language = LANGUAGE.categorical(
+        LANGUAGE.encode(generate_languages_nogil(use_channel_lang, channel_langs, fallback_langs))
+    )
     timings['languages'] = time.perf_counter() - t1
 
     # Métricas
@@ -138,43 +149,43 @@ def create_random_content(
 
     # Tipo e duração
     t1 = time.perf_counter()
-    content_type = rng.choice(['Video', 'Short', 'Live'], size=num_content, p=[0.6, 0.3, 0.1])
+    type_codes = rng.choice(len(CONTENT_TYPE), size=num_content, p=[0.6, 0.3, 0.1])
+    is_video = type_codes == VIDEO_CODE
+    is_short = type_codes == SHORT_CODE
+    is_live = type_codes == LIVE_CODE
+    content_type = CONTENT_TYPE.categorical(type_codes)
     content_duration = np.empty(num_content, dtype=np.float32)
-    content_duration[content_type == 'Video'] = rng.beta(2, 4, (content_type == 'Video').sum()) * 3600
-    content_duration[content_type == 'Short'] = rng.beta(4, 2, (content_type == 'Short').sum()) * 60
-    content_duration[content_type == 'Live'] = rng.beta(2, 3, (content_type == 'Live').sum()) * 18000
+    content_duration[is_video] = rng.beta(2, 4, is_video.sum()) * 3600
+    content_duration[is_short] = rng.beta(4, 2, is_short.sum()) * 60
+    content_duration[is_live] = rng.beta(2, 3, is_live.sum()) * 18000
+    if content_types is not None:
+        content_types.add(content_id, type_codes)
     timings['duration'] = time.perf_counter() - t1
 
     # Hashes
     t1 = time.perf_counter()
-    encoded_ids = list(map(to_base62_fast, content_id))
-    content_hashes = [fast_hash(f"{t}{e}") for t, e in zip(content_title, encoded_ids)]
-    content_hashes_int = np.fromiter(
-        (int(h, 16) for h in content_hashes),
-        dtype=np.uint64,
-        count=len(content_hashes)
-    )
+    # Mesmo valor de int(fast_hash(f"{título}{to_base62_fast(id)}"), 16), em uma chamada sem o GIL
+    content_hashes_int = hash_titles_ids(content_title, content_id)
     timings['hashes'] = time.perf_counter() - t1
 
     # Rating
     t1 = time.perf_counter()
-    content_rating = rng.choice(['General Audience', 'Kids', 'Default', 'Age-Restricted'], size=num_content, p=[0.35, 0.2, 0.35, 0.1])
+    content_rating = RATING.categorical(rng.choice(len(RATING), size=num_content, p=[0.35, 0.2, 0.35, 0.1]))
     timings['rating'] = time.perf_counter() - t1
     
     t3 = time.perf_counter()
     t1 = time.perf_counter()
-    # Tabela CONTENT
+    # Tabela CONTENT: o hash só é guardado em ContentURL; título, miniatura e descrição são
+    # colunas virtuais (ver VIRTUAL_COLUMNS em src.initialization.schema)
     df_CONTENT = pd.DataFrame({
         'ContentID': content_id.astype(np.int32),
         'ContentURL': content_hashes_int,
-        'CONTTitle': content_hashes_int,
-        'CONTPubDateTime': pd.Categorical(content_creation_date),
-        'CONTStatus': pd.Categorical(content_status),
-        'CONTCategory': pd.Categorical(content_category),
-        'CONTLanguage': pd.Categorical(content_language),
-        'CONTThumb': content_hashes_int,
-        'CONTDesc': content_hashes_int,
-        'CONTIndRating': pd.Categorical(content_rating),
+        'CONTPubDateTime': content_creation_date,
+        'CONTStatus': content_status,
+        'CONTCategory': content_category,
+        'CONTLanguage': content_language,
+        'CONTCaptionLanguage': content_language,
+        'CONTIndRating': content_rating,
         'ChannelID': content_channel['channel_id'].values.astype(np.int32),
     })
     timings['content_table'] = time.perf_counter() - t1
@@ -198,34 +209,28 @@ def create_random_content(
 
     # Conversão final
     df_content_tag = pd.DataFrame(tag_rows, columns=["CONTTag", "ContentID"])
-    df_content_tag["CONTTag"] = pd.Categorical(df_content_tag["CONTTag"])
+    df_content_tag["CONTTag"] = df_content_tag["CONTTag"].astype(np.int8)
     df_content_tag["ContentID"] = df_content_tag["ContentID"].astype(np.int32)
 
     timings['content_tag'] = time.perf_counter() - t1
     
     t1 = time.perf_counter()
 
-    # Tipos de conteúdo
-    df_video = df_content_table[content_type == "Video"][["ContentID"]].copy()
-    video_hashes = np.array(content_hashes_int)[content_type == "Video"]
-    df_video["VIDEOBody"] = video_hashes.astype(np.int64)
+    # Tipos de conteúdo (os corpos são o hash do conteúdo, calculado na leitura a partir de CONTENT)
+    df_video = df_content_table[is_video][["ContentID"]].copy()
 
     timings['video'] = time.perf_counter() - t1
     
     t1 = time.perf_counter()
 
-    df_short = df_content_table[content_type == "Short"][["ContentID"]].copy()
-    df_short["SHORTBody"] = "Default short body"
-    short_hashes = np.array(content_hashes_int)[content_type == "Short"]
-    df_short["SHMusicLink"] = short_hashes.astype(np.int64)
+    df_short = df_content_table[is_short][["ContentID"]].copy()
+    df_short["SHORTBody"] = SHORT_BODY.categorical(np.zeros(df_short.shape[0], dtype=np.int8))
 
     timings['shorts'] = time.perf_counter() - t1
     
     t1 = time.perf_counter()
 
-    df_live = df_content_table[content_type == "Live"][["ContentID"]].copy()
-    live_hashes = np.array(content_hashes_int)[content_type == "Live"]
-    df_live["LIVEBody"] = live_hashes.astype(np.int64)
+    df_live = df_content_table[is_live][["ContentID"]].copy()
 
     timings['live'] = time.perf_counter() - t1
     
@@ -235,20 +240,18 @@ def create_random_content(
     df_content = pd.DataFrame({
         'content_id': content_id.astype(np.int32),
         'channel_id': content_channel['channel_id'].values.astype(np.int32),
-        'content_title': content_hashes_int,
-        'content_description': content_hashes_int,
-        'content_status': pd.Categorical(content_status),
-        'content_category': pd.Categorical(content_category),
-        'content_language': pd.Categorical(content_language),
+        'content_status': content_status,
+        'content_category': content_category,
+        'content_language': content_language,
         'content_duration': content_duration.astype(np.float32),
-        'content_creation_date': pd.Categorical(content_creation_date),
+        'content_creation_date': content_creation_date,
         'content_view_count': content_view_count.astype(np.int32),
         'content_like_count': content_like_count.astype(np.int32),
         'content_dislike_count': content_dislike_count.astype(np.int32),
         'content_comment_count': content_comment_count.astype(np.int32),
-        'content_ind_rating': pd.Categorical(content_rating),
-        'content_type': pd.Categorical(content_type),
-        'content_is_live': (content_type == 'Live').astype(bool),
+        'content_ind_rating': content_rating,
+        'content_type': content_type,
+        'content_is_live': is_live,
         'content_comments': np.zeros(num_content, dtype=bool),
     })
 
@@ -257,14 +260,18 @@ def create_random_content(
     timings['dataframes'] = time.perf_counter() - t3
     timings['total'] = time.perf_counter() - t0
 
+    df_content = conform('content', df_content)
+    if content_attributes is not None:
+        content_attributes.add(df_content)
+
     return {
         "df_content": df_content,
         "df_content_table": df_content_table,
-        "df_CONTENT": df_CONTENT,
-        "df_content_tag": df_content_tag,
-        "df_video": df_video,
-        "df_short": df_short,
-        "df_live": df_live,
+        "df_CONTENT": conform('CONTENT', df_CONTENT),
+        "df_content_tag": conform('CONTENT_CONTTag', df_content_tag),
+        "df_video": conform('VIDEO', df_video),
+        "df_short": conform('SHORT', df_short),
+        "df_live": conform('LIVE', df_live),
         "timings": timings
     }
     
\ No newline at end of file
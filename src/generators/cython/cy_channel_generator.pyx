@@ -6,9 +6,12 @@ import pandas as pd
 # Tipagem estática
 ctypedef cnp.int32_t int32_t
 
-def create_random_channel(object users_df, float new_channel_ratio, int initial_id, object current_date, object generate_channel_name):
+def create_random_channel(object users_df, float new_channel_ratio, int initial_id, object current_date, object generate_channel_name, object rng=None):
     cdef int num_users = users_df.shape[0]
 
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Máscara de usuários sem canal
     mask = users_df["user_channel_id"].isna().to_numpy()
     cdef int available_users = int(mask.sum())
@@ -28,7 +31,7 @@ def create_random_channel(object users_df, float new_channel_ratio, int initial_
 
     # Selecionar índices de usuários disponíveis
     idx = np.where(mask)[0]
-    selected_idx = np.random.choice(idx, size=num_channels, replace=False)
+    selected_idx = rng.choice(idx, size=num_channels, replace=False)
 
     # Extrair informações dos usuários selecionados
     user_lang = users_df["user_language"].to_numpy()[selected_idx]
@@ -37,8 +40,8 @@ def create_random_channel(object users_df, float new_channel_ratio, int initial_
 
     # Gerar dados de canais
     channel_id = np.arange(initial_id, initial_id + num_channels, dtype=np.int32)
-    channel_category = np.random.randint(1, 16, size=num_channels, dtype=np.int8)
-    channel_name = generate_channel_name(channel_category)
+    channel_category = rng.integers(1, 16, size=num_channels, dtype=np.int8)
+    channel_name = generate_channel_name(channel_category, rng)
     channel_description = np.full(num_channels, '', dtype=object)
     channel_creation_date = np.full(num_channels, current_date)
     uns = np.ones(num_channels, dtype=bool)
@@ -80,7 +80,7 @@ categories_list = list(category_suffixes.keys())
 category_to_index = {k: i for i, k in enumerate(categories_list)}
 suffix_array = [np.array([s.capitalize() for s in category_suffixes[k]]) for k in categories_list]
 
-def generate_channel_name(categories: np.ndarray) -> np.ndarray:
+def generate_channel_name(categories: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
     n = len(categories)
     adjectives_np = np.array(adjectives)
     nouns_np = np.array(nouns)
@@ -89,7 +89,7 @@ def generate_channel_name(categories: np.ndarray) -> np.ndarray:
     suffixes_lengths = np.array([len(sa) for sa in suffix_array], dtype=np.int32)
 
     adj_ids, noun_ids, suffix_ids = generate_indices(
-        n, len(adjectives), len(nouns), suffixes_lengths, category_indices
+        n, len(adjectives), len(nouns), suffixes_lengths, category_indices, rng
     )
 
     return np.array([
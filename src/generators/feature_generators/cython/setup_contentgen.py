@@ -1,6 +1,13 @@
 from setuptools import setup, Extension
 from Cython.Build import cythonize
 import numpy as np
+import sys
+
+# Os laços `prange` só rodam em paralelo com OpenMP; sem essas flags, o Cython os compila em série
+if sys.platform == "win32":
+    openmp_compile_args, openmp_link_args = ["/openmp"], []
+else:
+    openmp_compile_args, openmp_link_args = ["-fopenmp"], ["-fopenmp"]
 
 extensions = [
     Extension(
@@ -8,7 +15,8 @@ extensions = [
         sources=["content_optimized.pyx"],  # seu arquivo .pyx
         include_dirs=[np.get_include()],
         define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
-        extra_compile_args=["-O3"],
+        extra_compile_args=["-O3"] + openmp_compile_args,
+        extra_link_args=openmp_link_args,
     )
 ]
 
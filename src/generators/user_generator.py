@@ -23,6 +23,8 @@ from src.generators.cython.cy_user_generator import (
     generate_user_languages
 )
 import time
+from src.initialization.schema import conform
+from src.initialization.vocabularies import GENDER, ISO3, OCCUPATION
 
 # Caminho base para os dados
 actual_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -75,6 +77,10 @@ all_languages = np.unique(
     [lang for langs in iso3_to_languages.values() for lang in langs]
 )
 
+# Semeia os vocabulários globais na ordem dos dados de entrada
+ISO3.extend(country_data['ISO3'].unique())
+OCCUPATION.extend(work_data['ocupation'].unique())
+
 # Arrays para mapeamento vetorial de localização para idioma primário
 iso3_keys = np.array(sorted(iso3_to_first_language.keys()))
 iso3_firstlangs = np.array([iso3_to_first_language[k] for k in iso3_keys], dtype=object)
@@ -145,7 +151,8 @@ def generate_eat_time_vectorized(
 
 def create_random_user(
     number_of_users: int,
-    start_id: int
+    start_id: int,
+    rng: np.random.Generator = None
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Gera usuários sintéticos com dados demográficos, comportamentais e de perfil.
@@ -153,19 +160,21 @@ def create_random_user(
     Parâmetros:
     - number_of_users (int): Quantidade de usuários a serem gerados.
     - start_id (int): ID inicial dos usuários.
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
 
     Retorno:
     - tuple:
         - df_new_users (pd.DataFrame): Dados comportamentais e demográficos.
         - df_new_USER (pd.DataFrame): Dados básicos de conta.
     """
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
     
     user_id = np.arange(start_id, start_id + number_of_users).astype(np.int32)
     user_name = rng.integers(0, 1000, size=number_of_users).astype(np.int16)
     
     user_age = np.clip(rng.negative_binomial(5, 0.15, number_of_users), 4, 100).astype(np.int32)
-    user_gender = rng.choice(['M', 'F'], size=number_of_users)
+    user_gender = rng.choice(len(GENDER), size=number_of_users)
     user_location = rng.choice(country_data['ISO3'].unique(), size=number_of_users, p=probabilities_country)
     
     user_ocupation = np.empty(number_of_users, dtype=object)
@@ -221,7 +230,7 @@ def create_random_user(
     zeros = np.zeros(number_of_users, dtype=bool)
     df_new_users = pd.DataFrame({
         'user_id': user_id,
-        'user_name': pd.Categorical(user_name),
+        'user_name': user_name,
         'user_bed_time': adjust_time(user_bed_time).astype(np.float16),
         'user_wake_time': adjust_time(user_wake_time).astype(np.float16),
         'user_lunch_time': adjust_time(user_lunch_time).astype(np.float16),
@@ -230,10 +239,10 @@ def create_random_user(
         'user_free_from_work_time': adjust_time(user_free_from_work_time).astype(np.int8),
         'user_work_days': user_work_days.astype(np.int8),
         'user_age': user_age.astype(np.int8),
-        'user_gender': pd.Categorical(user_gender),
-        'user_location': pd.Categorical(user_location),
-        'user_language': pd.Categorical(user_language),
-        'user_ocupation': pd.Categorical(user_ocupation),
+        'user_gender': GENDER.categorical(user_gender),
+        'user_location': ISO3.categorical(ISO3.encode(user_location)),
+        'user_language': user_language.astype(object),
+        'user_ocupation': OCCUPATION.categorical(OCCUPATION.encode(user_ocupation)),
         'user_education': user_education.astype(np.int8),
         'user_video_watching_time': user_video_watching_time.astype(np.float16),
         'user_video_retention_time': user_video_retention_time.astype(np.float16),
@@ -244,10 +253,10 @@ def create_random_user(
     ones = np.ones(number_of_users, dtype=bool)
     df_new_USER = pd.DataFrame({
         'UserID': user_id,
-        'UserName': pd.Categorical(user_name),
+        'UserName': user_name,
         'UserEmail': ones,
         'UserPassword': ones,
         'UserPhoto': ones,
     })
 
-    return df_new_users, df_new_USER
\ No newline at end of file
+    return conform('users', df_new_users), conform('USER', df_new_USER)
\ No newline at end of file
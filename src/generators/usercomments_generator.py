@@ -21,6 +21,11 @@ Dependências:
 import pandas as pd
 import numpy as np
 import time
+from src.initialization.schema import conform, empty_frame
+from src.indexes.content_types import VIDEO_CODE, SHORT_CODE, LIVE_CODE
+
+# Tabelas devolvidas por `create_random_comments`, na ordem da tupla de retorno
+COMMENT_TABLES = ('COMMENT', 'COMMENTREPLY', 'LIVECOMMENT', 'VIDEOCOMMENT', 'SHORTCOMMENT')
 
 def create_random_comments(
     comment_ratio: float,
@@ -32,7 +37,11 @@ def create_random_comments(
     current_datetime: float,
     lives: pd.DataFrame,
     videos: pd.DataFrame,
-    shorts: pd.DataFrame
+    shorts: pd.DataFrame,
+    rng: np.random.Generator = None,
+    watching_now: pd.DataFrame = None,
+    comment_index=None,
+    content_types=None
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Gera comentários sintéticos com base em usuários assistindo conteúdos, com possibilidade de
@@ -45,6 +54,14 @@ def create_random_comments(
     - livecomments, videocomments, shortcomments (pd.DataFrame): Comentários já existentes por tipo de conteúdo.
     - current_datetime (float): Timestamp atual da simulação.
     - lives, videos, shorts (pd.DataFrame): Tabelas de conteúdo do tipo Live, Vídeo e Short.
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
+    - watching_now (pd.DataFrame, opcional): Sessões ativas (ver `ActiveSessionIndex`). Se omitido,
+      é obtido filtrando `uwatchingcont` por `UIsWatchingCONTNow`.
+    - comment_index (ContentCommentIndex, opcional): Comentários agrupados por conteúdo. Se fornecido, o
+      alvo das respostas é sorteado no índice (O(conteúdos assistidos)), sem juntar as sessões com o
+      histórico de comentários; `livecomments`, `videocomments` e `shortcomments` não são lidas.
+    - content_types (ContentTypeRegistry, opcional): Tipo de cada conteúdo. Se fornecido, o tipo dos
+      conteúdos assistidos vem do registro, e `lives`, `videos` e `shorts` não são lidas.
 
     Retorno:
     - tuple de pd.DataFrames:
@@ -56,64 +73,83 @@ def create_random_comments(
     """
 
     t0 = time.time()
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
     
     # 1. Filtrar usuários assistindo agora
-    watching_now = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']].copy()
+    if watching_now is None:
+        watching_now = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']]
     num_comments = int(len(watching_now) * comment_ratio)
 
     t1 = time.time()
 
     if num_comments == 0:
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-    # Content types merge
-    content_ids = pd.concat([
-        lives['ContentID'], 
-        videos['ContentID'], 
-        shorts['ContentID']
-    ], ignore_index=True)
-
-    content_types = pd.DataFrame({
-        'ContentID': content_ids,
-        'Type': np.repeat([0, 1, 2], [
-            lives.shape[0], videos.shape[0], shorts.shape[0]
-        ]).astype(np.int8)
-    })
-    
-    t21 = time.time()
-    
-    content_types = content_types.set_index('ContentID')
+        return tuple(empty_frame(name) for name in COMMENT_TABLES)
+
     watching_now_with_types = watching_now[['UserID', 'ContentID']].copy()
-    watching_now_with_types['Type'] = content_types.loc[watching_now_with_types['ContentID']].values
+    if content_types is not None:
+        # Tipo de cada conteúdo assistido direto no registro (códigos de CONTENT_TYPE)
+        t21 = time.time()
+        watching_now_with_types['Type'] = content_types.lookup(watching_now_with_types['ContentID'].to_numpy())
+    else:
+        # Content types merge
+        content_ids = pd.concat([
+            lives['ContentID'], 
+            videos['ContentID'], 
+            shorts['ContentID']
+        ], ignore_index=True)
+
+        type_index = pd.DataFrame({
+            'ContentID': content_ids,
+            'Type': np.repeat([LIVE_CODE, VIDEO_CODE, SHORT_CODE], [
+                lives.shape[0], videos.shape[0], shorts.shape[0]
+            ]).astype(np.int8)
+        })
+        
+        t21 = time.time()
+        
+        type_index = type_index.set_index('ContentID')
+        watching_now_with_types['Type'] = type_index.loc[watching_now_with_types['ContentID']].values
     t2 = time.time()
 
-    # Agrupamento e merge de comentários existentes
-    content_comments = pd.concat(
-        [livecomments[['ContentID', 'CommentID']],
-        videocomments[['ContentID', 'CommentID']],
-        shortcomments[['ContentID', 'CommentID']]],
-        ignore_index=True
-    )
-    t31 = time.time()
-    watching_now_ID = pd.DataFrame()
-    watching_now_ID['ContentID'] = watching_now['ContentID']
-    watching_now_comments = pd.merge(watching_now_ID, content_comments, on='ContentID', how='left')
-    t32 = time.time()
-    
-    # Gargalo
-    positions = rng.permutation(watching_now_comments.shape[0], axis=0)
-    t33 = time.time()
-    
-    reply_choices = watching_now_comments.iloc[positions].drop_duplicates(subset='ContentID', keep='first').reset_index(drop=True)
+    if comment_index is not None:
+        # Um comentário sorteado por conteúdo assistido, direto no índice (-1 = conteúdo sem comentários)
+        t31 = time.time()
+        watched_contents, watched_positions = np.unique(
+            watching_now_with_types['ContentID'].to_numpy(), return_inverse=True
+        )
+        t32 = t33 = time.time()
+        reply_targets = comment_index.sample(watched_contents, rng)
+        t3 = time.time()
+        watching_now_with_types['CommentID'] = reply_targets[watched_positions]
+        t41 = time.time()
+    else:
+        # Agrupamento e merge de comentários existentes
+        content_comments = pd.concat(
+            [livecomments[['ContentID', 'CommentID']],
+            videocomments[['ContentID', 'CommentID']],
+            shortcomments[['ContentID', 'CommentID']]],
+            ignore_index=True
+        )
+        t31 = time.time()
+        watching_now_ID = pd.DataFrame()
+        watching_now_ID['ContentID'] = watching_now['ContentID']
+        watching_now_comments = pd.merge(watching_now_ID, content_comments, on='ContentID', how='left')
+        t32 = time.time()
+        
+        # Gargalo
+        positions = rng.permutation(watching_now_comments.shape[0], axis=0)
+        t33 = time.time()
+        
+        reply_choices = watching_now_comments.iloc[positions].drop_duplicates(subset='ContentID', keep='first').reset_index(drop=True)
 
-    t3 = time.time()
-    
-    reply_choices['CommentID'] = reply_choices['CommentID'].fillna(np.int32(-1))
-    reply_choices = reply_choices.set_index('ContentID')
-    watching_now_with_types['CommentID'] = reply_choices.loc[watching_now_with_types['ContentID']].values
-    
-    t41 = time.time()
+        t3 = time.time()
+        
+        reply_choices['CommentID'] = reply_choices['CommentID'].fillna(np.int32(-1))
+        reply_choices = reply_choices.set_index('ContentID')
+        watching_now_with_types['CommentID'] = reply_choices.loc[watching_now_with_types['ContentID']].values
+        
+        t41 = time.time()
     
     positions = rng.permutation(watching_now_with_types.shape[0])
     chosen_lines = watching_now_with_types.iloc[positions[:num_comments]]
@@ -159,7 +195,7 @@ def create_random_comments(
 
     new_comments = pd.DataFrame({
         'CommentID': new_comments_id,
-        'COMDateTime': np.full(total_lines, current_datetime, dtype=np.float32),
+        'COMDateTime': np.full(total_lines, current_datetime, dtype=np.float64),
         'COMisEdited': np.zeros(total_lines, dtype=np.bool_),
         'COMBody': np.zeros(total_lines, dtype=np.bool_),
         'UserID': all_user_ids
@@ -168,9 +204,9 @@ def create_random_comments(
     t6 = time.time()
 
     new_replies = replies[['CommentID', 'COMisRepByCOMCommentID']]
-    new_live_comments = total_chosen_content[total_chosen_content['Type'] == 0][['CommentID', 'ContentID']]
-    new_video_comments = total_chosen_content[total_chosen_content['Type'] == 1][['CommentID', 'ContentID']]
-    new_short_comments = total_chosen_content[total_chosen_content['Type'] == 2][['CommentID', 'ContentID']]
+    new_live_comments = total_chosen_content[total_chosen_content['Type'] == LIVE_CODE][['CommentID', 'ContentID']]
+    new_video_comments = total_chosen_content[total_chosen_content['Type'] == VIDEO_CODE][['CommentID', 'ContentID']]
+    new_short_comments = total_chosen_content[total_chosen_content['Type'] == SHORT_CODE][['CommentID', 'ContentID']]
 
     t7 = time.time()
 
@@ -189,7 +225,11 @@ def create_random_comments(
     print(f"▶️  t7 - splits por tipo          : {t7 - t6:.4f}")
     print(f"⏳  Tempo total                   : {t7 - t0:.4f}\n")
 
-    return new_comments, new_replies, new_live_comments, new_video_comments, new_short_comments
+    return tuple(
+        conform(name, df) for name, df in zip(COMMENT_TABLES, (
+            new_comments, new_replies, new_live_comments, new_video_comments, new_short_comments
+        ))
+    )
 
 if __name__ == '__main__':
     import os
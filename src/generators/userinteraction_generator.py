@@ -19,12 +19,16 @@ import numpy as np
 import os
 import time
 from src import BASE_PATH, DATA_PATH
+from src.initialization.schema import conform, empty_frame
 
 def create_random_user_interactions(
     interaction_ratio: float,
     uwatchingcont: pd.DataFrame,
     userinteraction: pd.DataFrame,
-    ucontint: pd.DataFrame
+    ucontint: pd.DataFrame,
+    rng: np.random.Generator = None,
+    watching_now: pd.DataFrame = None,
+    interaction_index=None
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Gera interações sintéticas (like, dislike, neutro) entre usuários e conteúdos que estão assistindo,
@@ -35,56 +39,65 @@ def create_random_user_interactions(
     - uwatchingcont (pd.DataFrame): DataFrame com usuários assistindo conteúdos no momento.
     - userinteraction (pd.DataFrame): Interações de usuário existentes (UINTID, UserID, UINTType).
     - ucontint (pd.DataFrame): Mapeamento entre interações e conteúdos (UINTID, ContentID).
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
+    - watching_now (pd.DataFrame, opcional): Sessões ativas (ver `ActiveSessionIndex`). Se omitido,
+      é obtido filtrando `uwatchingcont` por `UIsWatchingCONTNow`.
+    - interaction_index (InteractionIndex, opcional): Pares (usuário, conteúdo) que já interagiram. Se
+      fornecido, as sessões sem interação são filtradas por uma busca no índice, sem juntar o histórico;
+      `ucontint` não é lida e `userinteraction` só é usada para numerar as interações novas.
 
     Retorno:
     - tuple de pd.DataFrame:
         - userinteraction: Novas interações de usuários (com tipo e ID).
         - ucontint: Novas associações entre interações e conteúdos.
     """
-    if uwatchingcont.shape[0] < 10:
-        userinteraction = pd.DataFrame(columns=[
-            'UINTType',
-            'UINTID',
-            'UserID',
-            ])
-
-        ucontint = pd.DataFrame(columns=[
-            'UINTID',
-            'ContentID',
-            ])
-        
-        return userinteraction, ucontint
+    # Com poucas visualizações não há o que amostrar. O limite vale para as sessões de onde as interações
+    # são sorteadas: `uwatchingcont` pode trazer só as visualizações novas do tick
+    num_watches = uwatchingcont.shape[0] if watching_now is None else watching_now.shape[0]
+    if num_watches < 10:
+        return empty_frame('USERINTERACTION'), empty_frame('UCONTINT')
     
     total_start = time.time()
 
     # 1. Filtrar usuários que estão assistindo agora
     t1 = time.time()
-    now_watching = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']]
+    if watching_now is None:
+        watching_now = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']]
+    now_watching = watching_now
     t2 = time.time()
 
-    # 2. Juntar interações já existentes
-    content_interactions = pd.merge(ucontint, userinteraction, how='left')
-    content_interactions = content_interactions[content_interactions['UINTType'] != 0]
-    t3 = time.time()
-    
     columns_needed = ['UserID', 'ContentID']  # ou outras que você usa
     filtered = now_watching[columns_needed]
-    
-    # Faz merge e identifica quem não tem interação ainda
-    merged = filtered.merge(
-        content_interactions[['UserID', 'ContentID']],
-        on=['UserID', 'ContentID'],
-        how='left',
-        indicator=True
-    )
 
-    # Filtra os que não têm correspondência (i.e. não interagiram)
-    now_watching_no_int = merged[merged['_merge'] == 'left_only'].drop(columns=['_merge'])
+    if interaction_index is not None:
+        # 2-3. Busca dos pares (usuário, conteúdo) no índice de interações
+        t3 = time.time()
+        interacted = interaction_index.contains(
+            filtered['UserID'].to_numpy(), filtered['ContentID'].to_numpy()
+        )
+        now_watching_no_int = filtered[~interacted].reset_index(drop=True)
+    else:
+        # 2. Juntar interações já existentes
+        content_interactions = pd.merge(ucontint, userinteraction, how='left')
+        content_interactions = content_interactions[content_interactions['UINTType'] != 0]
+        t3 = time.time()
+        
+        # Faz merge e identifica quem não tem interação ainda
+        merged = filtered.merge(
+            content_interactions[['UserID', 'ContentID']],
+            on=['UserID', 'ContentID'],
+            how='left',
+            indicator=True
+        )
+
+        # Filtra os que não têm correspondência (i.e. não interagiram)
+        now_watching_no_int = merged[merged['_merge'] == 'left_only'].drop(columns=['_merge'])
 
     t4 = time.time()
 
     # 4. Amostrar usuários para gerar interação
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
     num_interactions = int(now_watching_no_int.shape[0] * interaction_ratio)
     filtered = now_watching_no_int[columns_needed]
     positions = rng.choice(len(filtered), size=num_interactions, replace=False)
@@ -121,7 +134,7 @@ def create_random_user_interactions(
     print(f"6. Criar DataFrames finais:      {t7 - t6:.4f}s")
     print(f"🧮 Tempo total:                  {t7 - total_start:.4f}s\n")
 
-    return userinteraction, ucontint
+    return conform('USERINTERACTION', userinteraction), conform('UCONTINT', ucontint)
 
 if __name__ == '__main__':
     import time
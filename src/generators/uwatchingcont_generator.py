@@ -16,10 +16,14 @@ Dependências:
 """
 
 from src.recommendation.recommendate import recommendate
+from src.initialization.schema import conform, empty_frame
 import pandas as pd
 import numpy as np
 import time
 
+# Máximo de sessões ativas de um usuário para ele poder começar outra visualização
+MAX_WATCHING = 4
+
 def create_random_uwatching_cont(
     num_watching_ratio: float,
     users: pd.DataFrame,
@@ -35,7 +39,14 @@ def create_random_uwatching_cont(
     videocomment: pd.DataFrame,
     shortcomment: pd.DataFrame,
     num_recommendations: int,
-    current_datetime: float
+    current_datetime: float,
+    rng: np.random.Generator = None,
+    watching_now: pd.DataFrame = None,
+    profiles=None,
+    popularity=None,
+    segments=None,
+    content_attributes=None,
+    sessions=None
 ) -> pd.DataFrame:
     """
     Gera novos registros sintéticos de visualização de conteúdo (UWATCHINGCONT) para usuários selecionados, 
@@ -54,41 +65,53 @@ def create_random_uwatching_cont(
     - comment, livecomment, videocomment, shortcomment (pd.DataFrame): Comentários por tipo de conteúdo.
     - num_recommendations (int): Número de recomendações a serem geradas por usuário.
     - current_datetime (float): Timestamp atual da simulação.
+    - rng (np.random.Generator, opcional): Gerador de números aleatórios.
+    - watching_now (pd.DataFrame, opcional): Sessões ativas (ver `ActiveSessionIndex`). Se omitido,
+      é obtido filtrando `uwatchingcont` por `UIsWatchingCONTNow`.
+    - profiles (ProfileStore, opcional): Perfis de tags mantidos entre ticks. Se omitido, o recomendador
+      os recalcula a partir do histórico.
+    - popularity (PopularityStore, opcional): Tendências por categoria, usadas como fallback das recomendações
+      (com `content_attributes`, incluem conteúdos de ticks anteriores).
+    - segments (SegmentStore, opcional): Perfis por segmento demográfico, para usuários sem curtidas.
+    - content_attributes (ContentAttributeStore, opcional): Atributos densos por ContentID, já com os conteúdos
+      de `content`. Se omitido, as durações vêm de um dicionário montado a partir de `content`.
+    - sessions (ActiveSessionIndex, opcional): Índice das sessões ativas, com a contagem por usuário. Se dado,
+      os usuários elegíveis saem direto dessas contagens (e `watching_now` não é consultado).
 
     Retorno:
     - pd.DataFrame: Novo DataFrame com os registros gerados de visualização de conteúdo.
     """
     if content.shape[0] < 10:
-        return pd.DataFrame(columns=[
-        'UWatchDurationCONT',
-        'UWatchCONTDateTime',
-        'UIsWatchingCONTNow',
-        'UWATCHCONTID',
-        'UserID',
-        'ContentID' 
-    ])
+        return empty_frame('UWATCHINGCONT')
     
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
 
     total_start = time.time()  # Timer total da função
 
-    # 1. Filtrar usuários que estão assistindo no máximo 4 conteúdos
+    # 1. Filtrar usuários que estão assistindo no máximo MAX_WATCHING conteúdos (inclusive os que não assistem nada)
     start = time.time()
-    watching_now = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']]
-    if watching_now.empty:
-        valid_users = users.copy()
+    if sessions is not None:
+        eligible = sessions.user_counts(users['user_id'].to_numpy()) <= MAX_WATCHING
+        valid_users = users[eligible].reset_index(drop=True)
     else:
-        counts = watching_now.groupby("UserID").size()
-        valid_user_ids = counts[counts <= 4].index.values
-        valid_users = users[users['user_id'].isin(valid_user_ids)].reset_index(drop=True)
+        if watching_now is None:
+            watching_now = uwatchingcont[uwatchingcont['UIsWatchingCONTNow']]
+        if watching_now.empty:
+            valid_users = users.copy()
+        else:
+            counts = watching_now.groupby("UserID").size()
+            busy_user_ids = counts[counts > MAX_WATCHING].index.values
+            valid_users = users[~users['user_id'].isin(busy_user_ids)].reset_index(drop=True)
     print(f"Etapa 1 - Filtragem de usuários: {time.time() - start:.4f}s")
 
     # 2. Amostragem de usuários
     start = time.time()
     num_users = int(valid_users.shape[0] * num_watching_ratio)
-    user_sampled = valid_users.sample(num_users, replace=False).reset_index(drop=True)
+    user_sampled = valid_users.sample(num_users, replace=False, random_state=rng).reset_index(drop=True)
     user_ids = user_sampled['user_id'].values.astype(np.int32)
-    USER_sampled = USERS.iloc[user_ids]
+    # USERS não é indexado pelo ID global (só traz as linhas novas, ou a partição de um shard)
+    USER_sampled = USERS.iloc[pd.Index(USERS['UserID']).get_indexer(user_ids)]
     print(f"Etapa 2 - Amostragem de usuários: {time.time() - start:.4f}s")
 
     # 3. Geração de recomendações
@@ -105,7 +128,14 @@ def create_random_uwatching_cont(
         comment,
         livecomment,
         videocomment,
-        shortcomment)
+        shortcomment,
+        rng=rng,
+        profiles=profiles,
+        popularity=popularity,
+        segments=segments,
+        # Os candidatos do tick são só os conteúdos novos, ainda sem eventos: com a duração de todos os
+        # conteúdos em `content_attributes`, as tendências podem trazer conteúdos de ticks anteriores
+        restrict_trending=content_attributes is None)
     print(recommendations[-10:])
     rec_matrix = recommendations[:, 1].reshape((num_users, num_recommendations))
     print('Depois de recomendar')
@@ -122,10 +152,13 @@ def create_random_uwatching_cont(
 
     # 5. Determinação de durações assistidas
     start = time.time()
-    content_ids_arr = content["content_id"].values
-    durations_arr = content["content_duration"].values
-    content_duration_map = dict(zip(content_ids_arr, durations_arr))
-    durations = np.array([content_duration_map[cid] for cid in final_contents], dtype=np.float32)
+    if content_attributes is not None:
+        durations = content_attributes.durations[final_contents]
+    else:
+        content_ids_arr = content["content_id"].values
+        durations_arr = content["content_duration"].values
+        content_duration_map = dict(zip(content_ids_arr, durations_arr))
+        durations = np.array([content_duration_map[cid] for cid in final_contents], dtype=np.float32)
     watched_durations = rng.beta(2, 2, size=num_users) * durations
     print(f"Etapa 5 - Duração assistida: {time.time() - start:.4f}s")
 
@@ -134,7 +167,7 @@ def create_random_uwatching_cont(
     uwatch_ids = np.arange(uwatchingcont.shape[0], uwatchingcont.shape[0] + num_users, dtype=np.int32)
     df_new_watch = pd.DataFrame({
         'UWatchDurationCONT': watched_durations.astype(np.int16),
-        'UWatchCONTDateTime': np.full(num_users, current_datetime),
+        'UWatchCONTDateTime': np.full(num_users, current_datetime, dtype=np.float64),
         'UIsWatchingCONTNow': np.ones(num_users, dtype=bool),
         'UWATCHCONTID': uwatch_ids,
         'UserID': user_ids,
@@ -143,7 +176,7 @@ def create_random_uwatching_cont(
     print(f"Etapa 6 - Criação do DataFrame: {time.time() - start:.4f}s")
 
     print(f"Tempo total da função: {time.time() - total_start:.4f}s")
-    return df_new_watch
+    return conform('UWATCHINGCONT', df_new_watch)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,143 @@
+"""
+Module: active_sessions
+-----------------------
+
+Índice das sessões de visualização ativas (linhas de UWATCHINGCONT cujo conteúdo ainda está sendo assistido).
+
+Em vez de recalcular `UIsWatchingCONTNow` sobre todo o histórico a cada tick, o índice guarda apenas as sessões
+ativas, ordenadas pelo instante de término (`UWatchCONTDateTime + UWatchDurationCONT`) — um min-heap em lote.
+Quando o relógio avança, as sessões vencidas saem do início dos arrays com uma busca binária, e o conjunto ativo
+fica disponível diretamente. O custo por tick passa a depender do número de espectadores simultâneos, e não do
+número total de visualizações já registradas.
+
+O índice também guarda quantas sessões ativas cada usuário tem, em um array int8 denso por UserID,
+incrementado quando as sessões entram e decrementado quando vencem. Saber quais usuários ainda podem
+começar outra visualização passa a ser uma indexação O(usuários), sem agrupar as sessões por usuário.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Colunas de UWATCHINGCONT guardadas para as sessões ativas
+SESSION_COLUMNS = (
+    'UWatchDurationCONT',
+    'UWatchCONTDateTime',
+    'UWATCHCONTID',
+    'UserID',
+    'ContentID',
+)
+
+
+class ActiveSessionIndex:
+    """
+    Conjunto das sessões de visualização ativas, ordenado por instante de término.
+
+    A ordem interna é (término, UWATCHCONTID), de modo que um índice reconstruído a partir do histórico
+    (`from_uwatchingcont`) é idêntico ao mantido incrementalmente.
+    """
+
+    def __init__(self):
+        self.end_times = np.empty(0, dtype=np.float64)
+        self.columns = {col: np.empty(0) for col in SESSION_COLUMNS}
+        # Sessões ativas por usuário (denso por UserID)
+        self._user_counts = np.zeros(0, dtype=np.int8)
+
+    @classmethod
+    def from_uwatchingcont(cls, uwatchingcont: pd.DataFrame, current_datetime: float) -> 'ActiveSessionIndex':
+        """
+        Reconstrói o índice a partir do histórico de UWATCHINGCONT (por exemplo, ao retomar um checkpoint).
+
+        Parâmetros:
+        - uwatchingcont (pd.DataFrame): Histórico de visualizações.
+        - current_datetime (float): Relógio atual da simulação.
+
+        Retorno:
+        - ActiveSessionIndex: Índice com as sessões que terminam depois de `current_datetime`.
+        """
+        index = cls()
+        index.add(uwatchingcont)
+        index.advance(current_datetime)
+        return index
+
+    def __len__(self) -> int:
+        return self.end_times.shape[0]
+
+    def add(self, new_sessions: pd.DataFrame):
+        """
+        Inclui sessões recém-criadas no índice.
+
+        Parâmetros:
+        - new_sessions (pd.DataFrame): Linhas novas de UWATCHINGCONT.
+        """
+        if new_sessions.empty:
+            return
+        new_end = (
+            new_sessions['UWatchCONTDateTime'].to_numpy(dtype=np.float64)
+            + new_sessions['UWatchDurationCONT'].to_numpy(dtype=np.float64)
+        )
+        end_times = np.concatenate((self.end_times, new_end))
+        columns = {
+            col: np.concatenate((self.columns[col], new_sessions[col].to_numpy()))
+            if len(self) else new_sessions[col].to_numpy()
+            for col in SESSION_COLUMNS
+        }
+        order = np.lexsort((columns['UWATCHCONTID'], end_times))
+        self.end_times = end_times[order]
+        self.columns = {col: values[order] for col, values in columns.items()}
+        self._count_users(new_sessions['UserID'].to_numpy(dtype=np.int64), 1)
+
+    def advance(self, current_datetime: float) -> int:
+        """
+        Remove as sessões que terminaram até `current_datetime`.
+
+        Retorno:
+        - int: Número de sessões encerradas.
+        """
+        expired = int(np.searchsorted(self.end_times, current_datetime, side='right'))
+        if expired:
+            self._count_users(self.columns['UserID'][:expired].astype(np.int64), -1)
+            self.end_times = self.end_times[expired:]
+            self.columns = {col: values[expired:] for col, values in self.columns.items()}
+        return expired
+
+    def active(self) -> pd.DataFrame:
+        """
+        Retorna as sessões ativas no mesmo formato de UWATCHINGCONT (com `UIsWatchingCONTNow` verdadeiro).
+        """
+        return pd.DataFrame({
+            'UWatchDurationCONT': self.columns['UWatchDurationCONT'],
+            'UWatchCONTDateTime': self.columns['UWatchCONTDateTime'],
+            'UIsWatchingCONTNow': np.ones(len(self), dtype=bool),
+            'UWATCHCONTID': self.columns['UWATCHCONTID'],
+            'UserID': self.columns['UserID'],
+            'ContentID': self.columns['ContentID'],
+        })
+
+    def user_counts(self, user_ids) -> np.ndarray:
+        """
+        Número de sessões ativas de cada usuário.
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários.
+
+        Retorno:
+        - np.ndarray: Contagens (int8), com 0 para usuários sem sessões registradas.
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        known = user_ids < self._user_counts.shape[0]
+        counts = np.zeros(user_ids.shape[0], dtype=np.int8)
+        counts[known] = self._user_counts[user_ids[known]]
+        return counts
+
+    def _count_users(self, user_ids: np.ndarray, step: int):
+        """Soma `step` à contagem de cada usuário, uma vez por sessão."""
+        if user_ids.shape[0] == 0:
+            return
+        size = int(user_ids.max()) + 1
+        current = self._user_counts.shape[0]
+        if size > current:
+            grown = np.zeros(max(size, 2 * current, 1024), dtype=np.int8)
+            grown[:current] = self._user_counts
+            self._user_counts = grown
+        users, sessions = np.unique(user_ids, return_counts=True)
+        self._user_counts[users] += (step * sessions).astype(np.int8)
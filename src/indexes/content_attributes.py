@@ -0,0 +1,112 @@
+"""
+Module: content_attributes
+--------------------------
+
+Atributos de cada conteúdo (duração, categoria, tipo, idioma, status, classificação e canal) em arrays densos
+indexados pelo ContentID.
+
+Os ContentIDs são inteiros densos a partir de 0, então cada atributo cabe em um único array contíguo
+(`durations[ContentID]`), estendido à medida que os conteúdos são criados (ver `create_random_content`).
+Buscar um atributo de K conteúdos é uma indexação O(K) (`store.durations[content_ids]`), sem montar a cada
+tick um dicionário ContentID -> valor sobre a tabela `content`. As colunas categóricas guardam os códigos dos
+vocabulários globais (`CONTENT_TYPE`, `LANGUAGE`, `CONTENT_STATUS`, `RATING`), e IDs ainda desconhecidos
+ficam com -1 (ou NaN, na duração).
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.initialization.vocabularies import CONTENT_STATUS, CONTENT_TYPE, LANGUAGE, RATING
+
+# Atributo -> (coluna da tabela `content`, dtype, valor de conteúdos desconhecidos, vocabulário)
+ATTRIBUTES = {
+    "durations": ("content_duration", np.float32, np.nan, None),
+    "categories": ("content_category", np.int8, -1, None),
+    "types": ("content_type", np.int8, -1, CONTENT_TYPE),
+    "languages": ("content_language", np.int16, -1, LANGUAGE),
+    "statuses": ("content_status", np.int8, -1, CONTENT_STATUS),
+    "ratings": ("content_ind_rating", np.int8, -1, RATING),
+    "channels": ("channel_id", np.int32, -1, None),
+}
+
+
+class ContentAttributeStore:
+    """
+    Atributos dos conteúdos em arrays densos por ContentID (um array por atributo de `ATTRIBUTES`).
+
+    Os arrays públicos (`durations`, `categories`, `types`, `languages`, `statuses`, `ratings`, `channels`)
+    podem ser indexados diretamente com ContentIDs já registrados; `gather` também aceita IDs desconhecidos.
+    """
+
+    def __init__(self):
+        for name, (_, dtype, missing, _) in ATTRIBUTES.items():
+            setattr(self, name, np.full(0, missing, dtype=dtype))
+        self._size = 0
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'ContentAttributeStore':
+        """
+        Reconstrói os atributos a partir da tabela `content` (por exemplo, lida do disco).
+
+        Parâmetros:
+        - tables (dict): Tabelas com `content` (ignorada se ausente).
+        """
+        store = cls()
+        store.update(tables)
+        return store
+
+    def __len__(self) -> int:
+        """Número de conteúdos registrados."""
+        return self._size
+
+    def update(self, new: dict):
+        """Registra os conteúdos novos da tabela `content` de um tick."""
+        if "content" in new:
+            self.add(new["content"])
+
+    def add(self, content: pd.DataFrame):
+        """
+        Registra os atributos de conteúdos novos.
+
+        Parâmetros:
+        - content (pd.DataFrame): Linhas da tabela `content` (com content_id e as colunas de `ATTRIBUTES`).
+        """
+        content_ids = content["content_id"].to_numpy(dtype=np.int64)
+        if content_ids.shape[0] == 0:
+            return
+        self._reserve(int(content_ids.max()) + 1)
+        known = self.categories[content_ids] >= 0
+        for name, (column, dtype, _, vocabulary) in ATTRIBUTES.items():
+            values = vocabulary.encode(content[column]) if vocabulary is not None else content[column].to_numpy()
+            getattr(self, name)[content_ids] = np.asarray(values).astype(dtype, copy=False)
+        self._size += int(np.unique(content_ids[~known]).shape[0])
+
+    def gather(self, name: str, content_ids) -> np.ndarray:
+        """
+        Valores de um atributo para cada conteúdo.
+
+        Parâmetros:
+        - name (str): Atributo (chave de `ATTRIBUTES`, por exemplo 'durations').
+        - content_ids (np.ndarray): ContentIDs.
+
+        Retorno:
+        - np.ndarray: Um valor por conteúdo, com o valor de desconhecido (-1 ou NaN) para IDs não registrados.
+        """
+        _, dtype, missing, _ = ATTRIBUTES[name]
+        array = getattr(self, name)
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        known = content_ids < array.shape[0]
+        values = np.full(content_ids.shape[0], missing, dtype=dtype)
+        values[known] = array[content_ids[known]]
+        return values
+
+    def _reserve(self, size: int):
+        """Garante espaço para ContentIDs até `size - 1`, dobrando a capacidade."""
+        current = self.categories.shape[0]
+        if size <= current:
+            return
+        capacity = max(size, 2 * current, 1024)
+        for name, (_, dtype, missing, _) in ATTRIBUTES.items():
+            grown = np.full(capacity, missing, dtype=dtype)
+            grown[:current] = getattr(self, name)
+            setattr(self, name, grown)
@@ -0,0 +1,179 @@
+"""
+Module: content_comments
+------------------------
+
+Índice dos comentários de cada conteúdo (LIVECOMMENT, VIDEOCOMMENT e SHORTCOMMENT), para sortear alvos de
+respostas.
+
+O gerador de comentários precisa, a cada tick, de um comentário aleatório de cada conteúdo assistido. Sem
+índice, isso exige juntar as sessões ativas com todo o histórico de comentários, embaralhar o resultado e
+remover duplicatas. Aqui os CommentIDs ficam agrupados por ContentID em um único array (`pool`), em blocos
+contíguos: o conteúdo `c` ocupa `pool[starts[c]:starts[c] + counts[c]]`, no formato CSR. Cada bloco tem folga
+(`capacities`); quando enche, é copiado para o fim do array com o dobro da capacidade, de modo que incluir
+os comentários de um tick custa O(comentários novos) amortizado. O espaço dos blocos abandonados é
+recuperado por uma compactação quando passa da metade do array.
+
+Sortear um comentário para K conteúdos é uma indexação vetorizada, O(K): `pool[starts + ⌊u · counts⌋]`.
+Dentro de cada bloco os comentários ficam na ordem de inclusão, então um índice reconstruído a partir do
+histórico (`from_tables`) sorteia exatamente os mesmos comentários que o mantido tick a tick.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tabelas de comentários por tipo de conteúdo (CommentID, ContentID)
+COMMENT_TABLES = ("LIVECOMMENT", "VIDEOCOMMENT", "SHORTCOMMENT")
+
+# Capacidade mínima do bloco de um conteúdo
+MIN_BLOCK = 4
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenação de `arange(start, start + length)` para cada par, sem laço em Python."""
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total, dtype=np.int64)
+
+
+class ContentCommentIndex:
+    """
+    CommentIDs agrupados por ContentID (CSR com folga por bloco), com inclusão incremental e sorteio O(K).
+    """
+
+    def __init__(self):
+        # Denso por ContentID: início do bloco, comentários e capacidade
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._capacities = np.zeros(0, dtype=np.int64)
+        self._pool = np.zeros(0, dtype=np.int32)
+        self._used = 0
+        self._allocated = 0
+        self._size = 0
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'ContentCommentIndex':
+        """
+        Reconstrói o índice a partir do histórico (por exemplo, ao retomar um checkpoint).
+
+        Parâmetros:
+        - tables (dict): Tabelas com LIVECOMMENT, VIDEOCOMMENT e SHORTCOMMENT (as ausentes são ignoradas).
+        """
+        index = cls()
+        index.update(tables)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def update(self, new: dict):
+        """Inclui as linhas novas de LIVECOMMENT, VIDEOCOMMENT e SHORTCOMMENT de um tick."""
+        for name in COMMENT_TABLES:
+            if name in new:
+                self.add(new[name])
+
+    def add(self, content_comments: pd.DataFrame):
+        """
+        Inclui comentários novos no fim do bloco dos seus conteúdos.
+
+        Parâmetros:
+        - content_comments (pd.DataFrame): Linhas com ContentID e CommentID.
+        """
+        content_ids = content_comments["ContentID"].to_numpy(dtype=np.int64)
+        if content_ids.shape[0] == 0:
+            return
+        order = np.argsort(content_ids, kind='stable')
+        content_ids = content_ids[order]
+        comment_ids = content_comments["CommentID"].to_numpy(dtype=np.int32)[order]
+        contents, first, added = np.unique(content_ids, return_index=True, return_counts=True)
+        self._reserve_contents(int(contents[-1]) + 1)
+
+        counts = self._counts[contents]
+        needed = counts + added
+        full = needed > self._capacities[contents]
+        if full.any():
+            self._relocate(contents[full], needed[full])
+
+        # Posição de cada comentário novo: fim atual do bloco + ordem dentro do lote
+        ranks = np.arange(content_ids.shape[0], dtype=np.int64) - np.repeat(first, added)
+        self._pool[np.repeat(self._starts[contents] + counts, added) + ranks] = comment_ids
+        self._counts[contents] = needed
+        self._size += content_ids.shape[0]
+
+        if self._used > 2 * self._allocated:
+            self._compact()
+
+    def counts(self, content_ids) -> np.ndarray:
+        """Número de comentários de cada conteúdo (0 para conteúdos desconhecidos)."""
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        known = content_ids < self._counts.shape[0]
+        counts = np.zeros(content_ids.shape[0], dtype=np.int64)
+        counts[known] = self._counts[content_ids[known]]
+        return counts
+
+    def comments(self, content_id: int) -> np.ndarray:
+        """CommentIDs de um conteúdo, na ordem de inclusão."""
+        if content_id >= self._counts.shape[0]:
+            return np.empty(0, dtype=np.int32)
+        start = self._starts[content_id]
+        return self._pool[start:start + self._counts[content_id]].copy()
+
+    def sample(self, content_ids, rng: np.random.Generator) -> np.ndarray:
+        """
+        Sorteia um comentário de cada conteúdo, uniformemente entre os seus comentários.
+
+        Parâmetros:
+        - content_ids (np.ndarray): ContentIDs (normalmente distintos).
+        - rng (np.random.Generator): Gerador de números aleatórios (um sorteio por conteúdo).
+
+        Retorno:
+        - np.ndarray: Um CommentID (int32) por conteúdo, ou -1 para conteúdos sem comentários.
+        """
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        counts = self.counts(content_ids)
+        offsets = (rng.random(content_ids.shape[0]) * counts).astype(np.int64)
+        has_comments = counts > 0
+        chosen = np.full(content_ids.shape[0], -1, dtype=np.int32)
+        chosen[has_comments] = self._pool[self._starts[content_ids[has_comments]] + offsets[has_comments]]
+        return chosen
+
+    def _reserve_contents(self, size: int):
+        """Garante espaço para ContentIDs até `size - 1`, dobrando a capacidade."""
+        current = self._counts.shape[0]
+        if size <= current:
+            return
+        grow = max(size, 2 * current, 1024) - current
+        for name in ('_starts', '_counts', '_capacities'):
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros(grow, dtype=np.int64))))
+
+    def _reserve_pool(self, size: int):
+        """Garante ao menos `size` posições no array de comentários, dobrando a capacidade."""
+        current = self._pool.shape[0]
+        if size <= current:
+            return
+        grown = np.zeros(max(size, 2 * current, 1024), dtype=np.int32)
+        grown[:self._used] = self._pool[:self._used]
+        self._pool = grown
+
+    def _relocate(self, contents: np.ndarray, needed: np.ndarray):
+        """Move os blocos cheios para o fim do array, com capacidade dobrada (ao menos `needed`)."""
+        capacities = np.maximum(np.maximum(2 * self._capacities[contents], needed), MIN_BLOCK)
+        starts = self._used + np.cumsum(capacities) - capacities
+        self._reserve_pool(self._used + int(capacities.sum()))
+        lengths = self._counts[contents]
+        self._pool[_ranges(starts, lengths)] = self._pool[_ranges(self._starts[contents], lengths)]
+        self._allocated += int(capacities.sum() - self._capacities[contents].sum())
+        self._starts[contents] = starts
+        self._capacities[contents] = capacities
+        self._used += int(capacities.sum())
+
+    def _compact(self):
+        """Descarta o espaço dos blocos abandonados, mantendo a folga dos blocos atuais."""
+        contents = np.flatnonzero(self._capacities)
+        capacities = self._capacities[contents]
+        starts = np.cumsum(capacities) - capacities
+        lengths = self._counts[contents]
+        pool = np.zeros(max(int(capacities.sum()), 1024), dtype=np.int32)
+        pool[_ranges(starts, lengths)] = self._pool[_ranges(self._starts[contents], lengths)]
+        self._pool = pool
+        self._starts[contents] = starts
+        self._used = self._allocated
@@ -0,0 +1,87 @@
+"""
+Module: content_types
+---------------------
+
+Registro do tipo de cada conteúdo (vídeo, short ou live), indexado por ContentID.
+
+Os ContentIDs são inteiros densos a partir de 0, então o tipo de todos os conteúdos cabe em um único array
+int8 (`types[ContentID]`, com os códigos do vocabulário `CONTENT_TYPE` e -1 para IDs desconhecidos). O
+registro é estendido por `create_random_content` à medida que os conteúdos são criados, e descobrir o tipo
+de K conteúdos é uma indexação O(K), sem montar um índice das tabelas LIVE, VIDEO e SHORT a cada tick (que,
+por isso, não precisam mais ficar em memória).
+"""
+
+import numpy as np
+
+from src.initialization.vocabularies import CONTENT_TYPE
+
+# Códigos dos tipos de conteúdo no vocabulário global
+VIDEO_CODE = CONTENT_TYPE.code('Video')
+SHORT_CODE = CONTENT_TYPE.code('Short')
+LIVE_CODE = CONTENT_TYPE.code('Live')
+
+# Tabela de cada tipo de conteúdo -> código do tipo
+TYPE_TABLES = {"VIDEO": VIDEO_CODE, "SHORT": SHORT_CODE, "LIVE": LIVE_CODE}
+
+
+class ContentTypeRegistry:
+    """
+    Tipo de cada conteúdo em um array int8 denso por ContentID (-1 = desconhecido).
+    """
+
+    def __init__(self):
+        self._types = np.full(0, -1, dtype=np.int8)
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'ContentTypeRegistry':
+        """
+        Reconstrói o registro a partir das tabelas LIVE, VIDEO e SHORT (por exemplo, lidas do disco).
+
+        Parâmetros:
+        - tables (dict): Tabelas com ContentID; as ausentes são ignoradas.
+        """
+        registry = cls()
+        registry.update(tables)
+        return registry
+
+    def __len__(self) -> int:
+        """Número de conteúdos registrados."""
+        return int((self._types >= 0).sum())
+
+    def update(self, new: dict):
+        """Registra os conteúdos novos das tabelas LIVE, VIDEO e SHORT de um tick."""
+        for name, code in TYPE_TABLES.items():
+            if name in new:
+                content_ids = new[name]["ContentID"].to_numpy(dtype=np.int64)
+                self.add(content_ids, np.full(content_ids.shape[0], code, dtype=np.int8))
+
+    def add(self, content_ids, type_codes):
+        """
+        Registra o tipo de conteúdos novos.
+
+        Parâmetros:
+        - content_ids (np.ndarray): ContentIDs.
+        - type_codes (np.ndarray): Códigos de `CONTENT_TYPE` de cada conteúdo.
+        """
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        if content_ids.shape[0] == 0:
+            return
+        size = int(content_ids.max()) + 1
+        if size > self._types.shape[0]:
+            grown = np.full(max(size, 2 * self._types.shape[0], 1024), -1, dtype=np.int8)
+            grown[:self._types.shape[0]] = self._types
+            self._types = grown
+        self._types[content_ids] = type_codes
+
+    def lookup(self, content_ids) -> np.ndarray:
+        """
+        Código do tipo de cada conteúdo.
+
+        Retorno:
+        - np.ndarray: Códigos de `CONTENT_TYPE` (int8), com -1 para conteúdos desconhecidos.
+        """
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        known = content_ids < self._types.shape[0]
+        types = np.full(content_ids.shape[0], -1, dtype=np.int8)
+        types[known] = self._types[content_ids[known]]
+        return types
@@ -0,0 +1,90 @@
+"""
+Module: interactions
+--------------------
+
+Índice dos pares (usuário, conteúdo) que já têm interação (like ou dislike).
+
+O gerador de interações só cria interações para sessões ativas cujo usuário ainda não curtiu nem descurtiu
+o conteúdo. Sem índice, isso exige juntar UCONTINT com USERINTERACTION e depois as sessões ativas com o
+resultado, e as duas junções percorrem todo o histórico de interações a cada tick. Aqui os pares ficam em um
+array ordenado de chaves `(UserID << 32) | ContentID` (o mesmo formato do histórico de vistos do
+`ProfileStore`), e a pergunta "já interagiu?" para um lote de sessões é uma busca binária vetorizada.
+As interações de cada tick são incluídas de forma incremental, e interações neutras (`UINTType == 0`) não
+entram, como na junção original.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tipo de interação neutra (USERINTERACTION.UINTType), que não impede uma nova interação
+NEUTRAL = 0
+
+
+def _pair_keys(user_ids, content_ids) -> np.ndarray:
+    """Chaves `(UserID << 32) | ContentID`."""
+    return (np.asarray(user_ids, dtype=np.int64) << 32) | np.asarray(content_ids, dtype=np.int64)
+
+
+class InteractionIndex:
+    """
+    Conjunto ordenado dos pares (UserID, ContentID) com interação não neutra.
+    """
+
+    def __init__(self):
+        self._keys = np.empty(0, dtype=np.int64)
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'InteractionIndex':
+        """
+        Reconstrói o índice a partir do histórico (por exemplo, ao retomar um checkpoint).
+
+        Parâmetros:
+        - tables (dict): Tabelas com USERINTERACTION e UCONTINT.
+        """
+        index = cls()
+        index.update(tables)
+        return index
+
+    def __len__(self) -> int:
+        return self._keys.shape[0]
+
+    def update(self, new: dict):
+        """Inclui as linhas novas de USERINTERACTION e UCONTINT de um tick (ignorado se faltar alguma)."""
+        if "USERINTERACTION" in new and "UCONTINT" in new:
+            self.add(new["USERINTERACTION"], new["UCONTINT"])
+
+    def add(self, userinteraction: pd.DataFrame, ucontint: pd.DataFrame):
+        """
+        Inclui interações novas, ligando USERINTERACTION e UCONTINT pelo UINTID (linhas de UCONTINT sem
+        interação correspondente não têm usuário e são ignoradas).
+        """
+        positions = pd.Index(userinteraction["UINTID"]).get_indexer(ucontint["UINTID"])
+        found = np.flatnonzero(positions >= 0)
+        types = userinteraction["UINTType"].to_numpy(dtype=np.int64)[positions[found]]
+        keep = found[types != NEUTRAL]
+        keys = np.unique(_pair_keys(
+            userinteraction["UserID"].to_numpy(dtype=np.int64)[positions[keep]],
+            ucontint["ContentID"].to_numpy(dtype=np.int64)[keep]
+        ))
+        keys = keys[~self._contains_keys(keys)]
+        if keys.shape[0]:
+            self._keys = np.insert(self._keys, np.searchsorted(self._keys, keys), keys)
+
+    def contains(self, user_ids, content_ids) -> np.ndarray:
+        """
+        Indica, para cada par, se o usuário já tem interação não neutra com o conteúdo.
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários.
+        - content_ids (np.ndarray): IDs dos conteúdos (mesmo tamanho de `user_ids`).
+
+        Retorno:
+        - np.ndarray: Máscara booleana.
+        """
+        return self._contains_keys(_pair_keys(user_ids, content_ids))
+
+    def _contains_keys(self, keys: np.ndarray) -> np.ndarray:
+        if self._keys.shape[0] == 0:
+            return np.zeros(keys.shape[0], dtype=bool)
+        positions = np.minimum(np.searchsorted(self._keys, keys), self._keys.shape[0] - 1)
+        return self._keys[positions] == keys
@@ -0,0 +1,415 @@
+"""
+Module: schema
+--------------
+
+Registro central dos esquemas das tabelas da simulação: para cada tabela de `TABLE_PATHS`, a ordem das colunas
+e o dtype compacto de cada uma.
+
+Os arquivos vazios criados por `initialize_tables`, os DataFrames devolvidos pelos geradores e os appends do
+`TableStore` passam todos por este registro. Assim uma coluna tem o mesmo dtype do primeiro ao último tick e
+os appends nunca caem em arrays de objetos.
+
+Convenções:
+- IDs são `int32`; hashes (URLs, títulos, miniaturas) são `uint64`.
+- Datas e horários da simulação são `float64` (segundos desde o início), nunca categóricos.
+- Categorias de conteúdo e tags são `int8`.
+- Textos de baixa cardinalidade (idioma, status, país, ocupação) são categóricos sobre um vocabulário global
+  (`src.initialization.vocabularies`): a coluna registra o `Vocabulary`, e não a string 'category'.
+- Textos livres (nomes de canal, descrições) e combinações de idiomas ("pt,en,es") continuam `object`.
+
+Colunas virtuais (`VIRTUAL_COLUMNS`) fazem parte do esquema lógico, mas não são guardadas: são cópias do hash do
+conteúdo (URL, título, miniatura, descrição e corpos de VIDEO/LIVE/SHORT). `conform` as descarta, de modo que o
+`TableStore` e os arquivos Parquet só guardam o valor primário (`CONTENT.ContentURL`), e `materialize` as
+recalcula na leitura ou na exportação.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.initialization.vocabularies import (
+    Vocabulary, GENDER, CONTENT_STATUS, RATING, CONTENT_TYPE, SHORT_BODY,
+    ISO3, LANGUAGE, OCCUPATION
+)
+
+ID = 'int32'
+HASH = 'uint64'
+DATETIME = 'float64'
+TEXT = 'object'
+
+SCHEMAS = {
+    # DATA_PATH
+    "users": {
+        'user_id': ID,
+        'user_name': 'int16',
+        'user_bed_time': 'float16',
+        'user_wake_time': 'float16',
+        'user_lunch_time': 'float16',
+        'user_dinner_time': 'float16',
+        'user_work_time': 'int8',
+        'user_free_from_work_time': 'int8',
+        'user_work_days': 'int8',
+        'user_age': 'int8',
+        'user_gender': GENDER,
+        'user_location': ISO3,
+        'user_language': TEXT,
+        'user_ocupation': OCCUPATION,
+        'user_education': 'int8',
+        'user_video_watching_time': 'float16',
+        'user_video_retention_time': 'float16',
+        'user_channel_id': 'float32',
+        'user_admin_channel_id': 'bool',
+    },
+    "channels": {
+        'channel_id': ID,
+        'channel_name': TEXT,
+        'channel_creation_date': DATETIME,
+        'channel_description': TEXT,
+        'channel_language': TEXT,
+        'channel_location': ISO3,
+        'channel_category': 'int8',
+    },
+    "content": {
+        'content_id': ID,
+        'channel_id': ID,
+        'content_title': HASH,
+        'content_description': HASH,
+        'content_status': CONTENT_STATUS,
+        'content_category': 'int8',
+        'content_language': LANGUAGE,
+        'content_duration': 'float32',
+        'content_creation_date': DATETIME,
+        'content_view_count': 'int32',
+        'content_like_count': 'int32',
+        'content_dislike_count': 'int32',
+        'content_comment_count': 'int32',
+        'content_ind_rating': RATING,
+        'content_type': CONTENT_TYPE,
+        'content_is_live': 'bool',
+        'content_comments': 'bool',
+    },
+    "comments": {
+        'content_id': ID,
+        'comment_og_id': ID,
+        'comment_id': ID,
+        'comment_text': TEXT,
+        'comment_creation_date': DATETIME,
+        'comment_author': ID,
+        'comment_like_count': 'int32',
+        'comment_dislike_count': 'int32',
+        'comment_reply_count': 'int32',
+        'comment_replies': TEXT,
+    },
+
+    # TABLES_PATH
+    "USER": {
+        'UserID': ID,
+        'UserName': 'int16',
+        'UserEmail': 'bool',
+        'UserPassword': 'bool',
+        'UserPhoto': 'bool',
+    },
+    "CHANNEL": {
+        'ChannelID': ID,
+        'ChannelURL': ID,
+        'CHCreationDate': DATETIME,
+        'CHName': TEXT,
+        'CHDesc': TEXT,
+        'CHWelcomeVID': 'bool',
+        'CHBanner': 'bool',
+        'UserID': ID,
+    },
+    "UADMINCH": {
+        'UserID': ID,
+        'ChannelID': ID,
+    },
+    "UINTERESTCH": {
+        'UisSubToCH': 'bool',
+        'UMemberLevelCH': 'int8',
+        'UisNotifiedByCH': 'bool',
+        'UserID': ID,
+        'ChannelID': ID,
+    },
+    "CONTENT": {
+        'ContentID': ID,
+        'ContentURL': HASH,
+        'CONTTitle': HASH,
+        'CONTPubDateTime': DATETIME,
+        'CONTStatus': CONTENT_STATUS,
+        'CONTCategory': 'int8',
+        'CONTLanguage': LANGUAGE,
+        'CONTThumb': HASH,
+        'CONTDesc': HASH,
+        'CONTCaptionLanguage': LANGUAGE,
+        'CONTIndRating': RATING,
+        'ChannelID': ID,
+    },
+    "UWATCHINGCONT": {
+        'UWatchDurationCONT': 'int16',
+        'UWatchCONTDateTime': DATETIME,
+        'UIsWatchingCONTNow': 'bool',
+        'UWATCHCONTID': ID,
+        'UserID': ID,
+        'ContentID': ID,
+    },
+    "LIVE": {
+        'LIVEBody': 'int64',
+        'ContentID': ID,
+    },
+    "VIDEO": {
+        'VIDEOBody': 'int64',
+        'ContentID': ID,
+    },
+    "SHORT": {
+        'SHMusicLink': 'int64',
+        'SHORTBody': SHORT_BODY,
+        'ContentID': ID,
+    },
+    "COMMENT": {
+        'CommentID': ID,
+        'COMDateTime': DATETIME,
+        'COMisEdited': 'bool',
+        'COMBody': 'bool',
+        'UserID': ID,
+    },
+    "LIVECOMMENT": {
+        'CommentID': ID,
+        'ContentID': ID,
+    },
+    "COMMENTREPLY": {
+        'CommentID': ID,
+        'COMisRepByCOMCommentID': ID,
+    },
+    "VIDEOCOMMENT": {
+        'CommentID': ID,
+        'ContentID': ID,
+    },
+    "POLLCOMMENT": {
+        'CommentID': ID,
+        'POLLID': ID,
+    },
+    "SHORTCOMMENT": {
+        'CommentID': ID,
+        'ContentID': ID,
+    },
+    "POLL": {
+        'POLLID': ID,
+        'POLLPubDateTime': DATETIME,
+        'POLLURL': HASH,
+        'POLLBody': TEXT,
+        'ChannelID': ID,
+    },
+    "PLAYLIST": {
+        'PlayID': ID,
+        'PlayURL': HASH,
+        'PLAYTitle': TEXT,
+        'PLAYDesc': TEXT,
+        'PLAYStatus': CONTENT_STATUS,
+        'PLAYThumb': HASH,
+        'ChannelID': ID,
+    },
+    "PLAYLISTCONTENT": {
+        'CONTAddDateTimePL': DATETIME,
+        'ContentID': ID,
+        'PlayID': ID,
+    },
+    "USERINTERACTION": {
+        'UINTType': 'int8',
+        'UINTID': ID,
+        'UserID': ID,
+    },
+    "UCONTINT": {
+        'UINTID': ID,
+        'ContentID': ID,
+    },
+    "UCOMINT": {
+        'UINTID': ID,
+        'CommentID': ID,
+    },
+    "UPLAYINT": {
+        'UINTID': ID,
+        'PlayID': ID,
+    },
+    "NOTIFICATION": {
+        'NotificationID': ID,
+        'NOTBody': TEXT,
+        'ChannelID': ID,
+    },
+    "USERNOTIFIED": {
+        'NOTSentDateTime': DATETIME,
+        'UserID': ID,
+        'NotificationID': ID,
+    },
+    "CHANNEL_CHExtLink": {
+        'CHExtLink': TEXT,
+        'ChannelID': ID,
+    },
+    "CONTENT_CONTTag": {
+        'CONTTag': 'int8',
+        'ContentID': ID,
+    },
+    "PLAYLIST_PLAYTag": {
+        'PLAYTag': 'int8',
+        'PlayID': ID,
+    },
+}
+
+
+class VirtualColumn:
+    """
+    Coluna calculada a partir de uma coluna guardada, da mesma tabela ou de outra.
+
+    Parâmetros:
+    - source_column (str): Coluna com o valor primário.
+    - source_table (str, opcional): Tabela da coluna primária; por padrão, a própria tabela.
+    - key (str, opcional): Coluna desta tabela usada para localizar a linha em `source_table`.
+    - source_key (str, opcional): Coluna de `source_table` correspondente a `key` (por padrão, `key`).
+    """
+
+    def __init__(self, source_column: str, source_table: str = None, key: str = None, source_key: str = None):
+        self.source_column = source_column
+        self.source_table = source_table
+        self.key = key
+        self.source_key = source_key or key
+
+    def compute(self, df: pd.DataFrame, tables: dict) -> np.ndarray:
+        """
+        Calcula a coluna para as linhas de `df`.
+
+        Parâmetros:
+        - df (pd.DataFrame): Linhas guardadas da tabela.
+        - tables (dict): Tabelas disponíveis, para colunas que vêm de outra tabela.
+
+        Retorno:
+        - np.ndarray: Valores da coluna. Levanta ValueError se alguma chave não existir em `source_table`.
+        """
+        if self.source_table is None:
+            return df[self.source_column].to_numpy()
+        source = tables[self.source_table]
+        positions = pd.Index(source[self.source_key]).get_indexer(df[self.key])
+        if (positions < 0).any():
+            raise ValueError(
+                f"Chaves de '{self.key}' sem linha correspondente em '{self.source_table}'."
+            )
+        return source[self.source_column].to_numpy()[positions]
+
+
+# Hash do conteúdo, guardado uma única vez em CONTENT.ContentURL
+_CONTENT_HASH = VirtualColumn('ContentURL', 'CONTENT', 'ContentID')
+
+VIRTUAL_COLUMNS = {
+    "CONTENT": {
+        'CONTTitle': VirtualColumn('ContentURL'),
+        'CONTThumb': VirtualColumn('ContentURL'),
+        'CONTDesc': VirtualColumn('ContentURL'),
+    },
+    "content": {
+        'content_title': VirtualColumn('ContentURL', 'CONTENT', 'content_id', 'ContentID'),
+        'content_description': VirtualColumn('ContentURL', 'CONTENT', 'content_id', 'ContentID'),
+    },
+    "VIDEO": {'VIDEOBody': _CONTENT_HASH},
+    "LIVE": {'LIVEBody': _CONTENT_HASH},
+    "SHORT": {'SHMusicLink': _CONTENT_HASH},
+}
+
+
+def stored_schema(name: str, schemas: dict = None) -> dict:
+    """Esquema da tabela sem as colunas virtuais (o que de fato vai para a memória e para o disco)."""
+    virtual = VIRTUAL_COLUMNS.get(name, {})
+    return {
+        column: dtype
+        for column, dtype in (SCHEMAS if schemas is None else schemas)[name].items()
+        if column not in virtual
+    }
+
+
+def materialize(name: str, df: pd.DataFrame, tables: dict = None) -> pd.DataFrame:
+    """
+    Recalcula as colunas virtuais de uma tabela guardada, devolvendo o esquema lógico completo.
+
+    Parâmetros:
+    - name (str): Nome lógico da tabela.
+    - df (pd.DataFrame): Linhas guardadas (sem as colunas virtuais).
+    - tables (dict, opcional): Outras tabelas guardadas (por exemplo, {'CONTENT': ...}) usadas nas colunas
+      que vêm de outra tabela.
+
+    Retorno:
+    - pd.DataFrame: A tabela com todas as colunas de `SCHEMAS[name]`, na ordem registrada.
+    """
+    virtual = VIRTUAL_COLUMNS.get(name)
+    if not virtual:
+        return df
+    schema = SCHEMAS[name]
+    computed = {
+        column: pd.Series(
+            column_def.compute(df, tables or {}).astype(schema[column], copy=False), index=df.index
+        )
+        for column, column_def in virtual.items()
+    }
+    return df.assign(**computed)[list(schema)]
+
+
+def empty_frame(name: str) -> pd.DataFrame:
+    """
+    Cria um DataFrame vazio com as colunas guardadas e os dtypes registrados para a tabela.
+
+    Parâmetros:
+    - name (str): Nome lógico da tabela (chave de `TABLE_PATHS`).
+
+    Retorno:
+    - pd.DataFrame: Tabela sem linhas, já tipada.
+    """
+    return pd.DataFrame({
+        column: _empty_column(dtype)
+        for column, dtype in stored_schema(name).items()
+    })
+
+
+def conform(name: str, df: pd.DataFrame, schemas: dict = None) -> pd.DataFrame:
+    """
+    Coloca um DataFrame no esquema registrado: ordem das colunas e dtypes. Colunas virtuais são descartadas.
+
+    Só as colunas com dtype diferente do registrado são convertidas; as demais são repassadas sem cópia.
+    Colunas de vocabulário são recodificadas para os códigos do vocabulário global da coluna.
+
+    Parâmetros:
+    - name (str): Nome lógico da tabela.
+    - df (pd.DataFrame): Linhas da tabela.
+    - schemas (dict, opcional): Registro a usar no lugar de `SCHEMAS`.
+
+    Retorno:
+    - pd.DataFrame: As mesmas linhas, com as colunas guardadas na ordem e nos dtypes do registro.
+      Levanta ValueError se faltar alguma coluna guardada.
+    """
+    schema = stored_schema(name, schemas)
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        raise ValueError(f"A tabela '{name}' não tem as colunas {missing}.")
+    df = df[list(schema)]
+    casts = {
+        column: dtype for column, dtype in schema.items()
+        if not isinstance(dtype, Vocabulary) and df[column].dtype != dtype
+    }
+    if casts:
+        df = df.astype(casts)
+    encoded = {
+        column: pd.Series(dtype.categorical(dtype.encode(df[column])), index=df.index)
+        for column, dtype in schema.items()
+        if isinstance(dtype, Vocabulary) and df[column].dtype != dtype.dtype
+    }
+    if encoded:
+        df = df.assign(**encoded)
+    return df
+
+
+def _empty_column(dtype) -> pd.Series:
+    if isinstance(dtype, Vocabulary):
+        return pd.Series(dtype.categorical(np.empty(0, dtype=dtype.code_dtype)))
+    return pd.Series(dtype=dtype)
+
+
+def conform_all(tables: dict) -> dict:
+    """Aplica `conform` a um dicionário {nome: DataFrame}; tabelas sem esquema registrado são mantidas."""
+    return {
+        name: conform(name, df) if name in SCHEMAS else df
+        for name, df in tables.items()
+    }
@@ -0,0 +1,143 @@
+"""
+Module: vocabularies
+--------------------
+
+Vocabulários globais e estáveis das colunas categóricas da simulação.
+
+Um `pd.Categorical` criado a cada tick tem o seu próprio conjunto de categorias, e juntar ticks obriga o pandas a
+recodificar tudo (ou a cair em arrays de objetos). Aqui cada domínio (idiomas, países ISO3, ocupações, status,
+classificações, tipos de conteúdo...) tem um único vocabulário por processo, só de acréscimo: o código de um
+valor nunca muda depois de atribuído. Os geradores emitem códigos inteiros contra esses vocabulários, e o
+`TableStore` guarda apenas os códigos (1 a 4 bytes por linha), anexados como inteiros comuns.
+
+Vocabulários de domínio fechado (status, classificação, tipo, gênero) são fixos desde a importação. Os idiomas
+são semeados aqui, uma única vez, a partir de `country_data_cleaned.parquet` (em ordem alfabética), de modo que
+os seus códigos não dependem da ordem em que os geradores são importados. Países e ocupações são semeados pelo
+gerador de usuários ao carregar os dados, em ordem determinística. Todos crescem se aparecer um valor novo.
+
+As combinações de idiomas dos usuários e canais ("pt,en,es") não têm vocabulário: são abertas (crescem com a
+população) e ficam como texto comum.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src import DATA_PATH
+
+
+class Vocabulary:
+    """
+    Vocabulário só de acréscimo: valor <-> código inteiro.
+
+    Parâmetros:
+    - name (str): Nome do domínio (usado em mensagens).
+    - values (iterable): Valores iniciais, na ordem dos códigos.
+    - code_dtype (numpy dtype): Tipo dos códigos guardados pelo `TableStore`.
+    """
+
+    def __init__(self, name: str, values=(), code_dtype=np.int16):
+        self.name = name
+        self.code_dtype = np.dtype(code_dtype)
+        self._values = []
+        self._codes = {}
+        self._lock = threading.Lock()
+        self._dtype = None
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value) -> bool:
+        return value in self._codes
+
+    @property
+    def values(self) -> np.ndarray:
+        """Valores do vocabulário, na ordem dos códigos."""
+        return np.array(self._values, dtype=object)
+
+    @property
+    def dtype(self) -> pd.CategoricalDtype:
+        """`CategoricalDtype` com o vocabulário atual (refeito apenas quando o vocabulário cresce)."""
+        dtype = self._dtype
+        if dtype is None or len(dtype.categories) != len(self._values):
+            dtype = pd.CategoricalDtype(self._values)
+            self._dtype = dtype
+        return dtype
+
+    def extend(self, values):
+        """Acrescenta valores ainda ausentes ao fim do vocabulário, na ordem dada."""
+        self._lookup(values)
+
+    def code(self, value) -> int:
+        """Código de um único valor (acrescentando-o se necessário)."""
+        return int(self._lookup([value])[0])
+
+    def encode(self, values) -> np.ndarray:
+        """
+        Converte valores (array, Series ou Categorical) em códigos do vocabulário.
+
+        Só os valores distintos passam pelo dicionário; o restante é uma indexação vetorizada.
+        Valores ausentes viram -1.
+
+        Retorno:
+        - np.ndarray: Códigos com o dtype `code_dtype`.
+        """
+        if isinstance(values, (pd.Series, pd.Index)):
+            values = values.array
+        if isinstance(values, pd.Categorical):
+            codes, uniques = values.codes, values.categories
+        else:
+            values = np.asarray(values)
+            if values.dtype.kind == 'S':
+                values = np.char.decode(values, 'utf-8')
+            codes, uniques = pd.factorize(values)
+        lookup = np.append(self._lookup(uniques), self.code_dtype.type(-1))
+        return lookup[codes]
+
+    def categorical(self, codes) -> pd.Categorical:
+        """Monta um `pd.Categorical` a partir de códigos deste vocabulário, sem recodificar."""
+        return pd.Categorical.from_codes(np.asarray(codes), dtype=self.dtype)
+
+    def _lookup(self, uniques) -> np.ndarray:
+        out = np.empty(len(uniques), dtype=self.code_dtype)
+        with self._lock:
+            for i, value in enumerate(uniques):
+                if isinstance(value, bytes):
+                    value = value.decode('utf-8')
+                elif isinstance(value, np.generic):
+                    value = value.item()
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self._values)
+                    if code > np.iinfo(self.code_dtype).max:
+                        raise ValueError(f"O vocabulário '{self.name}' excedeu o limite de {self.code_dtype}.")
+                    self._codes[value] = code
+                    self._values.append(value)
+                out[i] = code
+        return out
+
+
+# Domínios fechados
+GENDER = Vocabulary('gender', ['M', 'F'], np.int8)
+CONTENT_STATUS = Vocabulary('content_status', ['Public', 'Private', 'Unlisted'], np.int8)
+RATING = Vocabulary('rating', ['General Audience', 'Kids', 'Default', 'Age-Restricted'], np.int8)
+CONTENT_TYPE = Vocabulary('content_type', ['Video', 'Short', 'Live'], np.int8)
+SHORT_BODY = Vocabulary('short_body', ['Default short body'], np.int8)
+
+
+def _country_languages() -> np.ndarray:
+    """Idiomas distintos dos países (coluna `Languages`), ou vazio se os dados ainda não foram gerados."""
+    path = os.path.join(DATA_PATH, 'behavior_generated', 'country_data_cleaned.parquet')
+    if not os.path.exists(path):
+        return np.empty(0, dtype=object)
+    country_data = pd.read_parquet(path, columns=['Languages'])
+    return np.unique(np.concatenate(country_data['Languages'].str.split(',').to_list()))
+
+
+# Domínios semeados a partir dos dados de entrada
+ISO3 = Vocabulary('iso3', code_dtype=np.int16)
+LANGUAGE = Vocabulary('language', _country_languages(), np.int16)
+OCCUPATION = Vocabulary('occupation', code_dtype=np.int16)
@@ -0,0 +1,182 @@
+"""
+Module: checkpoint
+------------------
+
+Checkpoints periódicos da simulação, para que execuções longas possam ser retomadas exatamente de onde pararam.
+
+Um checkpoint registra tudo o que o laço de `iterate` precisa para continuar de forma bit a bit idêntica:
+- o próximo tick a executar (que também alimenta o decaimento `np.exp(-decay_rate * i)`);
+- o relógio da simulação (`current_datetime`) e o último dia impresso;
+- o estado do bit generator do RNG da simulação;
+- o número de linhas de cada tabela já persistidas no disco (high-water marks);
+- os parâmetros da execução (`num_iterations`, `time_between_checks`).
+
+O arquivo é JSON e é escrito de forma atômica (arquivo temporário + `fsync` + rename), de modo que uma
+queda durante a gravação preserva o checkpoint anterior. Estados grandes em arrays (as tendências de
+popularidade) vão para um `.npz` do próprio tick, ao lado do JSON, gravado da mesma forma e antes dele;
+`pack_arrays`/`unpack_arrays` guardam vários estados no mesmo arquivo.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from src import DATA_PATH
+
+CHECKPOINT_PATH = os.path.join(DATA_PATH, 'checkpoint.json')
+
+
+def arrays_path(path: str, tick: int) -> str:
+    """Caminho do arquivo de arrays que acompanha o checkpoint de um tick."""
+    return f'{path}.{int(tick)}.npz'
+
+
+def save_checkpoint(path: str, state: dict, arrays: dict = None):
+    """
+    Grava o estado da simulação de forma atômica.
+
+    Os arrays vão para um arquivo próprio do tick, gravado antes do JSON; só depois que o JSON novo está no
+    lugar os arrays de checkpoints anteriores são apagados. Assim, o JSON sempre aponta para arrays completos.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo de checkpoint.
+    - state (dict): Estado serializável em JSON (ver `simulation_state`).
+    - arrays (dict, opcional): Nome -> array, para estados grandes demais para o JSON.
+    """
+    if arrays is not None:
+        target = arrays_path(path, state['tick'])
+        tmp_path = target + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _remove_arrays(path, keep=arrays_path(path, state['tick']) if arrays is not None else None)
+
+
+def load_checkpoint(path: str) -> dict:
+    """
+    Lê um checkpoint salvo por `save_checkpoint`.
+
+    Retorno:
+    - dict: Estado salvo, ou None se não houver checkpoint no caminho.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_arrays(path: str, tick: int) -> dict:
+    """
+    Lê os arrays gravados junto com o checkpoint de um tick.
+
+    Retorno:
+    - dict: Nome -> array, ou None se o checkpoint não tiver arrays.
+    """
+    target = arrays_path(path, tick)
+    if not os.path.exists(target):
+        return None
+    with np.load(target) as data:
+        return {name: data[name] for name in data.files}
+
+
+def pack_arrays(states: dict) -> dict:
+    """Junta vários estados em arrays (nome -> estado) em um único dicionário para `save_checkpoint`."""
+    return {f'{name}.{key}': value for name, state in states.items() for key, value in state.items()}
+
+
+def unpack_arrays(arrays: dict, name: str) -> dict:
+    """
+    Separa um dos estados juntados por `pack_arrays`.
+
+    Retorno:
+    - dict: Estado salvo com esse nome, ou None se não houver.
+    """
+    if arrays is None:
+        return None
+    prefix = name + '.'
+    state = {key[len(prefix):]: value for key, value in arrays.items() if key.startswith(prefix)}
+    return state or None
+
+
+def _remove_arrays(path: str, keep: str = None):
+    directory, prefix = os.path.split(path)
+    for name in os.listdir(directory or '.'):
+        target = os.path.join(directory, name)
+        if name.startswith(prefix + '.') and name.endswith('.npz') and target != keep:
+            os.remove(target)
+
+
+def remove_checkpoint(path: str):
+    """Remove o checkpoint (usado quando a execução termina com sucesso)."""
+    if os.path.exists(path):
+        os.remove(path)
+    if os.path.isdir(os.path.dirname(path) or '.'):
+        _remove_arrays(path)
+
+
+def _clock_value(value):
+    """
+    Converte um valor do relógio para int ou float do Python, mantendo o tipo original.
+
+    O JSON distingue `300` de `300.0`, então o valor volta do checkpoint com o mesmo tipo. Isso importa
+    porque o relógio entra em texto gerado (por exemplo, o título dos conteúdos), e `str(300)` e
+    `str(300.0)` geram hashes diferentes.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return float(value)
+
+
+def simulation_state(
+    tick: int,
+    num_iterations: int,
+    time_between_checks: float,
+    current_datetime: float,
+    prev_day_number: float,
+    rng: np.random.Generator,
+    table_rows: dict
+) -> dict:
+    """
+    Monta o dicionário de estado de um checkpoint.
+
+    Parâmetros:
+    - tick (int): Próximo tick a ser executado.
+    - num_iterations (int): Total de ticks da execução.
+    - time_between_checks (float): Passo do relógio entre ticks.
+    - current_datetime (float): Relógio da simulação no início do próximo tick.
+    - prev_day_number (float): Último dia impresso no log.
+    - rng (np.random.Generator): RNG da simulação.
+    - table_rows (dict): Linhas persistidas por tabela.
+
+    Os valores do relógio mantêm o tipo (int ou float) com que a simulação foi chamada, para que a
+    retomada gere exatamente os mesmos textos que a execução sem interrupção.
+
+    Retorno:
+    - dict: Estado serializável em JSON.
+    """
+    return {
+        'tick': int(tick),
+        'num_iterations': int(num_iterations),
+        'time_between_checks': _clock_value(time_between_checks),
+        'current_datetime': _clock_value(current_datetime),
+        'prev_day_number': _clock_value(prev_day_number),
+        'rng_state': rng.bit_generator.state,
+        'table_rows': {name: int(rows) for name, rows in table_rows.items()},
+    }
+
+
+def restore_rng(state: dict) -> np.random.Generator:
+    """Recria o RNG da simulação a partir do estado salvo no checkpoint."""
+    bit_generator = getattr(np.random, state['rng_state']['bit_generator'])()
+    bit_generator.state = state['rng_state']
+    return np.random.Generator(bit_generator)
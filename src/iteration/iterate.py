@@ -1,237 +1,507 @@
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src import BASE_PATH, DATA_PATH, TABLES_PATH
 from src.initialization.initialize_tables import initialize_tables, TABLE_PATHS
+from src.initialization.schema import SCHEMAS, VIRTUAL_COLUMNS, materialize
 # Paths to tables
 
-from src.iteration.cython.fast_concat import (
-        concat_int8, concat_int16, concat_int32,
-        concat_int64, concat_float32, concat_float64
-    )
-def clever_concat(arr1, arr2):
-    #return np.concatenate((arr1, arr2), axis=0)
-    if len(arr1) < 2_000_000 or len(arr2) < 2_000_000:
-        return np.concatenate((arr1, arr2), axis=0)
-    if isinstance(arr1, pd.Categorical) or isinstance(arr2, pd.Categorical):
-        return np.concatenate((arr1, arr2), axis=0)
-    match arr1.dtype:
-        case 'int8':
-            print('int8')
-            return concat_int8(arr1, arr2)
-        case 'int16':
-            print('int16')
-            return concat_int16(arr1, arr2)
-        case 'int32':
-            print('int32')
-            return concat_int32(arr1, arr2)
-        case 'int64':
-            print('int64')
-            return concat_int64(arr1, arr2)
-        case 'float32':
-            print('float32')
-            return concat_float32(arr1, arr2)
-        case 'float64':
-            print('float64')
-            return concat_float64(arr1, arr2)
-        case _:
-            return np.concatenate((arr1, arr2), axis=0)
-
-
-def safe_concat(df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
-    if df2.empty:
-        return df1
-    if df1.empty:
-        return df2
-    return fast_concat_same_columns(df1, df2)
-
-GLOBAL_CONCAT_TIME = 0.0
-GLOBAL_DF_TIME = 0.0
+from src.iteration.table_store import TableStore
+from src.iteration.parquet_writer import IncrementalParquetWriter, consolidate_table, count_rows
+from src.iteration.scheduler import Stage, run_stages
+from src.indexes.active_sessions import ActiveSessionIndex
+from src.indexes.content_comments import ContentCommentIndex
+from src.indexes.content_types import ContentTypeRegistry, TYPE_TABLES
+from src.indexes.content_attributes import ContentAttributeStore, ATTRIBUTES
+from src.indexes.interactions import InteractionIndex
+from src.recommendation.profiles import ProfileStore
+from src.recommendation.popularity import PopularityStore
+from src.recommendation.segments import SegmentStore
+from src.recommendation import numba_backend
+from src.iteration.checkpoint import (
+    CHECKPOINT_PATH, save_checkpoint, load_checkpoint, remove_checkpoint,
+    simulation_state, restore_rng, load_arrays, pack_arrays, unpack_arrays
+)
 
-def fast_concat_same_columns(df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
-    """
-    Concatena dois DataFrames com colunas idênticas de forma eficiente,
-    preservando a ordem e os dtypes de cada coluna.
-
-    Assumptions:
-    - df1 e df2 têm as mesmas colunas na mesma ordem.
-    - Os tipos de dados por coluna são compatíveis.
-    """
-    global GLOBAL_CONCAT_TIME, GLOBAL_DF_TIME
-
-    start = time.time()
-    data = {
-        col: clever_concat(df1[col].values, df2[col].values)
-        for col in df1.columns
-    }
-    GLOBAL_CONCAT_TIME += time.time() - start
-    
-    start = time.time()
-    df = pd.DataFrame(data)
-    GLOBAL_DF_TIME += time.time() - start
-    
-    return df
+# Tabelas cujo histórico é lido pelos geradores; as demais só vão para o disco
+# (o tipo de cada conteúdo fica no `ContentTypeRegistry`, então LIVE, VIDEO e SHORT não são mantidas)
+WORKING_SET = {
+    "UWATCHINGCONT",
+    "USERINTERACTION",
+    "UCONTINT",
+    "COMMENT",
+    "LIVECOMMENT",
+    "VIDEOCOMMENT",
+    "SHORTCOMMENT",
+}
 
+# Parâmetros da simulação
+USERS_PER_TICK = 2_000_000
+DECAY_RATE = 0.001
+WATCHING_RATIO = 0.1
+NUM_RECOMMENDATIONS = 3
+COMMENT_RATIO = 0.4
+INTERACT_RATIO = 0.3
 
 def update_uwatching_cont(uwatchingcont, current_date_time):
     uwatchingcont_new = uwatchingcont.copy()
     uwatchingcont_new['UIsWatchingCONTNow'] = current_date_time < (uwatchingcont['UWatchCONTDateTime'] + uwatchingcont['UWatchDurationCONT'])
     return uwatchingcont_new
 
-def load_all_tables(table_paths: dict) -> dict:
+def load_all_tables(table_paths: dict, names: set = None, materialize_virtual: bool = False) -> dict:
     """
     Lê todos os arquivos .parquet definidos no dicionário table_paths.
 
     Parâmetros:
     - table_paths (dict): Dicionário com nomes lógicos como chave e caminhos para arquivos .parquet como valor.
+    - names (set, opcional): Tabelas a carregar por completo; as demais são lidas vazias (apenas o esquema).
+    - materialize_virtual (bool): Recalcula as colunas virtuais (hashes duplicados) para leitura ou exportação.
+      A simulação não precisa delas e as lê sem esse passo.
 
     Retorno:
     - dict: Dicionário com os mesmos nomes como chave e os DataFrames carregados como valor.
     """
-    return {name: pd.read_parquet(path) for name, path in table_paths.items()}
+    loaded = lambda name: names is None or name in names
+    tables = {
+        name: pd.read_parquet(path) if loaded(name)
+        else pq.read_schema(path).empty_table().to_pandas()
+        for name, path in table_paths.items()
+    }
+    if not materialize_virtual:
+        return tables
+
+    # Tabelas de onde vêm os valores primários (CONTENT.ContentURL)
+    sources = {}
+    for name in tables:
+        for column in VIRTUAL_COLUMNS.get(name, {}).values():
+            source = column.source_table
+            if source is None or source in sources:
+                continue
+            if source in tables and loaded(source):
+                sources[source] = tables[source]
+            else:
+                sources[source] = pd.read_parquet(table_paths.get(source, TABLE_PATHS[source]))
+    return {name: materialize(name, df, sources) for name, df in tables.items()}
+
+def _open_tables() -> TableStore:
+    """Carrega o conjunto de trabalho do disco em um TableStore."""
+    tables = load_all_tables(TABLE_PATHS, WORKING_SET)
+    return TableStore(
+        tables,
+        retain=WORKING_SET,
+        initial_rows={name: count_rows(path) for name, path in TABLE_PATHS.items()},
+        schemas=SCHEMAS
+    )
+
+def load_profiles(tables: dict) -> ProfileStore:
+    """
+    Reconstrói os perfis do recomendador a partir do histórico em `tables` e do catálogo no disco
+    (CONTENT e CONTENT_CONTTag não fazem parte do conjunto de trabalho).
+    """
+    catalogue = {
+        "CONTENT": pd.read_parquet(TABLE_PATHS["CONTENT"], columns=["ContentID", "CONTCategory"]),
+        "CONTENT_CONTTag": pd.read_parquet(TABLE_PATHS["CONTENT_CONTTag"], columns=["ContentID", "CONTTag"]),
+    }
+    return ProfileStore.from_tables({**tables, **catalogue})
+
+def load_segments(tables: dict, profiles: ProfileStore) -> SegmentStore:
+    """
+    Reconstrói os perfis por segmento a partir do histórico em `tables` e da tabela `users` no disco.
+    """
+    users = pd.read_parquet(TABLE_PATHS["users"], columns=["user_id", "user_location", "user_language", "user_age"])
+    return SegmentStore.from_tables({**tables, "users": users}, profiles)
 
-def iterate(num_iterations: int, time_between_checks: float, initial_time: float, first_iteration: bool = True):
+def load_popularity(tables: dict, current_datetime: float) -> PopularityStore:
+    """
+    Reconstrói os contadores de popularidade a partir do histórico em `tables` e das categorias no disco.
+    """
+    catalogue = {"CONTENT": pd.read_parquet(TABLE_PATHS["CONTENT"], columns=["ContentID", "CONTCategory"])}
+    return PopularityStore.from_tables({**tables, **catalogue}, current_datetime)
+
+def load_content_types() -> ContentTypeRegistry:
+    """
+    Reconstrói o registro de tipos de conteúdo a partir de LIVE, VIDEO e SHORT no disco (só a coluna ContentID).
+    """
+    return ContentTypeRegistry.from_tables({
+        name: pd.read_parquet(TABLE_PATHS[name], columns=["ContentID"]) for name in TYPE_TABLES
+    })
+
+def load_content_attributes() -> ContentAttributeStore:
+    """
+    Reconstrói os atributos por ContentID a partir da tabela `content` no disco (só as colunas usadas).
+    """
+    columns = ["content_id"] + [column for column, _, _, _ in ATTRIBUTES.values()]
+    return ContentAttributeStore.from_tables({"content": pd.read_parquet(TABLE_PATHS["content"], columns=columns)})
+
+def iterate(
+    num_iterations: int,
+    time_between_checks: float,
+    initial_time: float,
+    first_iteration: bool = True,
+    seed: int = None,
+    checkpoint_every: int = 10,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    workers: int = 2
+):
+    """
+    Executa a simulação por `num_iterations` ticks.
+
+    Parâmetros:
+    - num_iterations (int): Número de ticks.
+    - time_between_checks (float): Segundos simulados entre ticks.
+    - initial_time (float): Relógio inicial da simulação.
+    - first_iteration (bool): Recria as tabelas vazias antes de começar.
+    - seed (int, opcional): Semente do RNG da simulação.
+    - checkpoint_every (int): Intervalo, em ticks, entre checkpoints (0 desativa).
+    - checkpoint_path (str): Caminho do arquivo de checkpoint.
+    - workers (int): Threads para etapas independentes de um tick (1 desativa o paralelismo).
+    """
     # Inicializa os arquivos e carrega os caminhos
     print('Initializing')
     timer = time.time()
     
     if first_iteration:
         initialize_tables()
-        
-    # Imports
+    else:
+        # Recupera as partes deixadas por uma execução interrompida
+        for path in TABLE_PATHS.values():
+            consolidate_table(path)
+    
+    # Lê apenas os parquets que os geradores consultam
+    store = _open_tables()
+    # As linhas novas de cada tick vão para o disco em segundo plano
+    writer = IncrementalParquetWriter(TABLE_PATHS, reset=first_iteration)
+    rng = np.random.default_rng(seed)
+    sessions = ActiveSessionIndex.from_uwatchingcont(store.frame("UWATCHINGCONT"), initial_time)
+    profiles = load_profiles({name: store.frame(name) for name in WORKING_SET})
+    # Compila (ou lê do cache) o kernel Numba do recomendador fora do laço de ticks
+    numba_backend.warm_up()
+    popularity = load_popularity({name: store.frame(name) for name in WORKING_SET}, initial_time)
+    segments = load_segments({name: store.frame(name) for name in WORKING_SET}, profiles)
+    comment_index = ContentCommentIndex.from_tables({name: store.frame(name) for name in WORKING_SET})
+    content_types = load_content_types()
+    interaction_index = InteractionIndex.from_tables({name: store.frame(name) for name in WORKING_SET})
+    content_attributes = load_content_attributes()
+    
+    print(f'Finished Initialization in {time.time() - timer}')
+    _simulate(
+        store, writer, sessions, profiles, popularity, segments, comment_index, content_types,
+        interaction_index, content_attributes, rng, 0, num_iterations, time_between_checks,
+        initial_time, -1, checkpoint_every, checkpoint_path, workers
+    )
+
+def resume(
+    checkpoint_path: str = CHECKPOINT_PATH,
+    num_iterations: int = None,
+    checkpoint_every: int = 10,
+    workers: int = 2
+):
+    """
+    Retoma uma simulação a partir do último checkpoint, continuando de forma bit a bit idêntica.
+
+    As partes gravadas depois do checkpoint são descartadas e cada tabela é truncada no seu
+    high-water mark antes de o laço continuar.
+
+    Parâmetros:
+    - checkpoint_path (str): Caminho do arquivo de checkpoint.
+    - num_iterations (int, opcional): Total de ticks; por padrão, o da execução original.
+    - checkpoint_every (int): Intervalo, em ticks, entre checkpoints (0 desativa).
+    - workers (int): Threads para etapas independentes de um tick (1 desativa o paralelismo).
+    """
+    state = load_checkpoint(checkpoint_path)
+    if state is None:
+        raise FileNotFoundError(f"Nenhum checkpoint encontrado em '{checkpoint_path}'.")
+    
+    print(f"Resuming from tick {state['tick']}")
+    timer = time.time()
+    for name, path in TABLE_PATHS.items():
+        consolidate_table(path, max_tick=state['tick'] - 1, max_rows=state['table_rows'][name])
+    
+    store = _open_tables()
+    writer = IncrementalParquetWriter(TABLE_PATHS)
+    rng = restore_rng(state)
+    sessions = ActiveSessionIndex.from_uwatchingcont(store.frame("UWATCHINGCONT"), state['current_datetime'])
+    profiles = load_profiles({name: store.frame(name) for name in WORKING_SET})
+    # Compila (ou lê do cache) o kernel Numba do recomendador fora do laço de ticks
+    numba_backend.warm_up()
+    arrays = load_arrays(checkpoint_path, state['tick'])
+    popularity_state = unpack_arrays(arrays, 'popularity')
+    popularity = (PopularityStore.from_state(popularity_state) if popularity_state is not None
+                  else load_popularity({name: store.frame(name) for name in WORKING_SET}, state['current_datetime']))
+    segments = load_segments({name: store.frame(name) for name in WORKING_SET}, profiles)
+    comment_index = ContentCommentIndex.from_tables({name: store.frame(name) for name in WORKING_SET})
+    content_types = load_content_types()
+    interaction_index = InteractionIndex.from_tables({name: store.frame(name) for name in WORKING_SET})
+    content_attributes = load_content_attributes()
+    
+    print(f'Finished Initialization in {time.time() - timer}')
+    _simulate(
+        store, writer, sessions, profiles, popularity, segments, comment_index, content_types,
+        interaction_index, content_attributes, rng, state['tick'], num_iterations or state['num_iterations'],
+        state['time_between_checks'], state['current_datetime'], state['prev_day_number'],
+        checkpoint_every, checkpoint_path, workers
+    )
+
+def shared_stores(**stores) -> dict:
+    """
+    Estruturas em memória que as etapas de um tick alteram no lugar (`content_types`, `content_attributes`,
+    `segments`). Entram no contexto inicial de `run_stages` com o próprio nome, para que as etapas as
+    declarem em `reads` e `writes` como se fossem tabelas; as ausentes (`None`) não são declaradas.
+    """
+    return {name: store for name, store in stores.items() if store is not None}
+
+def build_catalogue_stages(
+    store: TableStore,
+    i: int,
+    current_datetime: float,
+    content_types: ContentTypeRegistry = None,
+    content_attributes: ContentAttributeStore = None
+) -> list:
+    """
+    Etapas que produzem usuários, canais e conteúdos novos. Só dependem do número de linhas
+    já existentes em cada tabela (para os IDs). A etapa de conteúdos registra o tipo e os atributos
+    dos conteúdos novos em `content_types` e `content_attributes` e declara essa escrita; o contexto
+    inicial precisa trazê-los (ver `shared_stores`).
+    """
     from src.generators.content_generator import create_random_content
     from src.generators.user_generator import create_random_user
     from src.generators.channel_generator import create_random_channel_py
+    
+    decay = np.exp(-DECAY_RATE * i)
+    stores = set(shared_stores(content_types=content_types, content_attributes=content_attributes))
+    
+    def users_stage(new, rng):
+        users, USER = create_random_user(USERS_PER_TICK, store.num_rows("users"), rng)
+        return {"users": users, "USER": USER}
+    
+    def channels_stage(new, rng):
+        users, channels, CHANNEL = create_random_channel_py(
+            new["users"], decay, store.num_rows("channels"), current_datetime, rng
+        )
+        return {"users": users, "channels": channels, "CHANNEL": CHANNEL}
+    
+    def content_stage(new, rng):
+        content_dict = create_random_content(
+            new["channels"], np.arange(1, 16, dtype=np.int8), decay,
+            store.num_rows("content"), current_datetime, rng, content_types=new.get("content_types"),
+            content_attributes=new.get("content_attributes")
+        )
+        return {
+            "content": content_dict['df_content'],
+            "CONTENT": content_dict['df_CONTENT'],
+            "CONTENT_CONTTag": content_dict['df_content_tag'],
+            "VIDEO": content_dict['df_video'],
+            "SHORT": content_dict['df_short'],
+            "LIVE": content_dict['df_live'],
+        }
+    
+    return [
+        Stage("users", users_stage, writes={"users", "USER"}),
+        Stage("channels", channels_stage, reads={"users"}, writes={"users", "channels", "CHANNEL"}),
+        Stage("content", content_stage, reads={"channels"} | stores,
+              writes={"content", "CONTENT", "CONTENT_CONTTag", "VIDEO", "SHORT", "LIVE"} | stores),
+    ]
+
+def build_activity_stages(
+    sessions: ActiveSessionIndex,
+    history: dict,
+    current_datetime: float,
+    profiles: ProfileStore = None,
+    popularity: PopularityStore = None,
+    segments: SegmentStore = None,
+    comment_index: ContentCommentIndex = None,
+    content_types: ContentTypeRegistry = None,
+    interaction_index: InteractionIndex = None,
+    content_attributes: ContentAttributeStore = None
+) -> list:
+    """
+    Etapas de visualização, comentários e interações. Leem as linhas novas do tick e o histórico
+    (`history`), que não muda durante o tick e, por isso, não cria dependências.
+    `WATCHING_NOW` é o conjunto de sessões ativas já incluindo as visualizações novas; o índice
+    `sessions`, os perfis `profiles`, as tendências `popularity`, os perfis de `segments`, os
+    comentários por conteúdo de `comment_index` e os pares de `interaction_index` só são atualizados
+    depois que o tick termina. `segments` é a exceção: a etapa de visualização registra nele os usuários
+    novos antes de recomendar e declara essa escrita.
+    `content_types` e `content_attributes` são lidos depois de a etapa de conteúdos registrar o tick
+    (ver `build_catalogue_stages`); sem `content_types`, os tipos vêm de LIVE, VIDEO e SHORT em `history` e
+    no tick. As estruturas declaradas precisam estar no contexto inicial (ver `shared_stores`).
+    """
     from src.generators.uwatchingcont_generator import create_random_uwatching_cont
     from src.generators.usercomments_generator import create_random_comments
     from src.generators.userinteraction_generator import create_random_user_interactions
     
-    # Lê todos os parquets
-    tables = load_all_tables(TABLE_PATHS)
-
-    # Desempacotar os DataFrames no escopo da função
-    dataframes = {
-        "users": tables["users"],
-        "channels": tables["channels"],
-        "content": tables["content"],
-        "comments": tables["comments"],
-        "USER": tables["USER"],
-        "CHANNEL": tables["CHANNEL"],
-        "UADMINCH": tables["UADMINCH"],
-        "UINTERESTCH": tables["UINTERESTCH"],
-        "CONTENT": tables["CONTENT"],
-        "UWATCHINGCONT": tables["UWATCHINGCONT"],
-        "LIVE": tables["LIVE"],
-        "VIDEO": tables["VIDEO"],
-        "SHORT": tables["SHORT"],
-        "COMMENT": tables["COMMENT"],
-        "LIVECOMMENT": tables["LIVECOMMENT"],
-        "COMMENTREPLY": tables["COMMENTREPLY"],
-        "VIDEOCOMMENT": tables["VIDEOCOMMENT"],
-        "POLLCOMMENT": tables["POLLCOMMENT"],
-        "SHORTCOMMENT": tables["SHORTCOMMENT"],
-        "POLL": tables["POLL"],
-        "PLAYLIST": tables["PLAYLIST"],
-        "PLAYLISTCONTENT": tables["PLAYLISTCONTENT"],
-        "USERINTERACTION": tables["USERINTERACTION"],
-        "UCONTINT": tables["UCONTINT"],
-        "UCOMINT": tables["UCOMINT"],
-        "UPLAYINT": tables["UPLAYINT"],
-        "NOTIFICATION": tables["NOTIFICATION"],
-        "USERNOTIFIED": tables["USERNOTIFIED"],
-        "CHANNEL_CHExtLink": tables["CHANNEL_CHExtLink"],
-        "CONTENT_CONTTag": tables["CONTENT_CONTTag"],
-        "PLAYLIST_PLAYTag": tables["PLAYLIST_PLAYTag"],
-    }
+    watch_stores = set(shared_stores(segments=segments, content_attributes=content_attributes))
+    comment_reads = {"content_types"} if content_types is not None else {"LIVE", "VIDEO", "SHORT"}
     
-    # Criar cópias iniciais para os DataFrames _new
-    dataframes_new = {key: df.copy() for key, df in dataframes.items()}
+    def watch_stage(new, rng):
+        watching_now = sessions.active()
+        if "segments" in new:
+            new["segments"].add_users(new["users"])
+        uwatchingcont = create_random_uwatching_cont(
+            WATCHING_RATIO, new["users"], new["USER"], new["content"], new["CONTENT"],
+            history["UWATCHINGCONT"], new["CONTENT_CONTTag"], 
+            history["USERINTERACTION"], history["UCONTINT"], history["COMMENT"], 
+            history["LIVECOMMENT"], history["VIDEOCOMMENT"], history["SHORTCOMMENT"],
+            NUM_RECOMMENDATIONS, current_datetime, rng,
+            watching_now=watching_now, profiles=profiles, popularity=popularity,
+            segments=new.get("segments"), content_attributes=new.get("content_attributes"), sessions=sessions
+        )
+        watching_now = pd.concat([watching_now, uwatchingcont], ignore_index=True)
+        return {"UWATCHINGCONT": uwatchingcont, "WATCHING_NOW": watching_now}
     
-    current_datetime = initial_time
-    decay_rate = 0.001
-    num_recommendations = 3
-    comment_ratio = 0.4
-    interact_ratio = 0.3
-    prev_day_number = -1
+    def comments_stage(new, rng):
+        if "content_types" not in new:
+            lives, videos, shorts = (
+                pd.concat([history[name], new[name]], ignore_index=True) for name in ("LIVE", "VIDEO", "SHORT")
+            )
+        else:
+            lives = videos = shorts = None
+        COMMENT, COMMENTREPLY, LIVECOMMENT, VIDEOCOMMENT, SHORTCOMMENT = create_random_comments(
+            COMMENT_RATIO, new["UWATCHINGCONT"], history["COMMENT"],
+            history["LIVECOMMENT"], history["VIDEOCOMMENT"], history["SHORTCOMMENT"],
+            current_datetime, lives, videos, shorts,
+            rng, watching_now=new["WATCHING_NOW"], comment_index=comment_index, content_types=new.get("content_types")
+        )
+        return {
+            "COMMENT": COMMENT,
+            "COMMENTREPLY": COMMENTREPLY,
+            "LIVECOMMENT": LIVECOMMENT,
+            "VIDEOCOMMENT": VIDEOCOMMENT,
+            "SHORTCOMMENT": SHORTCOMMENT,
+        }
     
-    print(f'Finished Initialization in {time.time() - timer}')
+    def interactions_stage(new, rng):
+        USERINTERACTION, UCONTINT = create_random_user_interactions(
+            INTERACT_RATIO, new["UWATCHINGCONT"], 
+            history["USERINTERACTION"], history["UCONTINT"], rng,
+            watching_now=new["WATCHING_NOW"], interaction_index=interaction_index
+        )
+        return {"USERINTERACTION": USERINTERACTION, "UCONTINT": UCONTINT}
+    
+    return [
+        Stage("watch", watch_stage, reads={"users", "USER", "content", "CONTENT", "CONTENT_CONTTag"} | watch_stores,
+              writes={"UWATCHINGCONT", "WATCHING_NOW"} | watch_stores),
+        Stage("comments", comments_stage, reads={"UWATCHINGCONT", "WATCHING_NOW"} | comment_reads,
+              writes={"COMMENT", "COMMENTREPLY", "LIVECOMMENT", "VIDEOCOMMENT", "SHORTCOMMENT"}),
+        Stage("interactions", interactions_stage, reads={"UWATCHINGCONT", "WATCHING_NOW"},
+              writes={"USERINTERACTION", "UCONTINT"}),
+    ]
+
+def build_tick_stages(
+    store: TableStore,
+    sessions: ActiveSessionIndex,
+    history: dict,
+    i: int,
+    current_datetime: float,
+    profiles: ProfileStore = None,
+    popularity: PopularityStore = None,
+    segments: SegmentStore = None,
+    comment_index: ContentCommentIndex = None,
+    content_types: ContentTypeRegistry = None,
+    interaction_index: InteractionIndex = None,
+    content_attributes: ContentAttributeStore = None
+) -> list:
+    """Monta todas as etapas de um tick da simulação em um único processo."""
+    return (
+        build_catalogue_stages(store, i, current_datetime, content_types, content_attributes)
+        + build_activity_stages(
+            sessions, history, current_datetime, profiles, popularity, segments, comment_index,
+            content_types, interaction_index, content_attributes
+        )
+    )
 
+def _simulate(
+    store: TableStore,
+    writer: IncrementalParquetWriter,
+    sessions: ActiveSessionIndex,
+    profiles: ProfileStore,
+    popularity: PopularityStore,
+    segments: SegmentStore,
+    comment_index: ContentCommentIndex,
+    content_types: ContentTypeRegistry,
+    interaction_index: InteractionIndex,
+    content_attributes: ContentAttributeStore,
+    rng: np.random.Generator,
+    start_tick: int,
+    num_iterations: int,
+    time_between_checks: float,
+    current_datetime: float,
+    prev_day_number: float,
+    checkpoint_every: int,
+    checkpoint_path: str,
+    workers: int
+):
     operations_timer = 0
-    concat_timer = 0
-    copy_timer = 0
+    append_timer = 0
+    stage_timings = {}
+    # Etapas independentes do mesmo tick (comentários e interações) rodam em paralelo
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
     
-    for i in range(num_iterations):
+    for i in range(start_tick, num_iterations):
         timer = time.time()
         day_number = current_datetime // 86400
         if prev_day_number != day_number:
             prev_day_number = day_number
             print(f'Current Datetime: Day{day_number}, {(current_datetime // 3600) % 24:02.0f}h{(current_datetime // 60) % 60:02.0f}min, {current_datetime % 60:02.0f}sec')
         
-        # Operações de geração de dados
-        dataframes["users"], dataframes["USER"] = create_random_user(
-            2_000_000,
-            dataframes["users"].shape[0]
-        )
-        dataframes["users"], dataframes["channels"], dataframes["CHANNEL"] = create_random_channel_py(
-            dataframes["users"], np.exp(-decay_rate * i), dataframes["channels"].shape[0], current_datetime
-        )
-        content_dict = create_random_content(
-            dataframes["channels"], np.arange(1, 16, dtype=np.int8), np.exp(-decay_rate * i),
-            dataframes["content"].shape[0], current_datetime
-        )
-        dataframes["content"] = content_dict['df_content']
-        dataframes["CONTENT"] = content_dict['df_CONTENT']
-        dataframes["CONTENT_CONTTag"] = content_dict['df_content_tag']
-        dataframes["VIDEO"] = content_dict['df_video']
-        dataframes["SHORT"] = content_dict['df_short']
-        dataframes["LIVE"] = content_dict['df_live']
-        dataframes["UWATCHINGCONT"] = create_random_uwatching_cont(
-            0.1, dataframes["users"], dataframes["USER"], dataframes["content"], dataframes["CONTENT"],
-            dataframes["UWATCHINGCONT"], dataframes["CONTENT_CONTTag"], 
-            dataframes["USERINTERACTION"], dataframes["UCONTINT"], dataframes["COMMENT"], 
-            dataframes["LIVECOMMENT"], dataframes["VIDEOCOMMENT"], dataframes["SHORTCOMMENT"],
-            num_recommendations, current_datetime
-        )
-        (dataframes["COMMENT"], dataframes["COMMENTREPLY"], dataframes["LIVECOMMENT"],
-         dataframes["VIDEOCOMMENT"], dataframes["SHORTCOMMENT"]) = create_random_comments(
-            comment_ratio, dataframes["UWATCHINGCONT"], dataframes["COMMENT"],
-            dataframes["LIVECOMMENT"], dataframes["VIDEOCOMMENT"], dataframes["SHORTCOMMENT"],
-            current_datetime, dataframes["LIVE"], dataframes["VIDEO"], dataframes["SHORT"]
-        )
-        dataframes["USERINTERACTION"], dataframes["UCONTINT"] = create_random_user_interactions(
-            interact_ratio, dataframes["UWATCHINGCONT"], 
-            dataframes["USERINTERACTION"], dataframes["UCONTINT"]
+        # Sessões que terminaram até agora saem do conjunto ativo
+        sessions.advance(current_datetime)
+        
+        # Operações de geração de dados (apenas as linhas novas do tick)
+        history = {name: store.frame(name) for name in WORKING_SET}
+        stages = build_tick_stages(
+            store, sessions, history, i, current_datetime, profiles, popularity, segments, comment_index,
+            content_types, interaction_index, content_attributes
         )
+        context = run_stages(stages, shared_stores(
+            content_types=content_types, content_attributes=content_attributes, segments=segments
+        ), rng, executor, stage_timings)
+        new = {name: df for name, df in context.items() if name in TABLE_PATHS}
+        sessions.add(new["UWATCHINGCONT"])
+        comment_index.update(new)
+        interaction_index.update(new)
+        profiles.update(new)
+        popularity.update(new, current_datetime)
+        # Os usuários do tick já foram registrados na etapa de visualização
+        segments.update({name: new[name] for name in ("UWATCHINGCONT", "USERINTERACTION", "UCONTINT")})
         current_datetime += time_between_checks
-        dataframes["UWATCHINGCONT"] = update_uwatching_cont(dataframes["UWATCHINGCONT"], current_datetime)
+        # Apenas as linhas novas: o conjunto ativo é mantido pelo índice de sessões
+        new["UWATCHINGCONT"] = update_uwatching_cont(new["UWATCHINGCONT"], current_datetime)
         
         operations_timer += time.time() - timer
         timer = time.time()
         
-        # Concatenar todos os DataFrames
-        for key in dataframes:
-            dataframes_new[key] = safe_concat(dataframes_new[key], dataframes[key])
+        # Anexar as linhas novas: O(linhas novas), sem recopiar o histórico
+        store.append_all(new)
+        writer.write(i, new)
         
-        concat_timer += time.time() - timer
-        timer = time.time()
+        append_timer += time.time() - timer
         
-        # Atualizar os DataFrames originais com os concatenados
-        dataframes.update(dataframes_new)
-        
-        copy_timer += time.time() - timer
+        # Checkpoint: só depois que as partes deste tick estão no disco
+        if checkpoint_every and (i + 1) % checkpoint_every == 0:
+            writer.flush()
+            save_checkpoint(checkpoint_path, simulation_state(
+                i + 1, num_iterations, time_between_checks, current_datetime,
+                prev_day_number, rng, {name: store.num_rows(name) for name in TABLE_PATHS}
+            ), arrays=pack_arrays({"popularity": popularity.state()}))
     
-    print(f'Operations Time: {operations_timer}s')
-    print(f'Concat Time: {concat_timer}s')
-    print(f'Copy Timer: {copy_timer}s')
+    if executor is not None:
+        executor.shutdown(wait=True)
     
-    print('Updating Tables')
-    tables.update(dataframes_new)
-    print('Tables Updated')
+    print(f'Operations Time: {operations_timer}s')
+    for name, elapsed in stage_timings.items():
+        print(f'  Stage {name}: {elapsed}s')
+    print(f'Append Time: {append_timer}s')
+    print(f'Store Concat Time: {store.concat_time}s')
+    print(f'Store Frame Time: {store.frame_time}s')
+    print(f'Trending: {popularity.trending()[:10]}')
     
     print('Start Saving')
-    for name, df in tables.items():
-        df.to_parquet(TABLE_PATHS[name], index=False)
+    writer.close()
+    remove_checkpoint(checkpoint_path)
     print('End Saving')
     return
 
@@ -282,8 +552,6 @@ if __name__ == '__main__':
         iterate(5, 60, 0, False)
         
     run_simulation5()
-    print(GLOBAL_CONCAT_TIME)
-    print(GLOBAL_DF_TIME)
     
     '''
     @timeit
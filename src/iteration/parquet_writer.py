@@ -0,0 +1,176 @@
+"""
+Module: parquet_writer
+----------------------
+
+Escrita incremental das tabelas da simulação em Parquet.
+
+Em vez de acumular todo o histórico em memória e salvar tudo no fim da execução, cada tick grava as suas
+linhas novas como um arquivo-parte (`part-000123.parquet`) em um diretório ao lado do arquivo da tabela
+(`USER.parquet` -> `USER_parts/`). A gravação acontece em uma thread de fundo, sobrepondo o I/O com a
+simulação, e cada parte é escrita em um arquivo temporário e renomeada, de modo que uma queda no meio da
+execução nunca deixa uma parte corrompida.
+
+No fim da execução (`close`), as partes são consolidadas no arquivo de `TABLE_PATHS` como row groups,
+lidas uma de cada vez, sem carregar a tabela inteira. Partes que sobraram de uma execução interrompida
+podem ser consolidadas com `consolidate_table`.
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PART_PREFIX = 'part-'
+
+
+def parts_dir(path: str) -> str:
+    """Diretório onde ficam as partes por tick da tabela salva em `path`."""
+    return os.path.splitext(path)[0] + '_parts'
+
+
+def part_path(path: str, tick: int) -> str:
+    """Caminho da parte de um tick específico."""
+    return os.path.join(parts_dir(path), f'{PART_PREFIX}{tick:06d}.parquet')
+
+
+def list_parts(path: str) -> list:
+    """Lista as partes existentes de uma tabela, em ordem de tick."""
+    directory = parts_dir(path)
+    if not os.path.isdir(directory):
+        return []
+    return [
+        os.path.join(directory, file)
+        for file in sorted(os.listdir(directory))
+        if file.startswith(PART_PREFIX) and file.endswith('.parquet')
+    ]
+
+
+def part_tick(part: str) -> int:
+    """Extrai o número do tick do nome de uma parte."""
+    return int(os.path.basename(part)[len(PART_PREFIX):-len('.parquet')])
+
+
+def count_rows(path: str) -> int:
+    """Número de linhas de uma tabela (arquivo + partes), lendo apenas os metadados."""
+    pieces = ([path] if os.path.exists(path) else []) + list_parts(path)
+    return sum(pq.ParquetFile(piece).metadata.num_rows for piece in pieces)
+
+
+def widen_dictionaries(schema: pa.Schema) -> pa.Schema:
+    """
+    Troca o tipo dos índices das colunas de dicionário (categóricas) por int32.
+
+    O pandas escolhe int8 ou int16 conforme o número de categorias, e os vocabulários globais crescem ao longo
+    da execução; com um tipo fixo, partes de ticks diferentes continuam compatíveis entre si.
+    """
+    fields = [
+        field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+        if pa.types.is_dictionary(field.type) else field
+        for field in schema
+    ]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def write_part(df: pd.DataFrame, path: str):
+    """Escreve um DataFrame de forma atômica (arquivo temporário + rename)."""
+    tmp_path = path + '.tmp'
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table.cast(widen_dictionaries(table.schema)), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def consolidate_table(path: str, max_tick: int = None, max_rows: int = None) -> int:
+    """
+    Junta o arquivo da tabela e suas partes em um único Parquet, uma row group por parte.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo da tabela (valor de `TABLE_PATHS`).
+    - max_tick (int, opcional): Ignora partes de ticks posteriores a este.
+    - max_rows (int, opcional): Trunca a tabela neste número de linhas (high-water mark de um checkpoint).
+
+    Retorno:
+    - int: Número de linhas do arquivo consolidado.
+    """
+    parts = [part for part in list_parts(path) if max_tick is None or part_tick(part) <= max_tick]
+    pieces = ([path] if os.path.exists(path) else []) + parts
+    files = [pq.ParquetFile(piece) for piece in pieces]
+    files = [file for file in files if file.metadata.num_rows > 0]
+
+    total_rows = sum(file.metadata.num_rows for file in files)
+    if not parts and (max_rows is None or total_rows <= max_rows):
+        shutil.rmtree(parts_dir(path), ignore_errors=True)
+        return total_rows
+
+    schema = widen_dictionaries(files[0].schema_arrow) if files else None
+    tmp_path = path + '.tmp'
+    num_rows = 0
+    if schema is not None:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for file in files:
+                for row_group in range(file.num_row_groups):
+                    if max_rows is not None and num_rows >= max_rows:
+                        break
+                    table = file.read_row_group(row_group)
+                    if max_rows is not None:
+                        table = table.slice(0, max_rows - num_rows)
+                    writer.write_table(table.select(schema.names).cast(schema))
+                    num_rows += table.num_rows
+        for file in files:
+            file.close()
+        os.replace(tmp_path, path)
+    shutil.rmtree(parts_dir(path), ignore_errors=True)
+    return num_rows
+
+
+class IncrementalParquetWriter:
+    """
+    Grava, em segundo plano, as linhas novas de cada tick como partes Parquet de cada tabela.
+
+    Parâmetros:
+    - table_paths (dict): Nome lógico -> caminho do arquivo Parquet (normalmente `TABLE_PATHS`).
+    - max_pending (int): Número máximo de ticks aguardando gravação antes de bloquear a simulação.
+    - reset (bool): Remove partes antigas ao iniciar (use em execuções que recriam as tabelas).
+    """
+
+    def __init__(self, table_paths: dict, max_pending: int = 2, reset: bool = False):
+        self.table_paths = table_paths
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='parquet-writer')
+        self._pending = []
+        for path in table_paths.values():
+            if reset:
+                shutil.rmtree(parts_dir(path), ignore_errors=True)
+            os.makedirs(parts_dir(path), exist_ok=True)
+
+    def write(self, tick: int, new_tables: dict):
+        """
+        Agenda a gravação das linhas novas de um tick.
+
+        Os DataFrames não devem ser modificados depois de entregues ao writer.
+        """
+        tables = {name: df for name, df in new_tables.items() if not df.empty}
+        self._pending.append(self._executor.submit(self._write_tick, tick, tables))
+        while len(self._pending) > self.max_pending:
+            self._pending.pop(0).result()
+
+    def flush(self):
+        """Bloqueia até que todas as partes agendadas estejam no disco."""
+        while self._pending:
+            self._pending.pop(0).result()
+
+    def close(self, consolidate: bool = True):
+        """
+        Finaliza as gravações e, opcionalmente, consolida as partes nos arquivos de `table_paths`.
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
+        if consolidate:
+            for path in self.table_paths.values():
+                consolidate_table(path)
+
+    def _write_tick(self, tick: int, tables: dict):
+        for name, df in tables.items():
+            write_part(df, part_path(self.table_paths[name], tick))
@@ -0,0 +1,118 @@
+"""
+Module: scheduler
+-----------------
+
+Escalonador do pipeline de um tick da simulação.
+
+Cada etapa (`Stage`) declara as tabelas que lê e as que escreve. A partir dessas declarações o escalonador monta
+um DAG implícito e agrupa as etapas em ondas: etapas de uma mesma onda não dependem umas das outras e podem
+rodar em paralelo em um pool de threads (os geradores passam a maior parte do tempo em merges do pandas e em
+código NumPy, que liberam o GIL).
+
+Estruturas em memória que uma etapa altera no lugar (índices e registros) são declaradas da mesma forma, pelo
+nome com que aparecem no contexto inicial, para que nenhuma etapa que as lê caia na mesma onda.
+
+Para que o resultado não dependa da ordem de execução, cada etapa recebe o seu próprio RNG, derivado do RNG da
+simulação na ordem de declaração das etapas.
+"""
+
+import time
+
+import numpy as np
+
+
+class Stage:
+    """
+    Etapa do pipeline de um tick.
+
+    Parâmetros:
+    - name (str): Nome da etapa (usado em logs e tempos).
+    - func (callable): Função `func(inputs: dict, rng: np.random.Generator) -> dict`. Recebe apenas as
+      tabelas declaradas em `reads` e retorna as tabelas declaradas em `writes`.
+    - reads (iterable): Tabelas lidas pela etapa.
+    - writes (iterable): Tabelas produzidas (ou reescritas) pela etapa.
+    """
+
+    def __init__(self, name: str, func, reads=(), writes=()):
+        self.name = name
+        self.func = func
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+
+    def depends_on(self, other: 'Stage') -> bool:
+        """Indica se a etapa precisa esperar `other` (leitura após escrita, escrita após escrita ou após leitura)."""
+        return bool(
+            (self.reads & other.writes)
+            or (self.writes & other.writes)
+            or (self.writes & other.reads)
+        )
+
+
+def plan_stages(stages: list) -> list:
+    """
+    Agrupa as etapas em ondas de execução.
+
+    Uma etapa vai para a primeira onda posterior a todas as etapas declaradas antes dela das quais depende;
+    a ordem de declaração resolve os conflitos.
+
+    Retorno:
+    - list: Lista de ondas, cada uma com uma lista de etapas independentes entre si.
+    """
+    levels = []
+    for idx, stage in enumerate(stages):
+        level = 0
+        for prev_idx in range(idx):
+            if stage.depends_on(stages[prev_idx]):
+                level = max(level, levels[prev_idx] + 1)
+        levels.append(level)
+
+    waves = [[] for _ in range(max(levels, default=-1) + 1)]
+    for stage, level in zip(stages, levels):
+        waves[level].append(stage)
+    return waves
+
+
+def run_stages(
+    stages: list,
+    context: dict,
+    rng: np.random.Generator,
+    executor=None,
+    timings: dict = None
+) -> dict:
+    """
+    Executa as etapas respeitando as dependências, em paralelo quando possível.
+
+    Parâmetros:
+    - stages (list): Etapas na ordem lógica do tick.
+    - context (dict): Tabelas disponíveis; é atualizado com o que cada etapa escreve.
+    - rng (np.random.Generator): RNG da simulação, do qual derivam os RNGs das etapas.
+    - executor (concurrent.futures.Executor, opcional): Pool para ondas com mais de uma etapa.
+      Sem executor, tudo roda sequencialmente.
+    - timings (dict, opcional): Acumula o tempo de cada etapa pelo nome.
+
+    Retorno:
+    - dict: O próprio `context`, com as tabelas produzidas.
+    """
+    seeds = rng.integers(0, np.iinfo(np.int64).max, size=len(stages))
+    stage_rngs = {stage.name: np.random.default_rng(seed) for stage, seed in zip(stages, seeds)}
+
+    def call(stage):
+        start = time.time()
+        result = stage.func({name: context[name] for name in stage.reads}, stage_rngs[stage.name])
+        return result, time.time() - start
+
+    for wave in plan_stages(stages):
+        if executor is None or len(wave) == 1:
+            results = [call(stage) for stage in wave]
+        else:
+            futures = [executor.submit(call, stage) for stage in wave]
+            results = [future.result() for future in futures]
+
+        for stage, (result, elapsed) in zip(wave, results):
+            undeclared = set(result) - stage.writes
+            if undeclared:
+                raise ValueError(f"A etapa '{stage.name}' escreveu tabelas não declaradas: {sorted(undeclared)}")
+            context.update(result)
+            if timings is not None:
+                timings[stage.name] = timings.get(stage.name, 0.0) + elapsed
+    return context
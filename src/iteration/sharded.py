@@ -0,0 +1,344 @@
+"""
+Module: sharded
+---------------
+
+Simulação distribuída em vários processos, particionada por usuário (`UserID % num_shards`).
+
+O processo coordenador gera, a cada tick, o catálogo (usuários, canais e conteúdos) e o distribui: os
+usuários novos vão para o shard dono de cada um, e os conteúdos novos são enviados a todos os shards.
+Cada shard é um processo persistente com o seu próprio `TableStore` (o histórico dos seus usuários e uma
+réplica do tipo e dos atributos de todos os conteúdos em `ContentTypeRegistry` e `ContentAttributeStore`), o seu próprio `ActiveSessionIndex` e os perfis do recomendador dos seus
+usuários (`ProfileStore`, com uma réplica das tags de todos os conteúdos), e roda as etapas de visualização,
+comentários e interações sem compartilhar memória com os demais.
+
+Os IDs novos (UWATCHCONTID, CommentID, UINTID) são atribuídos em duas fases. Primeiro cada shard gera as
+suas linhas com IDs locais e informa quantas produziu em cada sequência. Depois o coordenador calcula,
+em ordem de shard, o início global de cada bloco (soma de prefixos) e cada shard desloca os seus IDs para
+esse intervalo antes de guardar as linhas e devolvê-las. O resultado é determinístico para uma mesma
+semente e um mesmo número de shards.
+
+As diferenças em relação à simulação em um único processo estão em `iterate_sharded`.
+"""
+
+import multiprocessing as mp
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.initialization.initialize_tables import initialize_tables, TABLE_PATHS
+from src.initialization.schema import SCHEMAS, conform_all
+from src.iteration.table_store import TableStore
+from src.iteration.parquet_writer import IncrementalParquetWriter, consolidate_table, count_rows
+from src.iteration.scheduler import run_stages
+from src.indexes.active_sessions import ActiveSessionIndex
+from src.indexes.content_comments import ContentCommentIndex
+from src.indexes.content_types import ContentTypeRegistry
+from src.indexes.content_attributes import ContentAttributeStore
+from src.indexes.interactions import InteractionIndex
+from src.recommendation import numba_backend
+from src.iteration.iterate import (
+    WORKING_SET, load_all_tables, update_uwatching_cont,
+    build_catalogue_stages, build_activity_stages, shared_stores, load_profiles, load_content_types,
+    load_content_attributes
+)
+
+# Tabelas de catálogo enviadas a todos os shards
+BROADCAST_TABLES = ("content", "CONTENT", "CONTENT_CONTTag", "LIVE", "VIDEO", "SHORT")
+
+# Tabelas particionadas por usuário -> coluna com o ID do usuário
+PARTITIONED_TABLES = {"users": "user_id", "USER": "UserID"}
+
+# Colunas com IDs novos gerados pelos shards -> sequência (tabela que conta os IDs já usados)
+NEW_ID_COLUMNS = {
+    "UWATCHINGCONT": {"UWATCHCONTID": "UWATCHINGCONT"},
+    "COMMENT": {"CommentID": "COMMENT"},
+    "COMMENTREPLY": {"COMisRepByCOMCommentID": "COMMENT"},
+    "LIVECOMMENT": {"CommentID": "COMMENT"},
+    "VIDEOCOMMENT": {"CommentID": "COMMENT"},
+    "SHORTCOMMENT": {"CommentID": "COMMENT"},
+    "USERINTERACTION": {"UINTID": "USERINTERACTION"},
+    "UCONTINT": {"UINTID": "USERINTERACTION"},
+}
+
+ID_SEQUENCES = ("UWATCHINGCONT", "COMMENT", "USERINTERACTION")
+
+
+def shard_of(user_ids, num_shards: int) -> np.ndarray:
+    """Shard dono de cada usuário."""
+    return np.asarray(user_ids, dtype=np.int64) % num_shards
+
+
+def partition_by_user(df: pd.DataFrame, column: str, num_shards: int) -> list:
+    """Divide um DataFrame em `num_shards` partes pelo ID do usuário, preservando a ordem das linhas."""
+    owners = shard_of(df[column].to_numpy(), num_shards)
+    return [df[owners == shard].reset_index(drop=True) for shard in range(num_shards)]
+
+
+def _load_shard_history(shard: int, num_shards: int) -> dict:
+    """
+    Carrega do disco o histórico do conjunto de trabalho que pertence a um shard.
+
+    As tabelas são filtradas pelos usuários do shard (as tabelas por tipo de comentário e UCONTINT seguem
+    o dono do comentário ou da interação).
+    """
+    tables = load_all_tables({name: TABLE_PATHS[name] for name in WORKING_SET})
+    owned = lambda df, column: df[shard_of(df[column].to_numpy(), num_shards) == shard].reset_index(drop=True)
+
+    tables["UWATCHINGCONT"] = owned(tables["UWATCHINGCONT"], "UserID")
+    tables["COMMENT"] = owned(tables["COMMENT"], "UserID")
+    tables["USERINTERACTION"] = owned(tables["USERINTERACTION"], "UserID")
+
+    comment_ids = tables["COMMENT"]["CommentID"]
+    for name in ("LIVECOMMENT", "VIDEOCOMMENT", "SHORTCOMMENT"):
+        tables[name] = tables[name][tables[name]["CommentID"].isin(comment_ids)].reset_index(drop=True)
+    interaction_ids = tables["USERINTERACTION"]["UINTID"]
+    tables["UCONTINT"] = tables["UCONTINT"][tables["UCONTINT"]["UINTID"].isin(interaction_ids)].reset_index(drop=True)
+    return tables
+
+
+def shift_new_ids(new_tables: dict, offsets: dict) -> dict:
+    """
+    Desloca as colunas de IDs novos de um shard para o intervalo global reservado a ele.
+
+    Parâmetros:
+    - new_tables (dict): Linhas novas do shard, com IDs locais.
+    - offsets (dict): Sequência -> deslocamento (início global menos início local).
+
+    Retorno:
+    - dict: As mesmas tabelas com os IDs globais.
+    """
+    shifted = dict(new_tables)
+    for name, columns in NEW_ID_COLUMNS.items():
+        df = new_tables.get(name)
+        if df is None or df.empty:
+            continue
+        df = df.copy()
+        for column, sequence in columns.items():
+            df[column] = (df[column].to_numpy(dtype=np.int64) + offsets[sequence]).astype(np.int32)
+        shifted[name] = df
+    return shifted
+
+
+def _shard_worker(conn, shard: int, num_shards: int, first_iteration: bool, initial_time: float,
+                  table_paths: dict):
+    """
+    Laço de um processo shard. Atende às mensagens do coordenador:
+    - ('tick', tabelas, current_datetime, seed): gera as linhas do tick e responde com a contagem de cada sequência;
+    - ('commit', inícios_globais, next_datetime): fixa os IDs, guarda as linhas e as devolve ao coordenador;
+    - ('stop',): encerra o processo.
+
+    O processo é criado com `spawn` e reimporta os módulos; `table_paths` traz os caminhos das tabelas
+    do coordenador, que substituem os padrões de `TABLE_PATHS`.
+    """
+    TABLE_PATHS.update(table_paths)
+    if first_iteration:
+        tables = load_all_tables(TABLE_PATHS, set())
+        tables = {name: tables[name] for name in WORKING_SET}
+    else:
+        tables = _load_shard_history(shard, num_shards)
+    store = TableStore(tables, schemas=SCHEMAS)
+    sessions = ActiveSessionIndex.from_uwatchingcont(store.frame("UWATCHINGCONT"), initial_time)
+    comment_index = ContentCommentIndex.from_tables(tables)
+    content_types = ContentTypeRegistry() if first_iteration else load_content_types()
+    content_attributes = ContentAttributeStore() if first_iteration else load_content_attributes()
+    interaction_index = InteractionIndex.from_tables(tables)
+    profiles = load_profiles(tables)
+    numba_backend.warm_up()
+    pending = None
+    local_bases = None
+
+    while True:
+        message = conn.recv()
+        command = message[0]
+
+        if command == 'tick':
+            _, catalogue, current_datetime, seed = message
+            sessions.advance(current_datetime)
+            history = {name: store.frame(name) for name in WORKING_SET}
+            local_bases = {sequence: store.num_rows(sequence) for sequence in ID_SEQUENCES}
+            profiles.add_content(catalogue["CONTENT"], catalogue["CONTENT_CONTTag"])
+            content_types.update(catalogue)
+            content_attributes.update(catalogue)
+            stages = build_activity_stages(
+                sessions, history, current_datetime, profiles,
+                comment_index=comment_index, content_types=content_types, interaction_index=interaction_index,
+                content_attributes=content_attributes
+            )
+            context = run_stages(stages, {
+                **catalogue, **shared_stores(content_types=content_types, content_attributes=content_attributes)
+            }, np.random.default_rng(seed))
+            pending = {name: context[name] for name in NEW_ID_COLUMNS}
+            conn.send({sequence: pending[sequence].shape[0] for sequence in ID_SEQUENCES})
+
+        elif command == 'commit':
+            _, starts, next_datetime = message
+            offsets = {sequence: starts[sequence] - local_bases[sequence] for sequence in ID_SEQUENCES}
+            new = shift_new_ids(pending, offsets)
+            sessions.add(new["UWATCHINGCONT"])
+            comment_index.update(new)
+            interaction_index.update(new)
+            profiles.update(new)
+            new["UWATCHINGCONT"] = update_uwatching_cont(new["UWATCHINGCONT"], next_datetime)
+            store.append_all(new)
+            conn.send({name: new[name] for name in NEW_ID_COLUMNS})
+            pending = None
+
+        elif command == 'stop':
+            conn.close()
+            return
+
+
+class ShardPool:
+    """
+    Processos shard persistentes, um por partição de usuários.
+
+    Parâmetros:
+    - num_shards (int): Número de processos.
+    - first_iteration (bool): Se os shards começam com o histórico vazio (ou o leem do disco).
+    - initial_time (float): Relógio inicial, usado para reconstruir as sessões ativas.
+    """
+
+    def __init__(self, num_shards: int, first_iteration: bool, initial_time: float):
+        context = mp.get_context('spawn')
+        self.num_shards = num_shards
+        self._conns = []
+        self._processes = []
+        for shard in range(num_shards):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_shard_worker,
+                args=(child_conn, shard, num_shards, first_iteration, initial_time, dict(TABLE_PATHS)),
+                name=f'shard-{shard}',
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def run_tick(self, catalogue: dict, current_datetime: float, next_datetime: float,
+                 global_bases: dict, seeds) -> dict:
+        """
+        Executa as etapas de atividade de um tick em todos os shards.
+
+        Parâmetros:
+        - catalogue (dict): Tabelas novas do catálogo (usuários, canais e conteúdos) do tick.
+        - current_datetime (float): Relógio do tick.
+        - next_datetime (float): Relógio do próximo tick (para `UIsWatchingCONTNow`).
+        - global_bases (dict): Sequência -> número de IDs já usados globalmente.
+        - seeds: Uma semente por shard.
+
+        Retorno:
+        - dict: Linhas novas de atividade de todos os shards, concatenadas em ordem de shard.
+        """
+        parts = {name: partition_by_user(catalogue[name], column, self.num_shards)
+                 for name, column in PARTITIONED_TABLES.items()}
+        for shard, conn in enumerate(self._conns):
+            tables = {name: catalogue[name] for name in BROADCAST_TABLES}
+            tables.update({name: parts[name][shard] for name in PARTITIONED_TABLES})
+            conn.send(('tick', tables, current_datetime, int(seeds[shard])))
+
+        counts = [conn.recv() for conn in self._conns]
+        starts = dict(global_bases)
+        for conn, shard_counts in zip(self._conns, counts):
+            conn.send(('commit', dict(starts), next_datetime))
+            for sequence in ID_SEQUENCES:
+                starts[sequence] += shard_counts[sequence]
+
+        results = [conn.recv() for conn in self._conns]
+        return conform_all({
+            name: pd.concat([result[name] for result in results], ignore_index=True)
+            for name in NEW_ID_COLUMNS
+        })
+
+    def close(self):
+        for conn in self._conns:
+            conn.send(('stop',))
+            conn.close()
+        for process in self._processes:
+            process.join()
+
+
+def iterate_sharded(
+    num_iterations: int,
+    time_between_checks: float,
+    initial_time: float,
+    num_shards: int,
+    first_iteration: bool = True,
+    seed: int = None
+):
+    """
+    Executa a simulação por `num_iterations` ticks, com as etapas de atividade divididas em `num_shards` processos.
+
+    Diferenças em relação a `iterate` (as tabelas geradas não são as mesmas para uma mesma semente):
+    - os shards não mantêm `PopularityStore` nem `SegmentStore`: o recomendador não tem o fallback de
+      tendências nem o de segmentos, e usuários sem curtidas recebem o fallback sorteado do tick;
+    - as respostas a comentários só escolhem comentários do mesmo shard;
+    - cada shard tem o seu RNG (uma semente por tick derivada do RNG do coordenador);
+    - não há checkpoints, portanto `resume` não se aplica.
+
+    Parâmetros:
+    - num_iterations (int): Número de ticks.
+    - time_between_checks (float): Segundos simulados entre ticks.
+    - initial_time (float): Relógio inicial da simulação.
+    - num_shards (int): Número de processos shard.
+    - first_iteration (bool): Recria as tabelas vazias antes de começar.
+    - seed (int, opcional): Semente do RNG do coordenador.
+    """
+    print('Initializing')
+    timer = time.time()
+
+    if first_iteration:
+        initialize_tables()
+    else:
+        for path in TABLE_PATHS.values():
+            consolidate_table(path)
+
+    # O coordenador só precisa do número de linhas de cada tabela (IDs); o histórico fica nos shards
+    store = TableStore(
+        load_all_tables(TABLE_PATHS, set()),
+        retain=set(),
+        initial_rows={name: count_rows(path) for name, path in TABLE_PATHS.items()},
+        schemas=SCHEMAS
+    )
+    writer = IncrementalParquetWriter(TABLE_PATHS, reset=first_iteration)
+    rng = np.random.default_rng(seed)
+    pool = ShardPool(num_shards, first_iteration, initial_time)
+
+    print(f'Finished Initialization in {time.time() - timer}')
+
+    current_datetime = initial_time
+    catalogue_timer = 0
+    shards_timer = 0
+    append_timer = 0
+    try:
+        for i in range(num_iterations):
+            timer = time.time()
+            catalogue = run_stages(build_catalogue_stages(store, i, current_datetime), {}, rng)
+            catalogue = {name: df for name, df in catalogue.items() if name in TABLE_PATHS}
+            seeds = rng.integers(0, np.iinfo(np.int64).max, size=num_shards)
+            catalogue_timer += time.time() - timer
+
+            timer = time.time()
+            global_bases = {sequence: store.num_rows(sequence) for sequence in ID_SEQUENCES}
+            next_datetime = current_datetime + time_between_checks
+            activity = pool.run_tick(catalogue, current_datetime, next_datetime, global_bases, seeds)
+            current_datetime = next_datetime
+            shards_timer += time.time() - timer
+
+            timer = time.time()
+            new = {**catalogue, **activity}
+            store.append_all(new)
+            writer.write(i, new)
+            append_timer += time.time() - timer
+    finally:
+        pool.close()
+
+    print(f'Catalogue Time: {catalogue_timer}s')
+    print(f'Shards Time: {shards_timer}s')
+    print(f'Append Time: {append_timer}s')
+
+    print('Start Saving')
+    writer.close()
+    print('End Saving')
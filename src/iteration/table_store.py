@@ -0,0 +1,315 @@
+"""
+Module: table_store
+-------------------
+
+Armazenamento append-only das tabelas da simulação.
+
+Cada tabela é mantida coluna a coluna. Colunas numéricas (inteiros, floats e booleanos) vivem em buffers NumPy
+com capacidade que dobra ao encher, de modo que anexar as linhas de um tick custa O(linhas novas) amortizado.
+Colunas categóricas com vocabulário global registrado no esquema guardam só os códigos inteiros, também em
+buffers. As demais colunas não numéricas (strings, objetos) são guardadas como uma lista de chunks imutáveis por
+tick e só são compactadas quando alguém pede a tabela inteira.
+
+O DataFrame completo só é montado sob demanda (`frame`) e fica em cache até o próximo append da tabela.
+As colunas numéricas do DataFrame devolvido são views somente-leitura dos buffers, sem cópia.
+
+Tabelas fora do conjunto `retain` (as que nenhum gerador lê) não guardam linhas: o store só conta quantas
+linhas já foram produzidas, e o conteúdo fica a cargo do `IncrementalParquetWriter`.
+
+`clever_concat` e os kernels Cython de `fast_concat` passam a ser um detalhe interno da compactação dos chunks,
+e não algo executado sobre o histórico inteiro a cada tick.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from src.initialization.schema import conform
+from src.initialization.vocabularies import Vocabulary
+from src.iteration.cython.fast_concat import (
+        concat_int8, concat_int16, concat_int32,
+        concat_int64, concat_float32, concat_float64
+    )
+
+# Tipos (numpy.dtype.kind) que podem viver em um buffer contíguo
+BUFFER_KINDS = 'biuf'
+
+
+def clever_concat(arr1, arr2):
+    """
+    Concatena dois arrays escolhendo o kernel mais rápido para o dtype.
+
+    Arrays grandes de tipos numéricos usam os kernels paralelos de `fast_concat`;
+    categóricos são unidos com `union_categoricals`; o restante cai em `np.concatenate`.
+    """
+    if isinstance(arr1, pd.Categorical) and isinstance(arr2, pd.Categorical):
+        return union_categoricals([arr1, arr2], ignore_order=True)
+    if isinstance(arr1, pd.Categorical) or isinstance(arr2, pd.Categorical):
+        return np.concatenate((np.asarray(arr1, dtype=object), np.asarray(arr2, dtype=object)), axis=0)
+    if len(arr1) < 2_000_000 or len(arr2) < 2_000_000 or arr1.dtype != arr2.dtype:
+        return np.concatenate((arr1, arr2), axis=0)
+    match arr1.dtype:
+        case 'int8':
+            return concat_int8(arr1, arr2)
+        case 'int16':
+            return concat_int16(arr1, arr2)
+        case 'int32':
+            return concat_int32(arr1, arr2)
+        case 'int64':
+            return concat_int64(arr1, arr2)
+        case 'float32':
+            return concat_float32(arr1, arr2)
+        case 'float64':
+            return concat_float64(arr1, arr2)
+        case _:
+            return np.concatenate((arr1, arr2), axis=0)
+
+
+def _column_values(series: pd.Series):
+    """Retorna os valores de uma coluna sem passar por conversões do pandas."""
+    values = series.array
+    if isinstance(values, pd.Categorical):
+        return values
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy(copy=False)
+    return values
+
+
+def _is_buffer_dtype(values) -> bool:
+    return isinstance(values, np.ndarray) and values.dtype.kind in BUFFER_KINDS
+
+
+class _BufferColumn:
+    """Coluna numérica em um buffer NumPy com capacidade que dobra ao encher."""
+
+    def __init__(self, values: np.ndarray, initial_capacity: int):
+        capacity = max(initial_capacity, len(values))
+        self.buffer = np.empty(capacity, dtype=values.dtype)
+        self.buffer[:len(values)] = values
+        self.size = len(values)
+
+    @property
+    def dtype(self):
+        return self.buffer.dtype
+
+    def accepts(self, values) -> bool:
+        return _is_buffer_dtype(values)
+
+    def append(self, values: np.ndarray):
+        new_size = self.size + len(values)
+        dtype = np.result_type(self.buffer.dtype, values.dtype)
+        if new_size > self.buffer.shape[0] or dtype != self.buffer.dtype:
+            capacity = self.buffer.shape[0]
+            while capacity < new_size:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=dtype)
+            grown[:self.size] = self.buffer[:self.size]
+            self.buffer = grown
+        self.buffer[self.size:new_size] = values
+        self.size = new_size
+
+    def values(self) -> np.ndarray:
+        view = self.buffer[:self.size]
+        view.flags.writeable = False
+        return view
+
+    def nbytes(self) -> int:
+        return self.buffer.nbytes
+
+
+class _ChunkedColumn:
+    """Coluna não numérica guardada como uma lista de chunks imutáveis, compactada sob demanda."""
+
+    def __init__(self, values):
+        self.compacted = values
+        self.pending = []
+
+    @property
+    def dtype(self):
+        return self.compacted.dtype
+
+    def accepts(self, values) -> bool:
+        return True
+
+    def append(self, values):
+        self.pending.append(values)
+
+    def values(self):
+        if self.pending:
+            pending = self.pending[0]
+            for chunk in self.pending[1:]:
+                pending = clever_concat(pending, chunk)
+            self.compacted = clever_concat(self.compacted, pending)
+            self.pending = []
+        return self.compacted
+
+    def nbytes(self) -> int:
+        return sum(getattr(chunk, 'nbytes', 0) for chunk in [self.compacted, *self.pending])
+
+
+class _CodesColumn:
+    """Coluna categórica sobre um vocabulário global: só os códigos vivem em um buffer numérico."""
+
+    def __init__(self, vocabulary: Vocabulary, values, initial_capacity: int):
+        self.vocabulary = vocabulary
+        self.codes = _BufferColumn(vocabulary.encode(values), initial_capacity)
+
+    @property
+    def dtype(self):
+        return self.vocabulary.dtype
+
+    def accepts(self, values) -> bool:
+        return True
+
+    def append(self, values):
+        self.codes.append(self.vocabulary.encode(values))
+
+    def values(self) -> pd.Categorical:
+        return self.vocabulary.categorical(self.codes.values())
+
+    def nbytes(self) -> int:
+        return self.codes.nbytes()
+
+
+class TableStore:
+    """
+    Conjunto de tabelas append-only indexadas pelo nome lógico (as chaves de `TABLE_PATHS`).
+
+    Parâmetros:
+    - tables (dict): DataFrames iniciais (por exemplo, os parquets carregados do disco).
+    - initial_capacity (int): Capacidade inicial dos buffers numéricos.
+    - retain (set, opcional): Tabelas cujas linhas ficam em memória. Por padrão, todas.
+    - initial_rows (dict, opcional): Linhas já existentes (em disco) das tabelas não retidas.
+    - schemas (dict, opcional): Registro de esquemas (ver `src.initialization.schema.SCHEMAS`). As tabelas
+      registradas são convertidas para os dtypes do esquema antes de cada append, de modo que os buffers
+      nunca são promovidos e as colunas nunca caem em arrays de objetos.
+    """
+
+    def __init__(
+        self,
+        tables: dict,
+        initial_capacity: int = 1024,
+        retain: set = None,
+        initial_rows: dict = None,
+        schemas: dict = None
+    ):
+        self.initial_capacity = initial_capacity
+        self.schemas = schemas or {}
+        self.retain = set(tables) if retain is None else set(retain)
+        self._retain_all = retain is None
+        self.concat_time = 0.0
+        self.frame_time = 0.0
+        self._empty = {}
+        self._columns = {}
+        self._num_rows = {}
+        self._frames = {}
+        for name, df in tables.items():
+            df = self._conform(name, df)
+            self._empty[name] = df.iloc[:0]
+            self._columns[name] = None
+            self._num_rows[name] = 0 if name in self.retain else (initial_rows or {}).get(name, 0)
+            self.append(name, df)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._num_rows
+
+    def names(self) -> list:
+        return list(self._num_rows)
+
+    def is_retained(self, name: str) -> bool:
+        return name in self.retain
+
+    def num_rows(self, name: str) -> int:
+        """Número de linhas da tabela, sem montar o DataFrame."""
+        return self._num_rows[name]
+
+    def append(self, name: str, df: pd.DataFrame):
+        """
+        Anexa as linhas de `df` ao final da tabela em O(linhas novas) amortizado.
+
+        O esquema (colunas e ordem) é definido pelo primeiro DataFrame não vazio recebido;
+        chunks seguintes precisam conter essas colunas.
+        """
+        df = self._conform(name, df)
+        if name not in self._num_rows:
+            self._empty[name] = df.iloc[:0]
+            self._columns[name] = None
+            self._num_rows[name] = 0
+            if self._retain_all:
+                self.retain.add(name)
+        if df.empty:
+            return
+        if name not in self.retain:
+            self._num_rows[name] += df.shape[0]
+            return
+
+        start = time.time()
+        columns = self._columns[name]
+        if columns is None:
+            schema = self.schemas.get(name, {})
+            self._columns[name] = {
+                col: self._new_column(_column_values(df[col]), schema.get(col))
+                for col in df.columns
+            }
+        else:
+            for col, column in columns.items():
+                values = _column_values(df[col])
+                if not column.accepts(values):
+                    column = _ChunkedColumn(column.values())
+                    columns[col] = column
+                column.append(values)
+        self._num_rows[name] += df.shape[0]
+        self._frames.pop(name, None)
+        self.concat_time += time.time() - start
+
+    def append_all(self, new_tables: dict):
+        """Anexa um dicionário {nome: DataFrame} de linhas novas."""
+        for name, df in new_tables.items():
+            self.append(name, df)
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """
+        Retorna a tabela inteira como DataFrame, compactando os chunks pendentes se necessário.
+
+        As colunas numéricas são views somente-leitura dos buffers internos; quem precisar
+        modificar o resultado deve fazer `.copy()`.
+        """
+        if name not in self.retain:
+            raise ValueError(f"A tabela '{name}' não é mantida em memória.")
+        cached = self._frames.get(name)
+        if cached is not None:
+            return cached
+        columns = self._columns[name]
+        if columns is None:
+            return self._empty[name]
+
+        start = time.time()
+        df = pd.DataFrame({col: column.values() for col, column in columns.items()}, copy=False)
+        self._frames[name] = df
+        self.frame_time += time.time() - start
+        return df
+
+    def frames(self) -> dict:
+        """Retorna todas as tabelas mantidas em memória como DataFrames."""
+        return {name: self.frame(name) for name in self._num_rows if name in self.retain}
+
+    def nbytes(self) -> dict:
+        """Memória reservada por tabela (incluindo a capacidade ociosa dos buffers)."""
+        return {
+            name: sum(column.nbytes() for column in (columns or {}).values())
+            for name, columns in self._columns.items()
+        }
+
+    def _conform(self, name: str, df: pd.DataFrame) -> pd.DataFrame:
+        if name not in self.schemas:
+            return df
+        return conform(name, df, self.schemas)
+
+    def _new_column(self, values, dtype=None):
+        if isinstance(dtype, Vocabulary):
+            return _CodesColumn(dtype, values, self.initial_capacity)
+        if _is_buffer_dtype(values):
+            return _BufferColumn(values, self.initial_capacity)
+        return _ChunkedColumn(values)
@@ -0,0 +1,242 @@
+"""
+Module: cache
+-------------
+
+Cache de recomendações por usuário, invalidado quando o perfil muda.
+
+Quando o catálogo candidato persiste entre chamadas e os mesmos usuários voltam a pedir recomendações (por
+exemplo, em um serviço de consultas), muitos deles não assistiram nem curtiram nada desde a última. O cache
+guarda, por UserID, o top-n calculado, a versão do perfil (`ProfileStore.versions`) usada no cálculo, a
+categoria dominante, a pontuação do n-ésimo item e o maior ContentID entre os candidatos da época
+(`watermark`).
+
+Uma entrada só é servida se:
+- a versão do perfil não mudou (nenhuma visualização ou curtida nova);
+- a categoria dominante é a mesma;
+- todos os conteúdos guardados ainda estão entre os candidatos da chamada;
+- nenhum candidato novo da categoria (ContentID acima do `watermark`) supera o n-ésimo item: só esses
+  conteúdos são pontuados (ver `category_index.category_bounds`), e a maior pontuação não pode passar da
+  guardada. Candidatos novos têm ContentIDs maiores, então um empate não os coloca à frente.
+
+O tamanho é limitado: ao passar de `capacity`, as entradas usadas há mais tempo (LRU, pelo relógio de
+acessos) são descartadas até sobrar `EVICT_TO` da capacidade. Os contadores `hits`, `misses`,
+`invalidations` e `evictions` servem para dimensionar o cache.
+
+O laço de ticks da simulação não usa o cache: a cada tick, quem assiste são os usuários criados no tick (ainda
+sem curtidas) e os candidatos são os conteúdos do tick, então nenhuma entrada voltaria a ser servida.
+`state`/`from_state` guardam e recriam o cache com o mesmo conteúdo e os mesmos contadores.
+"""
+
+import numpy as np
+
+# Entradas guardadas por padrão
+DEFAULT_CAPACITY = 1_000_000
+
+# Fração da capacidade mantida depois de uma rodada de descarte
+EVICT_TO = 0.9
+
+
+class RecommendationCache:
+    """
+    Cache LRU de top-n por usuário.
+
+    Parâmetros:
+    - n (int): Número de recomendações por entrada.
+    - capacity (int): Número máximo de entradas.
+    """
+
+    def __init__(self, n: int, capacity: int = DEFAULT_CAPACITY):
+        self.n = n
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self._clock = 0
+
+        # UserIDs ordenados -> posição nos arrays das entradas
+        self._keys = np.empty(0, dtype=np.int64)
+        self._slots = np.empty(0, dtype=np.int64)
+        self._recommendations = np.empty((0, n), dtype=np.int32)
+        self._versions = np.empty(0, dtype=np.int64)
+        self._categories = np.empty(0, dtype=np.int64)
+        self._thresholds = np.empty(0, dtype=np.int64)
+        self._filled = np.empty(0, dtype=np.int64)
+        self._watermarks = np.empty(0, dtype=np.int64)
+        self._last_used = np.empty(0, dtype=np.int64)
+        self._num_slots = 0
+
+    def __len__(self) -> int:
+        return self._keys.shape[0]
+
+    def stats(self) -> dict:
+        """Contadores do cache, para dimensionamento."""
+        requests = self.hits + self.misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+    def watermarks(self, user_ids, versions, categories) -> np.ndarray:
+        """
+        Maior ContentID candidato quando a entrada de cada usuário foi calculada, ou -1 se não há entrada
+        com a mesma versão e a mesma categoria (e ela não tem como ser servida).
+        """
+        slots = self._find(np.asarray(user_ids, dtype=np.int64))
+        if len(self) == 0:
+            return np.full(slots.shape[0], -1, dtype=np.int64)
+        safe = np.maximum(slots, 0)
+        current = (slots >= 0) & (self._versions[safe] == versions) & (self._categories[safe] == categories)
+        return np.where(current, self._watermarks[safe], -1)
+
+    def get(self, user_ids, versions, categories, bounds, candidates: np.ndarray = None) -> tuple:
+        """
+        Procura as recomendações de um lote de usuários distintos.
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários.
+        - versions (np.ndarray): Versão atual do perfil de cada usuário.
+        - categories (np.ndarray): Categoria dominante atual de cada usuário.
+        - bounds (np.ndarray): Maior pontuação de um candidato criado depois do `watermark` da entrada.
+        - candidates (np.ndarray, opcional): ContentIDs candidatos, ordenados. Entradas com algum conteúdo
+          fora deles não são servidas.
+
+        Retorno:
+        - tuple:
+            - hit (np.ndarray): Máscara dos usuários servidos pelo cache.
+            - recommendations (np.ndarray): `(hits × n)` int32, na ordem dos usuários com `hit`. As posições
+              que eram fallback no cálculo guardado vêm como -1, para receberem o fallback atual.
+        """
+        self._clock += 1
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        slots = self._find(user_ids)
+        found = slots >= 0
+        safe = np.maximum(slots, 0)
+        hit = found.copy()
+        if len(self):
+            hit &= (
+                (self._versions[safe] == versions)
+                & (self._categories[safe] == categories)
+                & (bounds <= self._thresholds[safe])
+            )
+        if candidates is not None and hit.any():
+            stored = self._stored(slots[hit])
+            positions = np.minimum(np.searchsorted(candidates, stored), max(candidates.shape[0] - 1, 0))
+            present = (candidates[positions] == stored) if candidates.shape[0] else np.zeros(stored.shape, dtype=bool)
+            hit[hit] = (present | (stored < 0)).all(axis=1)
+        self.hits += int(hit.sum())
+        self.misses += int(user_ids.shape[0] - hit.sum())
+        self.invalidations += int((found & ~hit).sum())
+        self._last_used[slots[hit]] = self._clock
+        return hit, self._stored(slots[hit])
+
+    def put(self, user_ids, versions, categories, recommendations, scores, watermark: int = -1):
+        """
+        Guarda (ou substitui) as recomendações de um lote de usuários distintos.
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários.
+        - versions (np.ndarray): Versão do perfil usada no cálculo.
+        - categories (np.ndarray): Categoria dominante usada no cálculo.
+        - recommendations (np.ndarray): `(usuários × n)` ContentIDs.
+        - scores (np.ndarray): `(usuários × n)` pontuações (0 nas posições de fallback).
+        - watermark (int): Maior ContentID entre os candidatos do cálculo.
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        if user_ids.shape[0] == 0:
+            return
+        # Limiar: pontuação do n-ésimo item (0 se o top não foi preenchido, e qualquer candidato positivo entra)
+        scores = np.asarray(scores, dtype=np.int64)
+        thresholds = scores[:, -1]
+        slots = self._find(user_ids)
+        new = slots < 0
+        if new.any():
+            count = int(new.sum())
+            start = self._num_slots
+            slots[new] = np.arange(start, start + count)
+            self._num_slots += count
+            self._reserve(self._num_slots)
+            positions = np.searchsorted(self._keys, user_ids[new])
+            self._keys = np.insert(self._keys, positions, user_ids[new])
+            self._slots = np.insert(self._slots, positions, slots[new])
+
+        self._recommendations[slots] = recommendations
+        self._versions[slots] = versions
+        self._categories[slots] = categories
+        self._thresholds[slots] = thresholds
+        self._filled[slots] = (scores > 0).sum(axis=1)
+        self._watermarks[slots] = watermark
+        self._last_used[slots] = self._clock
+        if len(self) > self.capacity:
+            self._evict(int(self.capacity * EVICT_TO))
+
+    def state(self) -> dict:
+        """Estado completo do cache como arrays (para checkpoints)."""
+        slots = self._slots
+        return {
+            "n": np.int64(self.n),
+            "capacity": np.int64(self.capacity),
+            "counters": np.array([self.hits, self.misses, self.invalidations, self.evictions, self._clock]),
+            "keys": self._keys,
+            "recommendations": self._recommendations[slots],
+            "versions": self._versions[slots],
+            "categories": self._categories[slots],
+            "thresholds": self._thresholds[slots],
+            "filled": self._filled[slots],
+            "watermarks": self._watermarks[slots],
+            "last_used": self._last_used[slots],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'RecommendationCache':
+        """Recria um cache salvo por `state`, com o mesmo conteúdo e os mesmos contadores."""
+        cache = cls(int(state["n"]), int(state["capacity"]))
+        cache.hits, cache.misses, cache.invalidations, cache.evictions, cache._clock = (
+            int(value) for value in state["counters"]
+        )
+        cache._keys = np.asarray(state["keys"], dtype=np.int64)
+        cache._num_slots = cache._keys.shape[0]
+        cache._slots = np.arange(cache._num_slots, dtype=np.int64)
+        cache._recommendations = np.asarray(state["recommendations"], dtype=np.int32)
+        for name in ('versions', 'categories', 'thresholds', 'filled', 'watermarks', 'last_used'):
+            setattr(cache, '_' + name, np.asarray(state[name], dtype=np.int64))
+        return cache
+
+    def _stored(self, slots: np.ndarray) -> np.ndarray:
+        """Recomendações guardadas, com -1 nas posições que eram fallback."""
+        positions = np.arange(self.n)
+        return np.where(positions < self._filled[slots, None], self._recommendations[slots], -1).astype(np.int32)
+
+    def _find(self, user_ids: np.ndarray) -> np.ndarray:
+        if len(self) == 0:
+            return np.full(user_ids.shape[0], -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._keys, user_ids), len(self) - 1)
+        return np.where(self._keys[positions] == user_ids, self._slots[positions], -1)
+
+    def _reserve(self, size: int):
+        """Garante espaço para `size` entradas, dobrando a capacidade dos arrays."""
+        current = self._versions.shape[0]
+        if size <= current:
+            return
+        grow = max(size, 2 * current, 1024) - current
+        self._recommendations = np.concatenate((self._recommendations, np.zeros((grow, self.n), dtype=np.int32)))
+        for name in ('_versions', '_categories', '_thresholds', '_filled', '_watermarks', '_last_used'):
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros(grow, dtype=np.int64))))
+
+    def _evict(self, keep: int):
+        """Mantém as `keep` entradas usadas mais recentemente e compacta os arrays."""
+        order = np.argsort(-self._last_used[self._slots], kind='stable')
+        kept = np.sort(order[:keep])
+        self.evictions += len(self) - kept.shape[0]
+        old_slots = self._slots[kept]
+        self._keys = self._keys[kept]
+        self._slots = np.arange(kept.shape[0], dtype=np.int64)
+        self._num_slots = kept.shape[0]
+        self._recommendations = self._recommendations[old_slots]
+        for name in ('_versions', '_categories', '_thresholds', '_filled', '_watermarks', '_last_used'):
+            setattr(self, name, getattr(self, name)[old_slots])
@@ -0,0 +1,123 @@
+"""
+Module: category_index
+----------------------
+
+Índice de candidatos por categoria, pré-ordenado por uma pontuação estática.
+
+Os conteúdos de cada `CONTCategory` ficam em uma faixa contígua de arrays int32, ordenados pelo número de tags
+(decrescente) e, no empate, pelo ContentID. Como a pontuação de um conteúdo para um usuário é
+`perfil · tags`, ela nunca passa de `max(perfil) × número de tags`: percorrendo a faixa nessa ordem, a busca
+pode parar assim que esse limite ficar abaixo do n-ésimo melhor resultado já encontrado, sem pontuar o
+restante da categoria.
+
+A exclusão de conteúdos já vistos não monta conjuntos: cada ContentID visto é convertido na sua posição
+(`rank`) dentro da faixa da categoria, e o teste de pertinência vira uma máscara vetorizada sobre essas posições.
+"""
+
+import numpy as np
+
+# Células (usuários × conteúdos) pontuadas por bloco em `category_bounds`
+MAX_BOUND_CELLS = 1 << 22
+
+
+class CategoryIndex:
+    """
+    Faixas de candidatos por categoria, em ordem decrescente de limite de pontuação.
+
+    Parâmetros:
+    - tag_matrix (engine.TagMatrix): Matriz de tags (linhas ordenadas por categoria e ContentID).
+    """
+
+    def __init__(self, tag_matrix):
+        self.tag_matrix = tag_matrix
+        self.category_offsets = tag_matrix.category_offsets
+        self.tag_counts = tag_matrix.matrix.sum(axis=1, dtype=np.int32)
+
+        # Dentro de cada categoria: mais tags primeiro; no empate, a ordem por ContentID da própria matriz
+        rows = np.arange(len(tag_matrix), dtype=np.int32)
+        self.ranked_rows = np.lexsort((rows, -self.tag_counts, tag_matrix.categories)).astype(np.int32)
+        self.content_ids = tag_matrix.content_ids[self.ranked_rows]
+        self.bounds = self.tag_counts[self.ranked_rows]
+
+        # Posição (dentro da faixa da categoria) de cada linha da matriz
+        self.rank_of_row = np.empty(len(tag_matrix), dtype=np.int32)
+        block_starts = self.category_offsets[tag_matrix.categories[self.ranked_rows].astype(np.int64)]
+        self.rank_of_row[self.ranked_rows] = np.arange(len(tag_matrix), dtype=np.int32) - block_starts
+
+    def block(self, category: int) -> slice:
+        """Faixa da categoria em `ranked_rows`, `content_ids` e `bounds`."""
+        return slice(int(self.category_offsets[category]), int(self.category_offsets[category + 1]))
+
+    def seen_ranks(
+        self,
+        category: int,
+        seen_starts: np.ndarray,
+        seen_ends: np.ndarray,
+        seen_contents: np.ndarray
+    ) -> tuple:
+        """
+        Conteúdos já vistos que pertencem a uma categoria, como pares (usuário do lote, posição na faixa).
+
+        Parâmetros:
+        - category (int): Categoria candidata.
+        - seen_starts, seen_ends (np.ndarray): Faixa de `seen_contents` de cada usuário do lote.
+        - seen_contents (np.ndarray): ContentIDs vistos, agrupados por usuário.
+
+        Retorno:
+        - tuple: (users, ranks), ordenados por usuário.
+        """
+        counts = seen_ends - seen_starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+        users = np.repeat(np.arange(counts.shape[0]), counts)
+        flat = np.arange(total) + np.repeat(seen_starts - (np.cumsum(counts) - counts), counts)
+        rows = self.tag_matrix.rows(seen_contents[flat])
+        in_category = rows >= 0
+        in_category[in_category] = self.tag_matrix.categories[rows[in_category]] == category
+        return users[in_category], self.rank_of_row[rows[in_category]]
+
+
+def category_bounds(
+    index: CategoryIndex,
+    profiles: np.ndarray,
+    categories: np.ndarray,
+    after: np.ndarray
+) -> np.ndarray:
+    """
+    Maior pontuação entre os conteúdos da categoria de cada usuário criados depois de `after`
+    (0 se não há nenhum, ou para categoria -1).
+
+    As linhas da matriz de tags estão ordenadas por ContentID dentro de cada categoria, então os conteúdos
+    novos de um usuário são o final da faixa da categoria e só eles são pontuados.
+
+    Parâmetros:
+    - index (CategoryIndex): Índice de candidatos.
+    - profiles (np.ndarray): Perfis `(usuários × 16)`.
+    - categories (np.ndarray): Categoria de cada usuário.
+    - after (np.ndarray): Maior ContentID já considerado, por usuário.
+    """
+    tag_matrix = index.tag_matrix
+    best = np.zeros(profiles.shape[0], dtype=np.int64)
+    for category in np.unique(categories[categories >= 0]):
+        block = index.block(int(category))
+        users = np.flatnonzero(categories == category)
+        positions = block.start + np.searchsorted(tag_matrix.content_ids[block], after[users], side='right')
+        users, positions = users[positions < block.stop], positions[positions < block.stop]
+        if users.shape[0] == 0:
+            continue
+        first = int(positions.min())
+        columns = np.arange(first, block.stop)
+        new_tags = tag_matrix.matrix[first:block.stop].T.astype(np.int64)
+        step = max(1, MAX_BOUND_CELLS // columns.shape[0])
+        for start in range(0, users.shape[0], step):
+            chunk = slice(start, start + step)
+            scores = profiles[users[chunk]].astype(np.int64) @ new_tags
+            scores[columns[None, :] < positions[chunk, None]] = 0
+            best[users[chunk]] = scores.max(axis=1)
+    return best
+
+
+def score_bounds(profiles: np.ndarray) -> np.ndarray:
+    """Maior peso de tag de cada perfil: multiplicado pelo número de tags, limita a pontuação de um conteúdo."""
+    return profiles.max(axis=1).astype(np.int64)
@@ -0,0 +1,311 @@
+"""
+Module: engine
+--------------
+
+Motor vetorizado do recomendador por tags.
+
+O conteúdo é representado por uma matriz densa `(n_conteúdos × 16)` de `uint8` com a contagem de cada tag
+(as tags vão de 1 a 15, e a coluna é o próprio valor da tag). O perfil de cada usuário é uma linha
+`(16,)` de `int32`: cada conteúdo assistido soma 1 às suas tags e cada conteúdo curtido soma 2.
+
+A pontuação de um conteúdo para um usuário é o produto escalar entre o perfil e a linha de tags do conteúdo, ou
+seja, `sum(seen_tags[tags])` do laço original. Os usuários são agrupados pela categoria dominante das suas
+curtidas e, para cada categoria, um lote de usuários é pontuado com produtos de matrizes contra os candidatos
+daquela categoria, na ordem do `CategoryIndex` e com parada antecipada. Conteúdos já vistos são mascarados e o
+top-n sai de um `argpartition` em lote.
+
+Empates são resolvidos pelo menor ContentID, de modo que o resultado é determinístico.
+"""
+
+import numpy as np
+
+from src.recommendation.category_index import CategoryIndex, score_bounds
+
+# Colunas da matriz de tags (tags de 1 a 15; a coluna 0 fica sem uso)
+TAG_SLOTS = 16
+
+# Número máximo de células da matriz de pontuação de um lote (usuários × candidatos)
+MAX_BATCH_CELLS = 1 << 22
+
+# Candidatos pontuados por vez antes de testar a parada antecipada
+CANDIDATE_CHUNK = 16384
+
+
+class TagMatrix:
+    """
+    Matriz conteúdo × tag, com os conteúdos ordenados por (categoria, ContentID).
+
+    Parâmetros:
+    - content_ids (np.ndarray): IDs dos conteúdos.
+    - categories (np.ndarray): Categoria de cada conteúdo.
+    - tag_content_ids (np.ndarray): ContentID de cada linha de CONTENT_CONTTag.
+    - tags (np.ndarray): Tag de cada linha de CONTENT_CONTTag.
+    """
+
+    def __init__(self, content_ids, categories, tag_content_ids, tags):
+        content_ids = np.asarray(content_ids, dtype=np.int32)
+        categories = np.asarray(categories, dtype=np.int8)
+        order = np.lexsort((content_ids, categories))
+        self.content_ids = content_ids[order]
+        self.categories = categories[order]
+
+        # ContentIDs em ordem crescente e a linha de cada um, para localizar linhas a partir de ContentIDs
+        self._id_order = np.argsort(self.content_ids, kind='stable')
+        self.sorted_ids = self.content_ids[self._id_order]
+
+        self.matrix = np.zeros((self.content_ids.shape[0], TAG_SLOTS), dtype=np.uint8)
+        rows = self.rows(tag_content_ids)
+        tags = np.asarray(tags, dtype=np.int64)
+        known = rows >= 0
+        np.add.at(self.matrix, (rows[known], tags[known]), 1)
+
+        # Blocos contíguos por categoria: [category_offsets[c], category_offsets[c + 1])
+        self.category_offsets = np.searchsorted(self.categories, np.arange(TAG_SLOTS + 1), side='left')
+
+    @classmethod
+    def from_tables(cls, content, content_tags) -> 'TagMatrix':
+        """Monta a matriz a partir de CONTENT e CONTENT_CONTTag."""
+        return cls(
+            content["ContentID"].to_numpy(),
+            content["CONTCategory"].to_numpy(),
+            content_tags["ContentID"].to_numpy(),
+            content_tags["CONTTag"].to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return self.content_ids.shape[0]
+
+    def rows(self, content_ids) -> np.ndarray:
+        """Linha de cada ContentID na matriz (-1 para conteúdos desconhecidos)."""
+        content_ids = np.asarray(content_ids, dtype=np.int32)
+        if len(self) == 0:
+            return np.full(content_ids.shape[0], -1, dtype=np.int64)
+        positions = np.searchsorted(self.sorted_ids, content_ids)
+        positions = np.minimum(positions, len(self) - 1)
+        found = self.sorted_ids[positions] == content_ids
+        return np.where(found, self._id_order[positions], -1)
+
+    def category_block(self, category: int) -> slice:
+        """Faixa de linhas dos conteúdos de uma categoria."""
+        return slice(int(self.category_offsets[category]), int(self.category_offsets[category + 1]))
+
+
+def group_offsets(keys: np.ndarray, num_groups: int) -> np.ndarray:
+    """Offsets CSR de `keys` já ordenadas, com valores em [0, num_groups)."""
+    return np.searchsorted(keys, np.arange(num_groups + 1), side='left')
+
+
+def user_profiles(
+    tag_matrix: TagMatrix,
+    num_users: int,
+    watched_users: np.ndarray,
+    watched_contents: np.ndarray,
+    liked_users: np.ndarray,
+    liked_contents: np.ndarray
+) -> tuple:
+    """
+    Calcula perfis de tags, categoria dominante e conteúdos vistos de um lote de usuários.
+
+    Parâmetros:
+    - tag_matrix (TagMatrix): Matriz de tags dos conteúdos conhecidos.
+    - num_users (int): Número de usuários do lote.
+    - watched_users, watched_contents (np.ndarray): Pares (posição do usuário no lote, ContentID) assistidos.
+    - liked_users, liked_contents (np.ndarray): Pares (posição do usuário no lote, ContentID) curtidos.
+
+    Retorno:
+    - tuple:
+        - profiles (np.ndarray): `(num_users × 16)` int32 com a contagem de tags (assistido = 1, curtido = 2).
+        - main_categories (np.ndarray): Categoria mais curtida de cada usuário (-1 sem curtidas conhecidas).
+        - has_likes (np.ndarray): Se o usuário tem alguma curtida.
+        - seen_starts, seen_ends, seen_contents (np.ndarray): Conteúdos vistos (assistidos ou curtidos),
+          agrupados por usuário, e a faixa de cada usuário.
+    """
+    watched_users = np.asarray(watched_users, dtype=np.int64)
+    liked_users = np.asarray(liked_users, dtype=np.int64)
+    watched_rows = tag_matrix.rows(watched_contents)
+    liked_rows = tag_matrix.rows(liked_contents)
+
+    profiles = np.zeros((num_users, TAG_SLOTS), dtype=np.int32)
+    for users, rows, weight in ((watched_users, watched_rows, 1), (liked_users, liked_rows, 2)):
+        known = rows >= 0
+        accumulate_rows(profiles, users[known], tag_matrix.matrix[rows[known]].astype(np.int32) * weight)
+
+    liked_known = liked_rows >= 0
+    category_counts = np.bincount(
+        liked_users[liked_known] * TAG_SLOTS + tag_matrix.categories[liked_rows[liked_known]],
+        minlength=num_users * TAG_SLOTS
+    ).reshape(num_users, TAG_SLOTS)
+    main_categories = np.where(category_counts.any(axis=1), category_counts.argmax(axis=1), -1)
+    has_likes = np.bincount(liked_users, minlength=num_users)[:num_users] > 0
+
+    seen_users = np.concatenate((watched_users, liked_users))
+    seen_contents = np.concatenate((
+        np.asarray(watched_contents, dtype=np.int32), np.asarray(liked_contents, dtype=np.int32)
+    ))
+    order = np.argsort(seen_users, kind='stable')
+    seen_users, seen_contents = seen_users[order], seen_contents[order]
+    seen_offsets = group_offsets(seen_users, num_users)
+    return profiles, main_categories, has_likes, seen_offsets[:-1], seen_offsets[1:], seen_contents
+
+
+def accumulate_rows(target: np.ndarray, users: np.ndarray, values: np.ndarray):
+    """Soma as linhas de `values` em `target[users]` com um único `reduceat` (sem `np.add.at` linha a linha)."""
+    if users.shape[0] == 0:
+        return
+    order = np.argsort(users, kind='stable')
+    users, values = users[order], values[order]
+    starts = np.flatnonzero(np.r_[True, users[1:] != users[:-1]])
+    target[users[starts]] += np.add.reduceat(values, starts, axis=0)
+
+
+def score_category(
+    index: CategoryIndex,
+    category: int,
+    profiles: np.ndarray,
+    seen_starts: np.ndarray,
+    seen_ends: np.ndarray,
+    seen_contents: np.ndarray,
+    n: int
+) -> tuple:
+    """
+    Pontua um lote de usuários contra os candidatos de uma categoria e devolve o top-n de cada um.
+
+    Os candidatos são percorridos em blocos de `CANDIDATE_CHUNK`, na ordem do `CategoryIndex` (limite de
+    pontuação decrescente). Depois de cada bloco, saem do lote os usuários cujo n-ésimo melhor resultado já
+    supera o limite de qualquer candidato restante; o laço termina quando nenhum usuário sobra.
+
+    Parâmetros:
+    - index (CategoryIndex): Índice de candidatos por categoria.
+    - category (int): Categoria dominante dos usuários do lote.
+    - profiles (np.ndarray): Perfis `(usuários do lote × 16)`.
+    - seen_starts, seen_ends (np.ndarray): Faixa de `seen_contents` com os conteúdos vistos de cada usuário do lote.
+    - seen_contents (np.ndarray): ContentIDs vistos, agrupados por usuário.
+    - n (int): Número de recomendações.
+
+    Retorno:
+    - tuple:
+        - top_ids (np.ndarray): `(usuários do lote × k)` ContentIDs, do melhor para o pior (k = min(n, candidatos)).
+        - top_scores (np.ndarray): Pontuação de cada entrada (0 quando não há candidato positivo e não visto).
+    """
+    tag_matrix = index.tag_matrix
+    block = index.block(category)
+    ranked_rows = index.ranked_rows[block]
+    bounds = index.bounds[block]
+    num_candidates = ranked_rows.shape[0]
+    num_users = profiles.shape[0]
+    k = min(n, num_candidates)
+
+    # Chave única por candidato, calculada no próprio produto de matrizes (BLAS, float64 exato para inteiros):
+    # pontuação * num_candidates + desempate, com o desempate favorecendo o menor ContentID
+    weights = np.empty((num_users, TAG_SLOTS + 1), dtype=np.float64)
+    weights[:, :TAG_SLOTS] = profiles * num_candidates
+    weights[:, TAG_SLOTS] = 1
+    tiebreak = block.stop - 1 - ranked_rows
+    max_weights = score_bounds(profiles)
+    seen_users, seen_ranks = index.seen_ranks(category, seen_starts, seen_ends, seen_contents)
+
+    best_keys = np.full((num_users, k), -1.0)
+    best_rows = np.zeros((num_users, k), dtype=np.int64)
+    active = np.arange(num_users)
+    local = np.full(num_users, -1, dtype=np.int64)
+    for start in range(0, num_candidates, CANDIDATE_CHUNK):
+        if start:
+            # Limite da pontuação de qualquer candidato restante; empates ainda podem entrar (menor ContentID)
+            limit = max_weights[active] * bounds[start]
+            nth_keys = best_keys[active].min(axis=1)
+            nth_scores = np.floor_divide(nth_keys, num_candidates)
+            active = active[(limit > 0) & ((nth_keys < 0) | (limit >= nth_scores))]
+            if active.shape[0] == 0:
+                break
+        end = min(start + CANDIDATE_CHUNK, num_candidates)
+        rows = ranked_rows[start:end]
+
+        columns = np.empty((end - start, TAG_SLOTS + 1), dtype=np.float64)
+        columns[:, :TAG_SLOTS] = tag_matrix.matrix[rows]
+        columns[:, TAG_SLOTS] = tiebreak[start:end]
+        keys = weights[active] @ columns.T
+        # Pontuação zero (chave < num_candidates) não entra na recomendação
+        keys[keys < num_candidates] = -1
+
+        # Conteúdos já vistos ficam de fora
+        local[active] = np.arange(active.shape[0])
+        in_chunk = (seen_ranks >= start) & (seen_ranks < end)
+        users = local[seen_users[in_chunk]]
+        hit = users >= 0
+        keys[users[hit], seen_ranks[in_chunk][hit] - start] = -1
+        local[active] = -1
+
+        # Junta o top-n corrente com o bloco e mantém os k maiores (no primeiro bloco não há o que juntar)
+        if start or keys.shape[1] < k:
+            merged_keys = np.concatenate((best_keys[active], keys), axis=1)
+            merged_rows = np.concatenate((best_rows[active], np.broadcast_to(rows, keys.shape)), axis=1)
+        else:
+            merged_keys, merged_rows = keys, np.broadcast_to(rows, keys.shape)
+        width = merged_keys.shape[1]
+        top = np.argpartition(merged_keys, width - k, axis=1)[:, width - k:]
+        best_keys[active] = np.take_along_axis(merged_keys, top, axis=1)
+        best_rows[active] = np.take_along_axis(merged_rows, top, axis=1)
+
+    order = np.argsort(-best_keys, axis=1)
+    top_rows = np.take_along_axis(best_rows, order, axis=1)
+    top_keys = np.take_along_axis(best_keys, order, axis=1)
+    top_scores = np.where(top_keys >= 0, np.floor_divide(top_keys, num_candidates), 0).astype(np.int64)
+    return tag_matrix.content_ids[top_rows], top_scores
+
+
+def recommend_top_n(
+    tag_matrix: TagMatrix,
+    profiles: np.ndarray,
+    main_categories: np.ndarray,
+    has_likes: np.ndarray,
+    seen_starts: np.ndarray,
+    seen_ends: np.ndarray,
+    seen_contents: np.ndarray,
+    n: int,
+    fallback: np.ndarray,
+    index: CategoryIndex = None,
+    return_scores: bool = False
+) -> np.ndarray:
+    """
+    Top-n de cada usuário, com os mesmos critérios do laço original de `recommendate`.
+
+    Usuários sem curtidas (ou sem categoria dominante conhecida) recebem `fallback`. Quem tem menos de n
+    candidatos com pontuação positiva mantém o fallback nas posições restantes.
+
+    `fallback` é um único vetor de n ContentIDs para todos os usuários ou uma matriz `(num_users × n)`
+    com o fallback de cada um (por exemplo, as tendências da sua categoria, ver `popularity.PopularityStore`).
+
+    Parâmetros:
+    - seen_starts, seen_ends (np.ndarray): Faixa de `seen_contents` com os conteúdos vistos de cada usuário.
+    - index (CategoryIndex, opcional): Índice de candidatos já montado para `tag_matrix`.
+    - return_scores (bool): Devolve também a pontuação de cada recomendação.
+    - Os demais como em `user_profiles` e `score_category`.
+
+    Retorno:
+    - np.ndarray: `(num_users × n)` int32 com os ContentIDs recomendados, do melhor para o pior.
+      Com `return_scores`, a tupla (recomendações, pontuações), com pontuação 0 nas posições de fallback.
+    """
+    if index is None:
+        index = CategoryIndex(tag_matrix)
+    num_users = profiles.shape[0]
+    result = np.array(np.broadcast_to(np.asarray(fallback, dtype=np.int32), (num_users, n)))
+    scores = np.zeros((num_users, n), dtype=np.int64)
+    eligible = has_likes & (main_categories >= 0)
+
+    for category in np.unique(main_categories[eligible]):
+        num_candidates = tag_matrix.category_offsets[category + 1] - tag_matrix.category_offsets[category]
+        if num_candidates == 0:
+            continue
+        users = np.flatnonzero(eligible & (main_categories == category))
+        batch_size = max(1, MAX_BATCH_CELLS // min(num_candidates, CANDIDATE_CHUNK))
+        for start in range(0, users.shape[0], batch_size):
+            batch = users[start:start + batch_size]
+            top_ids, top_scores = score_category(
+                index, int(category), profiles[batch],
+                seen_starts[batch], seen_ends[batch], seen_contents, n
+            )
+            k = top_ids.shape[1]
+            current = result[batch, :k]
+            result[batch, :k] = np.where(top_scores > 0, top_ids, current)
+            scores[batch, :k] = top_scores
+    return (result, scores) if return_scores else result
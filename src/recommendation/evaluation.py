@@ -0,0 +1,245 @@
+"""
+Module: evaluation
+------------------
+
+Avaliação offline de recomendadores: qualidade e latência, lado a lado.
+
+O histórico é dividido no tempo. As visualizações (UWATCHINGCONT) são separadas por `UWatchCONTDateTime`;
+as interações não têm data, mas o UINTID cresce com o tempo, então USERINTERACTION e UCONTINT são separados
+pelo UINTID. O recomendador recebe apenas a janela de treino e é consultado para os usuários que têm
+atividade na janela de teste. Os relevantes de cada usuário são os conteúdos assistidos (duração positiva)
+ou curtidos no teste.
+
+Qualquer função com a assinatura de `recommendate(n, users, content, uwatchingcont, content_tags,
+userinteraction, ucontint, comment, livecomment, videocomment, shortcomment, rng=...)` pode ser avaliada:
+o resultado `(usuários · n × 3)` com [usuário, conteúdo, rank] é convertido em uma matriz `(usuários × k)`.
+
+As métricas são calculadas sem laços por usuário: os pares (usuário, conteúdo) viram chaves
+`(UserID << 32) | ContentID`, e os acertos são uma busca binária das chaves recomendadas nas chaves relevantes
+ordenadas. Com isso a avaliação escala para dezenas de milhões de interações.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+# Tipo de interação que conta como curtida (USERINTERACTION.UINTType)
+LIKE = 1
+
+# Usuários consultados por chamada do recomendador (cada chamada é uma amostra de latência)
+BATCH_SIZE = 10_000
+
+# Percentis de latência reportados
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def _pair_keys(user_ids, content_ids) -> np.ndarray:
+    """Chaves `(UserID << 32) | ContentID`."""
+    return (np.asarray(user_ids, dtype=np.int64) << 32) | np.asarray(content_ids, dtype=np.int64)
+
+
+def time_split(tables: dict, test_fraction: float = 0.2) -> tuple:
+    """
+    Divide o histórico em treino e teste pelo tempo.
+
+    Parâmetros:
+    - tables (dict): Tabelas com UWATCHINGCONT, USERINTERACTION e UCONTINT.
+    - test_fraction (float): Fração final do histórico (em data de visualização e em UINTID) usada como teste.
+
+    Retorno:
+    - tuple:
+        - train (dict): `tables` com UWATCHINGCONT, USERINTERACTION e UCONTINT restritas à janela de treino.
+        - relevant (np.ndarray): Chaves `(UserID << 32) | ContentID` ordenadas e únicas dos conteúdos
+          assistidos ou curtidos na janela de teste.
+    """
+    uwatchingcont = tables["UWATCHINGCONT"]
+    watch_times = uwatchingcont["UWatchCONTDateTime"].to_numpy()
+    watch_cut = np.quantile(watch_times, 1 - test_fraction) if watch_times.shape[0] else 0
+    watch_train = watch_times < watch_cut
+
+    userinteraction = tables["USERINTERACTION"]
+    ucontint = tables["UCONTINT"]
+    interaction_ids = userinteraction["UINTID"].to_numpy()
+    interaction_cut = np.quantile(interaction_ids, 1 - test_fraction) if interaction_ids.shape[0] else 0
+    interaction_train = interaction_ids < interaction_cut
+
+    train = dict(tables)
+    train["UWATCHINGCONT"] = uwatchingcont[watch_train]
+    train["USERINTERACTION"] = userinteraction[interaction_train]
+    train["UCONTINT"] = ucontint[ucontint["UINTID"].to_numpy() < interaction_cut]
+
+    # Relevantes: visualizações com duração positiva e curtidas da janela de teste
+    watched = ~watch_train & (uwatchingcont["UWatchDurationCONT"].to_numpy() > 0)
+    watch_keys = _pair_keys(
+        uwatchingcont["UserID"].to_numpy()[watched], uwatchingcont["ContentID"].to_numpy()[watched]
+    )
+    likes = ~interaction_train & (userinteraction["UINTType"].to_numpy() == LIKE)
+    positions = pd.Index(ucontint["UINTID"]).get_indexer(userinteraction["UINTID"].to_numpy()[likes])
+    found = positions >= 0
+    like_keys = _pair_keys(
+        userinteraction["UserID"].to_numpy()[likes][found], ucontint["ContentID"].to_numpy()[positions[found]]
+    )
+    return train, np.unique(np.concatenate((watch_keys, like_keys)))
+
+
+def recommendation_matrix(result: np.ndarray, user_ids: np.ndarray, k: int) -> np.ndarray:
+    """
+    Converte o resultado de um recomendador em uma matriz `(usuários × k)` (-1 nas posições vazias).
+
+    Parâmetros:
+    - result (np.ndarray): Linhas [usuário, conteúdo, rank], com rank a partir de 1.
+    - user_ids (np.ndarray): IDs dos usuários consultados, ordenados e únicos.
+    - k (int): Número de posições.
+    """
+    result = np.asarray(result, dtype=np.int64)
+    matrix = np.full((user_ids.shape[0], k), -1, dtype=np.int64)
+    rows = np.searchsorted(user_ids, result[:, 0])
+    ranks = result[:, 2] - 1
+    keep = (rows < user_ids.shape[0]) & (ranks >= 0) & (ranks < k)
+    keep[keep] = user_ids[rows[keep]] == result[keep, 0]
+    matrix[rows[keep], ranks[keep]] = result[keep, 1]
+    return matrix
+
+
+def ranking_metrics(
+    user_ids: np.ndarray,
+    recommendations: np.ndarray,
+    relevant: np.ndarray,
+    num_contents: int
+) -> dict:
+    """
+    Precision@k, recall@k, NDCG@k e cobertura de uma matriz de recomendações.
+
+    Um conteúdo repetido na lista de um usuário (por exemplo, vindo do fallback) só conta uma vez.
+
+    Parâmetros:
+    - user_ids (np.ndarray): IDs dos usuários, ordenados e únicos (um por linha de `recommendations`).
+    - recommendations (np.ndarray): `(usuários × k)` ContentIDs, do melhor para o pior (-1 = vazio).
+    - relevant (np.ndarray): Chaves `(UserID << 32) | ContentID` relevantes, ordenadas e únicas.
+    - num_contents (int): Número de conteúdos candidatos (denominador da cobertura).
+
+    Retorno:
+    - dict: Médias por usuário de precision, recall e ndcg, e a cobertura do catálogo.
+    """
+    num_users, k = recommendations.shape
+    if num_users == 0:
+        return {"precision": 0.0, "recall": 0.0, "ndcg": 0.0, "coverage": 0.0}
+    user_ids = np.asarray(user_ids, dtype=np.int64)
+    keys = (user_ids[:, None] << 32) | np.maximum(recommendations, 0)
+
+    # Primeira ocorrência de cada conteúdo na lista do usuário
+    order = np.argsort(keys, axis=1, kind='stable')
+    sorted_keys = np.take_along_axis(keys, order, axis=1)
+    first_sorted = np.ones_like(sorted_keys, dtype=bool)
+    first_sorted[:, 1:] = sorted_keys[:, 1:] != sorted_keys[:, :-1]
+    first = np.empty_like(first_sorted)
+    np.put_along_axis(first, order, first_sorted, axis=1)
+
+    hits = first & (recommendations >= 0)
+    if relevant.shape[0]:
+        positions = np.minimum(np.searchsorted(relevant, keys), relevant.shape[0] - 1)
+        hits &= relevant[positions] == keys
+    else:
+        hits[:] = False
+
+    # Relevantes por usuário: faixa das suas chaves em `relevant`
+    num_relevant = np.searchsorted(relevant, (user_ids + 1) << 32) - np.searchsorted(relevant, user_ids << 32)
+    num_hits = hits.sum(axis=1)
+
+    discounts = 1 / np.log2(np.arange(2, k + 2))
+    ideal = np.concatenate(([0.0], np.cumsum(discounts)))[np.minimum(num_relevant, k)]
+    dcg = (hits * discounts).sum(axis=1)
+
+    recommended = np.unique(recommendations[recommendations >= 0])
+    return {
+        "precision": float((num_hits / k).mean()),
+        "recall": float(np.divide(num_hits, num_relevant, out=np.zeros(num_users), where=num_relevant > 0).mean()),
+        "ndcg": float(np.divide(dcg, ideal, out=np.zeros(num_users), where=ideal > 0).mean()),
+        "coverage": recommended.shape[0] / num_contents if num_contents else 0.0,
+    }
+
+
+def evaluate(
+    recommender,
+    tables: dict,
+    k: int = 10,
+    test_fraction: float = 0.2,
+    batch_size: int = BATCH_SIZE,
+    max_users: int = None,
+    seed: int = 0
+) -> dict:
+    """
+    Avalia um recomendador com divisão temporal do histórico.
+
+    Parâmetros:
+    - recommender (callable): Função com a assinatura de `recommendate`.
+    - tables (dict): Tabelas com USER, CONTENT, CONTENT_CONTTag, UWATCHINGCONT, USERINTERACTION e UCONTINT
+      (COMMENT, LIVECOMMENT, VIDEOCOMMENT e SHORTCOMMENT são repassadas se existirem).
+    - k (int): Tamanho da lista de recomendações.
+    - test_fraction (float): Fração final do histórico usada como teste.
+    - batch_size (int): Usuários por chamada do recomendador.
+    - max_users (int, opcional): Amostra de usuários de teste (todos, se None).
+    - seed (int): Semente da amostra de usuários e do `rng` passado ao recomendador.
+
+    Retorno:
+    - dict: precision, recall, ndcg, coverage, número de usuários e latência por chamada
+      (`latency_p50`, `latency_p95`, `latency_p99`, em segundos) e vazão (`users_per_second`).
+    """
+    rng = np.random.default_rng(seed)
+    train, relevant = time_split(tables, test_fraction)
+
+    user_ids = np.unique(relevant >> 32)
+    if max_users is not None and user_ids.shape[0] > max_users:
+        user_ids = np.sort(rng.choice(user_ids, size=max_users, replace=False))
+
+    content = tables["CONTENT"]
+    recommendations = np.empty((user_ids.shape[0], k), dtype=np.int64)
+    latencies = []
+    for start in range(0, user_ids.shape[0], batch_size):
+        batch = user_ids[start:start + batch_size]
+        timer = time.perf_counter()
+        result = recommender(
+            k, pd.DataFrame({"UserID": batch}), content, train["UWATCHINGCONT"], tables["CONTENT_CONTTag"],
+            train["USERINTERACTION"], train["UCONTINT"], tables.get("COMMENT"), tables.get("LIVECOMMENT"),
+            tables.get("VIDEOCOMMENT"), tables.get("SHORTCOMMENT"), rng=np.random.default_rng(seed + start)
+        )
+        latencies.append(time.perf_counter() - timer)
+        recommendations[start:start + batch.shape[0]] = recommendation_matrix(result, batch, k)
+
+    metrics = ranking_metrics(user_ids, recommendations, relevant, len(content))
+    metrics["users"] = int(user_ids.shape[0])
+    latencies = np.asarray(latencies) if latencies else np.zeros(1)
+    for percentile, value in zip(LATENCY_PERCENTILES, np.percentile(latencies, LATENCY_PERCENTILES)):
+        metrics[f"latency_p{percentile}"] = float(value)
+    metrics["users_per_second"] = user_ids.shape[0] / latencies.sum() if latencies.sum() > 0 else 0.0
+    return metrics
+
+
+def compare(recommenders: dict, tables: dict, **kwargs) -> pd.DataFrame:
+    """
+    Avalia vários recomendadores com a mesma divisão e os mesmos usuários.
+
+    Parâmetros:
+    - recommenders (dict): Nome -> função com a assinatura de `recommendate`.
+    - tables (dict): Tabelas, como em `evaluate`.
+    - **kwargs: Repassados para `evaluate`.
+
+    Retorno:
+    - pd.DataFrame: Uma linha de métricas por recomendador.
+    """
+    results = {name: evaluate(recommender, tables, **kwargs) for name, recommender in recommenders.items()}
+    return pd.DataFrame(results).T
+
+
+if __name__ == '__main__':
+    from functools import partial
+
+    from src.initialization.initialize_tables import TABLE_PATHS
+    from src.recommendation.recommendate import recommendate, BACKENDS
+    from src.recommendation import numba_backend
+
+    names = ["USER", "CONTENT", "CONTENT_CONTTag", "UWATCHINGCONT", "USERINTERACTION", "UCONTINT"]
+    tables = {name: pd.read_parquet(TABLE_PATHS[name]) for name in names}
+    backends = [name for name in BACKENDS if name != 'numba' or numba_backend.NUMBA_AVAILABLE]
+    print(compare({name: partial(recommendate, backend=name) for name in backends}, tables, max_users=100_000))
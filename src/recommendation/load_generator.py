@@ -0,0 +1,126 @@
+"""
+Module: load_generator
+----------------------
+
+Cliente de carga para o servidor de recomendações (`src.recommendation.server`).
+
+Reenvia os IDs de usuários da tabela `users` como requisições `GET /recommend`, com `concurrency` conexões
+keep-alive abertas ao mesmo tempo (cada uma com uma requisição em andamento), e mede a latência vista pelo
+cliente. No fim, lê `/stats` para comparar com os micro-lotes e a latência medidos no servidor.
+Só usa a biblioteca padrão e o servidor local; nenhum serviço externo.
+"""
+
+import asyncio
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.server import DEFAULT_HOST, DEFAULT_PORT, LATENCY_PERCENTILES
+from src.recommendation.recommender import DEFAULT_N
+
+# Conexões simultâneas padrão
+CONCURRENCY = 64
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, target: str) -> tuple:
+    """Envia um GET na conexão aberta e lê a resposta: `(status, corpo)`."""
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _connect(host: str, port: int, path: str):
+    if path is not None:
+        return await asyncio.open_unix_connection(path)
+    return await asyncio.open_connection(host, port)
+
+
+async def run_load(
+    user_ids,
+    n: int = DEFAULT_N,
+    concurrency: int = CONCURRENCY,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: str = None
+) -> dict:
+    """
+    Envia uma requisição por ID de `user_ids` e mede a latência.
+
+    Parâmetros:
+    - user_ids (iterable): IDs dos usuários, na ordem de envio.
+    - n (int): Número de recomendações por requisição.
+    - concurrency (int): Conexões simultâneas.
+    - host (str), port (int): Endereço HTTP do servidor (ignorados se `path` for dado).
+    - path (str, opcional): Caminho do socket Unix do servidor.
+
+    Retorno:
+    - dict: requisições, erros, vazão e latência p50/p95/p99 (ms) do cliente, e `server` com o `/stats`.
+    """
+    user_ids = np.asarray(user_ids, dtype=np.int64)
+    latencies = np.zeros(user_ids.shape[0])
+    ok = np.zeros(user_ids.shape[0], dtype=bool)
+    next_request = 0
+
+    async def worker():
+        nonlocal next_request
+        reader, writer = await _connect(host, port, path)
+        try:
+            while next_request < user_ids.shape[0]:
+                idx = next_request
+                next_request += 1
+                timer = time.perf_counter()
+                status, _ = await _request(reader, writer, f"/recommend?user_id={user_ids[idx]}&n={n}")
+                latencies[idx] = time.perf_counter() - timer
+                ok[idx] = status == 200
+        finally:
+            writer.close()
+
+    timer = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, max(user_ids.shape[0], 1)))))
+    elapsed = time.perf_counter() - timer
+
+    reader, writer = await _connect(host, port, path)
+    _, server_stats = await _request(reader, writer, "/stats")
+    writer.close()
+
+    stats = {
+        "requests": int(user_ids.shape[0]),
+        "errors": int((~ok).sum()),
+        "requests_per_second": user_ids.shape[0] / elapsed if elapsed > 0 else 0.0,
+    }
+    values = np.percentile(latencies, LATENCY_PERCENTILES) if latencies.shape[0] else np.zeros(3)
+    for percentile, value in zip(LATENCY_PERCENTILES, values):
+        stats[f"latency_p{percentile}_ms"] = float(value) * 1000
+    stats["server"] = server_stats
+    return stats
+
+
+def replay_users(num_requests: int = None, seed: int = None) -> np.ndarray:
+    """
+    IDs de usuários da tabela `users`, embaralhados (com repetição se `num_requests` passar do total).
+    """
+    from src.initialization.initialize_tables import TABLE_PATHS
+
+    user_ids = pd.read_parquet(TABLE_PATHS["users"], columns=["user_id"])["user_id"].to_numpy(dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    if num_requests is None:
+        return rng.permutation(user_ids)
+    return rng.choice(user_ids, size=num_requests, replace=num_requests > user_ids.shape[0])
+
+
+if __name__ == '__main__':
+    stats = asyncio.run(run_load(replay_users(100_000, seed=0)))
+    server_stats = stats.pop("server")
+    print("Cliente:", stats)
+    print("Servidor:", server_stats)
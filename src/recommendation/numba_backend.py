@@ -0,0 +1,179 @@
+"""
+Module: numba_backend
+---------------------
+
+Backend opcional do recomendador compilado com Numba (`@njit(parallel=True)`).
+
+Recebe apenas arrays planos:
+- tags dos conteúdos em CSR (`tag_offsets` + `tag_values`, uma linha por conteúdo da `TagMatrix`);
+- blocos de categoria do `CategoryIndex` (`category_offsets` sobre `ranked_rows`/`ranked_ids`, com os
+  candidatos de cada categoria em ordem decrescente de limite de pontuação, `bounds`);
+- histórico de cada usuário (`seen_starts`/`seen_ends` sobre `seen_contents`) e o seu perfil de tags.
+
+Cada usuário é processado de forma independente em um laço `prange`: a faixa da categoria dominante é
+percorrida até que o limite de pontuação dos candidatos restantes fique abaixo do pior do top, conteúdos
+vistos são descartados por busca binária no histórico ordenado, e o top-n é mantido por inserção. O resultado
+é idêntico ao de `engine.recommend_top_n` (pontuação positiva, empate pelo menor ContentID, fallback nas
+posições que sobrarem).
+
+O Numba não é uma dependência obrigatória: sem ele, `NUMBA_AVAILABLE` é falso e o recomendador usa o
+motor NumPy. O kernel é compilado com `cache=True` (o código de máquina fica em `__pycache__`) e `warm_up`
+força a compilação antes do primeiro tick, de modo que o custo do JIT não entra na medição da simulação.
+"""
+
+import numpy as np
+
+from src.recommendation.engine import TagMatrix
+from src.recommendation.category_index import CategoryIndex
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def tag_csr(tag_matrix: TagMatrix) -> tuple:
+    """
+    Converte a matriz densa de tags em CSR (offsets + tags, com a tag repetida pela sua contagem).
+
+    Retorno:
+    - tuple: (tag_offsets int64, tag_values int64).
+    """
+    counts = tag_matrix.matrix.astype(np.int64)
+    row_counts = counts.sum(axis=1)
+    tag_offsets = np.zeros(len(tag_matrix) + 1, dtype=np.int64)
+    np.cumsum(row_counts, out=tag_offsets[1:])
+    rows, tags = np.nonzero(counts)
+    tag_values = np.repeat(tags.astype(np.int64), counts[rows, tags])
+    return tag_offsets, tag_values
+
+
+def _top_n_kernel(
+    tag_offsets, tag_values, ranked_rows, ranked_ids, bounds, category_offsets,
+    profiles, main_categories, has_likes,
+    seen_starts, seen_ends, seen_contents,
+    n, fallback, out, out_scores
+):
+    num_users = profiles.shape[0]
+    for u in prange(num_users):
+        for j in range(n):
+            out[u, j] = fallback[u, j]
+            out_scores[u, j] = 0
+        category = main_categories[u]
+        if not has_likes[u] or category < 0:
+            continue
+
+        # Histórico do usuário ordenado, para a busca binária
+        seen = np.sort(seen_contents[seen_starts[u]:seen_ends[u]])
+        num_seen = seen.shape[0]
+        max_weight = 0
+        for tag in range(profiles.shape[1]):
+            max_weight = max(max_weight, profiles[u, tag])
+
+        top_scores = np.zeros(n, dtype=np.int64)
+        top_ids = np.zeros(n, dtype=np.int32)
+        count = 0
+        for position in range(category_offsets[category], category_offsets[category + 1]):
+            # Parada antecipada: nenhum candidato restante alcança o pior do top (ou pontua acima de zero)
+            limit = max_weight * bounds[position]
+            if limit <= 0 or (count == n and limit < top_scores[n - 1]):
+                break
+            row = ranked_rows[position]
+            score = 0
+            for k in range(tag_offsets[row], tag_offsets[row + 1]):
+                score += profiles[u, tag_values[k]]
+            content_id = ranked_ids[position]
+            if score <= 0 or (count == n and (
+                score < top_scores[n - 1] or (score == top_scores[n - 1] and content_id > top_ids[n - 1])
+            )):
+                continue
+
+            position_seen = np.searchsorted(seen, content_id)
+            if position_seen < num_seen and seen[position_seen] == content_id:
+                continue
+
+            # Inserção ordenada por (pontuação decrescente, ContentID crescente)
+            slot = count if count < n else n - 1
+            while slot > 0 and (top_scores[slot - 1] < score or (
+                top_scores[slot - 1] == score and top_ids[slot - 1] > content_id
+            )):
+                top_scores[slot] = top_scores[slot - 1]
+                top_ids[slot] = top_ids[slot - 1]
+                slot -= 1
+            top_scores[slot] = score
+            top_ids[slot] = content_id
+            if count < n:
+                count += 1
+
+        for j in range(count):
+            out[u, j] = top_ids[j]
+            out_scores[u, j] = top_scores[j]
+
+
+if NUMBA_AVAILABLE:
+    _top_n_kernel = njit(parallel=True, cache=True, nogil=True)(_top_n_kernel)
+
+
+def recommend_top_n(
+    tag_matrix: TagMatrix,
+    profiles: np.ndarray,
+    main_categories: np.ndarray,
+    has_likes: np.ndarray,
+    seen_starts: np.ndarray,
+    seen_ends: np.ndarray,
+    seen_contents: np.ndarray,
+    n: int,
+    fallback: np.ndarray,
+    index: CategoryIndex = None,
+    return_scores: bool = False
+) -> np.ndarray:
+    """
+    Mesma interface e mesmo resultado de `engine.recommend_top_n`, calculado pelo kernel Numba.
+
+    Retorno:
+    - np.ndarray: `(num_users × n)` int32 com os ContentIDs recomendados, do melhor para o pior.
+    """
+    if not NUMBA_AVAILABLE:
+        raise ImportError("O backend 'numba' requer o pacote numba instalado.")
+    if index is None:
+        index = CategoryIndex(tag_matrix)
+    tag_offsets, tag_values = tag_csr(tag_matrix)
+    out = np.empty((profiles.shape[0], n), dtype=np.int32)
+    out_scores = np.empty((profiles.shape[0], n), dtype=np.int64)
+    # Tipos fixos: uma única especialização do kernel, reaproveitada do cache em disco
+    _top_n_kernel(
+        tag_offsets, tag_values,
+        np.ascontiguousarray(index.ranked_rows, dtype=np.int64),
+        np.ascontiguousarray(index.content_ids, dtype=np.int32),
+        np.ascontiguousarray(index.bounds, dtype=np.int64),
+        np.ascontiguousarray(index.category_offsets, dtype=np.int64),
+        np.ascontiguousarray(profiles, dtype=np.int32),
+        np.ascontiguousarray(main_categories, dtype=np.int64),
+        np.ascontiguousarray(has_likes, dtype=np.bool_),
+        np.ascontiguousarray(seen_starts, dtype=np.int64),
+        np.ascontiguousarray(seen_ends, dtype=np.int64),
+        np.ascontiguousarray(seen_contents, dtype=np.int32),
+        n,
+        np.ascontiguousarray(np.broadcast_to(np.asarray(fallback, dtype=np.int32), (profiles.shape[0], n))),
+        out, out_scores
+    )
+    return (out, out_scores) if return_scores else out
+
+
+def warm_up() -> bool:
+    """
+    Compila o kernel (ou o carrega do cache em disco) com um lote mínimo, antes do primeiro tick.
+
+    Retorno:
+    - bool: Se o backend Numba está disponível.
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    tag_matrix = TagMatrix(np.arange(2), np.ones(2), np.arange(2), np.ones(2))
+    recommend_top_n(
+        tag_matrix, np.ones((1, 16), dtype=np.int32), np.ones(1, dtype=np.int64), np.ones(1, dtype=bool),
+        np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32),
+        1, np.zeros(1, dtype=np.int32)
+    )
+    return True
@@ -0,0 +1,292 @@
+"""
+Module: popularity
+------------------
+
+Contadores de popularidade e tendências com decaimento exponencial, mantidos de forma incremental entre ticks.
+
+As estatísticas de `df_content_table` (`Views`, `Likes`, `Dislikes`, `Comments`) nascem zeradas e as tabelas
+são apenas anexadas, então os contadores vivem aqui, em arrays densos indexados pelo ContentID, e são
+atualizados com as linhas novas de cada tick (visualizações, interações e comentários).
+
+A tendência de um conteúdo é a soma dos pesos dos seus eventos, cada um decaindo pela metade a cada
+`half_life` segundos. Em vez de decair todos os conteúdos a cada tick, cada evento entra já escalado por
+`2 ** ((t - epoch) / half_life)`: a pontuação guardada é a tendência multiplicada por um fator comum a todos os
+conteúdos, a ordem entre eles não muda com o tempo e a atualização custa O(eventos novos). Quando o expoente
+cresce demais, a época avança e todas as pontuações são reescaladas (O(conteúdos), raramente).
+
+Como as pontuações guardadas só crescem, o top-K de cada categoria depois de um tick está contido no top-K
+anterior mais os conteúdos que receberam eventos no tick; a lista publicada (`trending`) é atualizada a partir
+desse conjunto pequeno, sem percorrer o catálogo. `fallback` usa essas listas no lugar do sorteio único do
+recomendador para quem não tem curtidas (ou não tem candidatos suficientes).
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.engine import TAG_SLOTS
+from src.recommendation.profiles import _grow
+
+# Tipos de interação (USERINTERACTION.UINTType)
+LIKE = 1
+DISLIKE = -1
+
+# Peso de cada evento na tendência
+VIEW_WEIGHT = 1.0
+LIKE_WEIGHT = 2.0
+COMMENT_WEIGHT = 2.0
+
+# Meia-vida da tendência, em segundos simulados
+HALF_LIFE = 86400.0
+
+# Tamanho das listas publicadas por categoria
+TOP_K = 100
+
+# Expoente máximo do fator de escala antes de avançar a época
+MAX_EXPONENT = 512.0
+
+# Tabelas de comentários ligadas a conteúdos
+CONTENT_COMMENTS = ("LIVECOMMENT", "VIDEOCOMMENT", "SHORTCOMMENT")
+
+
+class PopularityStore:
+    """
+    Contadores por conteúdo e listas de tendência por categoria, atualizados por tick.
+
+    Parâmetros:
+    - half_life (float): Meia-vida da tendência, em segundos.
+    - top_k (int): Tamanho das listas publicadas.
+    - epoch (float): Instante de referência inicial do fator de escala.
+    """
+
+    def __init__(self, half_life: float = HALF_LIFE, top_k: int = TOP_K, epoch: float = 0.0):
+        self.half_life = half_life
+        self.top_k = top_k
+        self.epoch = epoch
+
+        # Densos por ContentID (categoria -1 = conteúdo ainda desconhecido)
+        self.content_categories = np.full(0, -1, dtype=np.int8)
+        self.views = np.zeros(0, dtype=np.int64)
+        self.likes = np.zeros(0, dtype=np.int64)
+        self.dislikes = np.zeros(0, dtype=np.int64)
+        self.comments = np.zeros(0, dtype=np.int64)
+        self._trending = np.zeros(0, dtype=np.float64)
+
+        # Top-K publicado por categoria (-1 nas posições vazias) e conteúdos com eventos desde a última publicação
+        self._top = np.full((TAG_SLOTS, top_k), -1, dtype=np.int64)
+        self._global_top = np.full(top_k, -1, dtype=np.int64)
+        self._touched = []
+
+    @classmethod
+    def from_tables(cls, tables: dict, current_datetime: float, **kwargs) -> 'PopularityStore':
+        """
+        Reconstrói os contadores a partir do histórico. As interações não têm data e entram em `current_datetime`.
+
+        Parâmetros:
+        - tables (dict): Tabelas com CONTENT e, se existirem, UWATCHINGCONT, USERINTERACTION, UCONTINT,
+          COMMENT e LIVECOMMENT/VIDEOCOMMENT/SHORTCOMMENT.
+        - current_datetime (float): Relógio da simulação.
+        - **kwargs: Repassados para o construtor.
+        """
+        store = cls(epoch=current_datetime, **kwargs)
+        store.update(tables, current_datetime)
+        return store
+
+    def update(self, new: dict, current_datetime: float):
+        """
+        Incorpora as linhas novas de um tick e publica as listas de tendência. Tabelas ausentes são ignoradas.
+
+        Parâmetros:
+        - new (dict): Linhas novas por tabela.
+        - current_datetime (float): Relógio do tick (data das interações, que não têm data própria).
+        """
+        if "CONTENT" in new:
+            self.add_content(new["CONTENT"])
+        if "UWATCHINGCONT" in new:
+            self.add_watches(new["UWATCHINGCONT"])
+        if "USERINTERACTION" in new and "UCONTINT" in new:
+            self.add_interactions(new["USERINTERACTION"], new["UCONTINT"], current_datetime)
+        if "COMMENT" in new:
+            self.add_comments(new["COMMENT"], [new[name] for name in CONTENT_COMMENTS if name in new])
+        self.publish()
+
+    def add_content(self, content: pd.DataFrame):
+        """Registra a categoria de conteúdos novos."""
+        content_ids = content["ContentID"].to_numpy(dtype=np.int64)
+        if content_ids.shape[0] == 0:
+            return
+        self._reserve(int(content_ids.max()) + 1)
+        self.content_categories[content_ids] = content["CONTCategory"].to_numpy(dtype=np.int8)
+
+    def add_watches(self, uwatchingcont: pd.DataFrame):
+        """Conta as visualizações novas."""
+        content_ids = uwatchingcont["ContentID"].to_numpy(dtype=np.int64)
+        self._add('views', content_ids, uwatchingcont["UWatchCONTDateTime"].to_numpy(), VIEW_WEIGHT)
+
+    def add_interactions(self, userinteraction: pd.DataFrame, ucontint: pd.DataFrame, current_datetime: float):
+        """Conta as curtidas e descurtidas novas (USERINTERACTION e UCONTINT do mesmo tick, ligadas pelo UINTID)."""
+        positions = pd.Index(ucontint["UINTID"]).get_indexer(userinteraction["UINTID"])
+        found = positions >= 0
+        types = userinteraction["UINTType"].to_numpy()[found]
+        content_ids = ucontint["ContentID"].to_numpy(dtype=np.int64)[positions[found]]
+        times = np.full(content_ids.shape[0], current_datetime)
+        like = types == LIKE
+        self._add('likes', content_ids[like], times[like], LIKE_WEIGHT)
+        self._add('dislikes', content_ids[types == DISLIKE], times[types == DISLIKE], 0.0)
+
+    def add_comments(self, comment: pd.DataFrame, content_comments: list):
+        """
+        Conta os comentários novos.
+
+        Parâmetros:
+        - comment (pd.DataFrame): Linhas novas de COMMENT (data de cada comentário).
+        - content_comments (list): Linhas novas de LIVECOMMENT, VIDEOCOMMENT e SHORTCOMMENT (CommentID, ContentID).
+        """
+        if not content_comments:
+            return
+        links = pd.concat(content_comments, ignore_index=True)
+        positions = pd.Index(comment["CommentID"]).get_indexer(links["CommentID"])
+        found = positions >= 0
+        content_ids = links["ContentID"].to_numpy(dtype=np.int64)[found]
+        times = comment["COMDateTime"].to_numpy()[positions[found]]
+        self._add('comments', content_ids, times, COMMENT_WEIGHT)
+
+    def publish(self):
+        """Atualiza as listas de tendência com os conteúdos que receberam eventos desde a última publicação."""
+        if not self._touched:
+            return
+        candidates = np.unique(np.concatenate([self._top[self._top >= 0]] + self._touched))
+        self._touched = []
+        categories = self.content_categories[candidates].astype(np.int64)
+        scores = self._trending[candidates]
+        keep = (scores > 0) & (categories >= 0)
+        candidates, categories, scores = candidates[keep], categories[keep], scores[keep]
+
+        # Por categoria: maior tendência primeiro; no empate, o menor ContentID
+        order = np.lexsort((candidates, -scores, categories))
+        candidates, categories = candidates[order], categories[order]
+        starts = np.searchsorted(categories, np.arange(TAG_SLOTS))
+        ranks = np.arange(candidates.shape[0]) - starts[categories]
+        listed = ranks < self.top_k
+        self._top.fill(-1)
+        self._top[categories[listed], ranks[listed]] = candidates[listed]
+
+        # Lista global: o top-K geral está contido na união dos tops das categorias
+        listed_ids = candidates[listed]
+        order = np.lexsort((listed_ids, -self._trending[listed_ids]))[:self.top_k]
+        self._global_top.fill(-1)
+        self._global_top[:order.shape[0]] = listed_ids[order]
+
+    def trending(self, category: int = None) -> np.ndarray:
+        """
+        Lista de tendência publicada, da maior para a menor tendência.
+
+        Parâmetros:
+        - category (int, opcional): Categoria; se None, a lista de todas as categorias.
+
+        Retorno:
+        - np.ndarray: Até `top_k` ContentIDs (apenas conteúdos com algum evento).
+        """
+        top = self._global_top if category is None or category < 0 else self._top[category]
+        return top[top >= 0]
+
+    def trending_scores(self, content_ids, current_datetime: float) -> np.ndarray:
+        """Tendência de cada conteúdo no instante `current_datetime` (0 para conteúdos desconhecidos)."""
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        known = content_ids < self._trending.shape[0]
+        scores = np.zeros(content_ids.shape[0], dtype=np.float64)
+        scores[known] = self._trending[content_ids[known]]
+        return scores * np.exp2((self.epoch - current_datetime) / self.half_life)
+
+    def counters(self, content_ids) -> pd.DataFrame:
+        """Contadores de um conjunto de conteúdos, no formato de `df_content_table`."""
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        known = content_ids < self.views.shape[0]
+        safe = np.where(known, content_ids, 0)
+        columns = {"ContentID": content_ids}
+        for column, counts in (("Views", self.views), ("Likes", self.likes),
+                               ("Dislikes", self.dislikes), ("Comments", self.comments)):
+            columns[column] = np.where(known, counts[safe] if counts.shape[0] else 0, 0)
+        return pd.DataFrame(columns)
+
+    def fallback(self, main_categories: np.ndarray, candidates: np.ndarray, default: np.ndarray) -> np.ndarray:
+        """
+        Fallback por usuário: a lista de tendência da categoria dominante (a global para categoria -1), restrita
+        aos candidatos e completada com os itens de `default` que ainda não estão nela.
+
+        Parâmetros:
+        - main_categories (np.ndarray): Categoria dominante de cada usuário (-1 se não houver).
+        - candidates (np.ndarray): ContentIDs candidatos, ordenados; se None, a lista não é restrita.
+        - default (np.ndarray): Fallback sorteado do recomendador (n ContentIDs).
+
+        Retorno:
+        - np.ndarray: `(usuários × n)` int32.
+        """
+        n = default.shape[0]
+        result = np.empty((main_categories.shape[0], n), dtype=np.int32)
+        categories, inverse = np.unique(main_categories, return_inverse=True)
+        for position, category in enumerate(categories):
+            top = self.trending(int(category))
+            if candidates is None:
+                top = top[:n]
+            elif candidates.shape[0]:
+                found = np.minimum(np.searchsorted(candidates, top), candidates.shape[0] - 1)
+                top = top[candidates[found] == top][:n]
+            else:
+                top = top[:0]
+            rest = default[~np.isin(default, top)][:n - top.shape[0]]
+            row = np.concatenate((top, rest, default[:n - top.shape[0] - rest.shape[0]]))
+            result[inverse == position] = row
+        return result
+
+    def state(self) -> dict:
+        """Estado completo como arrays (para checkpoints)."""
+        return {
+            "parameters": np.array([self.half_life, self.top_k, self.epoch], dtype=np.float64),
+            "content_categories": self.content_categories,
+            "views": self.views,
+            "likes": self.likes,
+            "dislikes": self.dislikes,
+            "comments": self.comments,
+            "trending": self._trending,
+            "top": self._top,
+            "global_top": self._global_top,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'PopularityStore':
+        """Recria um `PopularityStore` salvo por `state`."""
+        half_life, top_k, epoch = (float(value) for value in state["parameters"])
+        store = cls(half_life, int(top_k), epoch)
+        for name in ('content_categories', 'views', 'likes', 'dislikes', 'comments'):
+            setattr(store, name, np.array(state[name]))
+        store._trending = np.array(state["trending"])
+        store._top = np.array(state["top"])
+        store._global_top = np.array(state["global_top"])
+        return store
+
+    def _reserve(self, size: int):
+        self.content_categories = _grow(self.content_categories, size, -1)
+        for name in ('views', 'likes', 'dislikes', 'comments'):
+            setattr(self, name, _grow(getattr(self, name), size))
+        self._trending = _grow(self._trending, size)
+
+    def _add(self, counter: str, content_ids: np.ndarray, times: np.ndarray, weight: float):
+        """Soma eventos a um contador (`views`, `likes`, ...) e, com peso positivo, à tendência escalada."""
+        if content_ids.shape[0] == 0:
+            return
+        self._reserve(int(content_ids.max()) + 1)
+        np.add.at(getattr(self, counter), content_ids, 1)
+        if weight <= 0:
+            return
+        exponents = (np.asarray(times, dtype=np.float64) - self.epoch) / self.half_life
+        if exponents.max() > MAX_EXPONENT:
+            self._rebase(float(exponents.max()))
+            exponents = (np.asarray(times, dtype=np.float64) - self.epoch) / self.half_life
+        np.add.at(self._trending, content_ids, weight * np.exp2(exponents))
+        self._touched.append(np.unique(content_ids))
+
+    def _rebase(self, exponent: float):
+        """Avança a época para que o maior expoente volte a zero, reescalando todas as pontuações."""
+        shift = np.floor(exponent)
+        self._trending *= np.exp2(-shift)
+        self.epoch += shift * self.half_life
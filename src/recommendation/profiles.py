@@ -0,0 +1,238 @@
+"""
+Module: profiles
+----------------
+
+Perfis de afinidade por tag mantidos de forma incremental entre ticks.
+
+Reconstruir os perfis a cada chamada do recomendador exige percorrer todo o histórico de UWATCHINGCONT,
+USERINTERACTION e UCONTINT (incluindo um `merge` completo das curtidas). O `ProfileStore` guarda esse estado
+pronto e é atualizado apenas com as linhas novas de cada tick:
+
+- tags e categoria de cada conteúdo, em arrays densos indexados pelo ContentID;
+- por usuário com atividade: contagem de tags (assistido = 1, curtido = 2), histograma das categorias
+  curtidas e número de curtidas;
+- conjunto de conteúdos vistos, como chaves `(UserID << 32) | ContentID` ordenadas, de modo que os vistos
+  de um usuário são uma faixa contígua encontrada por busca binária.
+
+A consulta de um lote de usuários custa O(lote · log(usuários)) e não depende do tamanho do histórico.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.engine import TAG_SLOTS, accumulate_rows
+
+# Tipo de interação que conta como curtida (USERINTERACTION.UINTType)
+LIKE = 1
+
+# Peso de cada conteúdo no perfil de tags
+WATCH_WEIGHT = 1
+LIKE_WEIGHT = 2
+
+
+def _grow(array: np.ndarray, size: int, fill=0) -> np.ndarray:
+    """Garante ao menos `size` linhas, dobrando a capacidade (custo amortizado constante por linha)."""
+    if array.shape[0] >= size:
+        return array
+    capacity = max(size, 2 * array.shape[0], 1024)
+    grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+def _pair_keys(user_ids, content_ids) -> np.ndarray:
+    """Chaves `(UserID << 32) | ContentID`, ordenáveis por usuário e depois por conteúdo."""
+    return (np.asarray(user_ids, dtype=np.int64) << 32) | np.asarray(content_ids, dtype=np.int64)
+
+
+class ProfileStore:
+    """
+    Perfis de tags, categorias curtidas e conteúdos vistos de cada usuário, atualizados por tick.
+    """
+
+    def __init__(self):
+        # Conteúdos (densos por ContentID; categoria -1 = conteúdo ainda desconhecido)
+        self.content_tags = np.zeros((0, TAG_SLOTS), dtype=np.uint8)
+        self.content_categories = np.full(0, -1, dtype=np.int8)
+
+        # Usuários com atividade: UserIDs ordenados -> linha nos arrays abaixo (em ordem de chegada)
+        self._user_keys = np.empty(0, dtype=np.int64)
+        self._user_rows = np.empty(0, dtype=np.int64)
+        self._num_users = 0
+        self._profiles = np.zeros((0, TAG_SLOTS), dtype=np.int32)
+        self._category_counts = np.zeros((0, TAG_SLOTS), dtype=np.int32)
+        self._like_counts = np.zeros(0, dtype=np.int32)
+        # Versão de cada perfil: muda a cada visualização ou curtida nova do usuário
+        self._versions = np.zeros(0, dtype=np.int64)
+
+        # Conteúdos vistos (assistidos ou curtidos), ordenados por (UserID, ContentID)
+        self._seen_keys = np.empty(0, dtype=np.int64)
+        self._seen_contents = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'ProfileStore':
+        """
+        Reconstrói os perfis a partir do histórico (por exemplo, ao retomar uma simulação).
+
+        Parâmetros:
+        - tables (dict): Tabelas com CONTENT, CONTENT_CONTTag, UWATCHINGCONT, USERINTERACTION e UCONTINT.
+
+        Retorno:
+        - ProfileStore: Perfis equivalentes aos mantidos incrementalmente.
+        """
+        store = cls()
+        store.update(tables)
+        return store
+
+    def __len__(self) -> int:
+        return self._num_users
+
+    def update(self, new: dict):
+        """
+        Incorpora as linhas novas de um tick. Tabelas ausentes são ignoradas.
+
+        Os conteúdos entram antes das visualizações e curtidas, para que as tags de um conteúdo
+        criado no mesmo tick já contem.
+
+        Parâmetros:
+        - new (dict): Linhas novas por tabela (CONTENT, CONTENT_CONTTag, UWATCHINGCONT, USERINTERACTION, UCONTINT).
+        """
+        if "CONTENT" in new:
+            self.add_content(new["CONTENT"], new.get("CONTENT_CONTTag"))
+        if "UWATCHINGCONT" in new:
+            self.add_watches(new["UWATCHINGCONT"])
+        if "USERINTERACTION" in new and "UCONTINT" in new:
+            self.add_interactions(new["USERINTERACTION"], new["UCONTINT"])
+
+    def add_content(self, content: pd.DataFrame, content_tags: pd.DataFrame = None):
+        """Registra a categoria e as tags de conteúdos novos."""
+        content_ids = content["ContentID"].to_numpy(dtype=np.int64)
+        if content_ids.shape[0]:
+            size = int(content_ids.max()) + 1
+            self.content_categories = _grow(self.content_categories, size, -1)
+            self.content_tags = _grow(self.content_tags, size)
+            self.content_categories[content_ids] = content["CONTCategory"].to_numpy(dtype=np.int8)
+        if content_tags is not None and not content_tags.empty:
+            tag_ids = content_tags["ContentID"].to_numpy(dtype=np.int64)
+            self.content_tags = _grow(self.content_tags, int(tag_ids.max()) + 1)
+            np.add.at(self.content_tags, (tag_ids, content_tags["CONTTag"].to_numpy(dtype=np.int64)), 1)
+
+    def add_watches(self, uwatchingcont: pd.DataFrame):
+        """Soma as visualizações novas (duração positiva) aos perfis."""
+        watched = uwatchingcont[uwatchingcont["UWatchDurationCONT"].to_numpy() > 0]
+        user_ids = watched["UserID"].to_numpy(dtype=np.int64)
+        content_ids = watched["ContentID"].to_numpy(dtype=np.int64)
+        rows = self.rows(user_ids, create=True)
+        self._add_tags(rows, content_ids, WATCH_WEIGHT)
+        self._add_seen(user_ids, content_ids)
+        self._versions[np.unique(rows)] += 1
+
+    def add_interactions(self, userinteraction: pd.DataFrame, ucontint: pd.DataFrame):
+        """
+        Soma as curtidas novas aos perfis. USERINTERACTION e UCONTINT são as linhas novas do mesmo tick,
+        ligadas pelo UINTID, e por isso dispensam o `merge` com o histórico.
+        """
+        likes = userinteraction[userinteraction["UINTType"].to_numpy() == LIKE]
+        positions = pd.Index(ucontint["UINTID"]).get_indexer(likes["UINTID"])
+        found = positions >= 0
+        user_ids = likes["UserID"].to_numpy(dtype=np.int64)[found]
+        content_ids = ucontint["ContentID"].to_numpy(dtype=np.int64)[positions[found]]
+        rows = self.rows(user_ids, create=True)
+
+        self._add_tags(rows, content_ids, LIKE_WEIGHT)
+        np.add.at(self._like_counts, rows, 1)
+        categories = self._categories_of(content_ids)
+        known = categories >= 0
+        np.add.at(self._category_counts, (rows[known], categories[known].astype(np.int64)), 1)
+        self._add_seen(user_ids, content_ids)
+        self._versions[np.unique(rows)] += 1
+
+    def rows(self, user_ids, create: bool = False) -> np.ndarray:
+        """
+        Linha de cada UserID nos arrays de perfis (-1 para usuários sem atividade).
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários.
+        - create (bool): Cria linhas zeradas para os usuários ainda desconhecidos.
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        rows = self._find_rows(user_ids)
+        if not create or (rows >= 0).all():
+            return rows
+
+        new_ids = np.unique(user_ids[rows < 0])
+        new_rows = np.arange(self._num_users, self._num_users + new_ids.shape[0], dtype=np.int64)
+        self._num_users += new_ids.shape[0]
+        self._profiles = _grow(self._profiles, self._num_users)
+        self._category_counts = _grow(self._category_counts, self._num_users)
+        self._like_counts = _grow(self._like_counts, self._num_users)
+        self._versions = _grow(self._versions, self._num_users)
+
+        positions = np.searchsorted(self._user_keys, new_ids)
+        self._user_keys = np.insert(self._user_keys, positions, new_ids)
+        self._user_rows = np.insert(self._user_rows, positions, new_rows)
+        return self._find_rows(user_ids)
+
+    def lookup(self, user_ids) -> tuple:
+        """
+        Estado de um lote de usuários, no formato esperado por `engine.recommend_top_n`.
+
+        Parâmetros:
+        - user_ids (np.ndarray): IDs dos usuários (usuários sem atividade recebem perfil vazio).
+
+        Retorno:
+        - tuple: (profiles, main_categories, has_likes, seen_starts, seen_ends, seen_contents).
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        rows = self._find_rows(user_ids)
+        known = rows >= 0
+        profiles = np.zeros((user_ids.shape[0], TAG_SLOTS), dtype=np.int32)
+        main_categories = np.full(user_ids.shape[0], -1, dtype=np.int64)
+        has_likes = np.zeros(user_ids.shape[0], dtype=bool)
+
+        if known.any():
+            known_rows = rows[known]
+            profiles[known] = self._profiles[known_rows]
+            category_counts = self._category_counts[known_rows]
+            main_categories[known] = np.where(category_counts.any(axis=1), category_counts.argmax(axis=1), -1)
+            has_likes[known] = self._like_counts[known_rows] > 0
+
+        seen_starts = np.searchsorted(self._seen_keys, user_ids << 32)
+        seen_ends = np.searchsorted(self._seen_keys, (user_ids + 1) << 32)
+        return profiles, main_categories, has_likes, seen_starts, seen_ends, self._seen_contents
+
+    def versions(self, user_ids) -> np.ndarray:
+        """Versão do perfil de cada usuário (0 para usuários sem atividade)."""
+        rows = self._find_rows(np.asarray(user_ids, dtype=np.int64))
+        return np.where(rows >= 0, self._versions[np.maximum(rows, 0)] if self._num_users else 0, 0)
+
+    def _find_rows(self, user_ids: np.ndarray) -> np.ndarray:
+        if self._user_keys.shape[0] == 0:
+            return np.full(user_ids.shape[0], -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._user_keys, user_ids), self._user_keys.shape[0] - 1)
+        found = self._user_keys[positions] == user_ids
+        return np.where(found, self._user_rows[positions], -1)
+
+    def _categories_of(self, content_ids: np.ndarray) -> np.ndarray:
+        categories = np.full(content_ids.shape[0], -1, dtype=np.int8)
+        known = content_ids < self.content_categories.shape[0]
+        categories[known] = self.content_categories[content_ids[known]]
+        return categories
+
+    def _add_tags(self, rows: np.ndarray, content_ids: np.ndarray, weight: int):
+        known = content_ids < self.content_tags.shape[0]
+        if not known.any():
+            return
+        values = self.content_tags[content_ids[known]].astype(np.int32) * weight
+        accumulate_rows(self._profiles, rows[known], values)
+
+    def _add_seen(self, user_ids: np.ndarray, content_ids: np.ndarray):
+        keys = np.unique(_pair_keys(user_ids, content_ids))
+        if self._seen_keys.shape[0]:
+            positions = np.minimum(np.searchsorted(self._seen_keys, keys), self._seen_keys.shape[0] - 1)
+            keys = keys[self._seen_keys[positions] != keys]
+        if keys.shape[0] == 0:
+            return
+        positions = np.searchsorted(self._seen_keys, keys)
+        self._seen_keys = np.insert(self._seen_keys, positions, keys)
+        self._seen_contents = np.insert(self._seen_contents, positions, (keys & 0xFFFFFFFF).astype(np.int32))
@@ -1,11 +1,17 @@
 import pandas as pd
 import numpy as np
 import time
-import numba
-# Cria array de listas (Numba List)
-from numba.typed import Dict, List
-from numba import types
-from heapq import nlargest
+
+from src.recommendation import engine, numba_backend
+from src.recommendation.engine import TagMatrix, user_profiles
+from src.recommendation.category_index import CategoryIndex, category_bounds
+
+# Implementações do top-n; todas produzem o mesmo resultado
+BACKENDS = {
+    'numpy': engine.recommend_top_n,
+    'numba': numba_backend.recommend_top_n,
+}
+DEFAULT_BACKEND = 'numba' if numba_backend.NUMBA_AVAILABLE else 'numpy'
 
 '''recommendations = recommendate(
     n, 
@@ -27,27 +33,83 @@ O ndarray tem os seguintes campos:
         - [2]: o rank da recomendacao (1 a n)
 '''
 
-def get_map(content_id_arr, tags_arr):
-    sort_idx = np.argsort(content_id_arr)
-    content_ids_sorted = content_id_arr[sort_idx]
-    tags_sorted = tags_arr[sort_idx]
-
-    # 2. Encontrar onde os content_ids mudam
-    # Isso marca o índice de início de cada novo content_id
-    change_idx = np.where(np.diff(content_ids_sorted) != 0)[0] + 1
-    split_indices = np.r_[0, change_idx, len(content_ids_sorted)]
-
-    # 3. Slicing baseado nos índices detectados
-    unique_content_ids = content_ids_sorted[split_indices[:-1]]  # pega um de cada grupo
-    tag_slices = [tags_sorted[start:end] for start, end in zip(split_indices[:-1], split_indices[1:])]
+def _profiles_from_history(tag_matrix, user_ids, uwatchingcont, userinteraction, ucontint):
+    """Perfis dos usuários calculados a partir do histórico completo (sem `ProfileStore`)."""
+    start = time.time()
+    watched_mask = uwatchingcont["UWatchDurationCONT"].values > 0
+    uw_user_ids = uwatchingcont["UserID"].values[watched_mask].astype(np.int32)
+    uw_content_ids = uwatchingcont["ContentID"].values[watched_mask].astype(np.int32)
+    print(f"🎬 Conteúdos assistidos: {time.time() - start:.4f}s")
 
-    # 4. Se quiser converter em dict (rápido, sem append):
-    content_tag_map = dict(zip(unique_content_ids, tag_slices))
-    return content_tag_map
+    start = time.time()
+    likes = userinteraction[userinteraction["UINTType"] == 1][["UserID", "UINTID"]]
+    likes_with_content = likes.merge(ucontint, on="UINTID", how="inner")
+    like_user_ids = likes_with_content["UserID"].values.astype(np.int32)
+    like_content_ids = likes_with_content["ContentID"].values.astype(np.int32)
+    print(f"❤️ Curtidas (com merge): {time.time() - start:.4f}s")
+
+    user_index = pd.Index(user_ids)
+    watched_users = user_index.get_indexer(uw_user_ids)
+    liked_users = user_index.get_indexer(like_user_ids)
+    watched_keep, liked_keep = watched_users >= 0, liked_users >= 0
+    return user_profiles(
+        tag_matrix, len(user_ids),
+        watched_users[watched_keep], uw_content_ids[watched_keep],
+        liked_users[liked_keep], like_content_ids[liked_keep]
+    )
+
+def _recommend_cached(cache, profiles, recommend_top_n, tag_matrix, index, user_ids, user_state, n, fallback):
+    """Top-n servido pelo cache quando possível; só os usuários restantes passam pelo motor."""
+    user_profiles_, main_categories, has_likes, seen_starts, seen_ends, seen_contents = user_state
+    top_n = np.array(np.broadcast_to(np.asarray(fallback, dtype=np.int32), (len(user_ids), n)))
+
+    # Quem não tem curtidas recebe o fallback do tick e não passa pelo cache
+    eligible = np.flatnonzero(has_likes & (main_categories >= 0))
+    versions = profiles.versions(user_ids[eligible])
+    categories = main_categories[eligible]
+    # Só os conteúdos criados depois do cálculo de cada entrada podem desbancar o top guardado
+    watermarks = cache.watermarks(user_ids[eligible], versions, categories)
+    current = np.flatnonzero(watermarks >= 0)
+    bounds = np.zeros(eligible.shape[0], dtype=np.int64)
+    bounds[current] = category_bounds(
+        index, user_profiles_[eligible[current]], categories[current], watermarks[current]
+    )
+    hit, cached = cache.get(user_ids[eligible], versions, categories, bounds, tag_matrix.sorted_ids)
+    top_n[eligible[hit]] = np.where(cached >= 0, cached, top_n[eligible[hit]])
+
+    miss = eligible[~hit]
+    recommendations, scores = recommend_top_n(
+        tag_matrix, user_profiles_[miss], main_categories[miss], has_likes[miss],
+        seen_starts[miss], seen_ends[miss], seen_contents, n, top_n[miss],
+        index=index, return_scores=True
+    )
+    top_n[miss] = recommendations
+    watermark = int(tag_matrix.sorted_ids[-1]) if len(tag_matrix) else -1
+    cache.put(user_ids[miss], versions[~hit], categories[~hit], recommendations, scores, watermark)
+    return top_n
+
+def _recommend_cold(segments, recommend_top_n, tag_matrix, index, user_ids, user_state, n, top_n):
+    """Troca o fallback dos usuários sem curtidas pelo top-n do seu segmento, onde ele existir (em `top_n`)."""
+    cold = np.flatnonzero(~(user_state[2] & (user_state[1] >= 0)))
+    segment_top = segments.recommend(recommend_top_n, tag_matrix, index, user_ids[cold], n)
+    top_n[cold] = np.where(segment_top >= 0, segment_top, top_n[cold])
 
 def recommendate(n, users, content, uwatchingcont, content_tags,
                  userinteraction, ucontint, comment,
-                 livecomment, videocomment, shortcomment):
+                 livecomment, videocomment, shortcomment, rng=None, profiles=None, backend=None,
+                 cache=None, popularity=None, segments=None, restrict_trending=True):
+    """
+    `profiles` (ProfileStore, opcional) traz os perfis já mantidos entre ticks; nesse caso o histórico
+    (`uwatchingcont`, `userinteraction`, `ucontint`) não é percorrido.
+    `backend` escolhe a implementação do top-n ('numpy' ou 'numba'); por padrão, 'numba' quando instalado.
+    `cache` (RecommendationCache, opcional, exige `profiles`) reaproveita o top-n de usuários cujo perfil
+    não mudou e para quem nenhum candidato novo pode entrar no top.
+    `popularity` (PopularityStore, opcional) troca o fallback sorteado pelas tendências da categoria dominante
+    de cada usuário (as globais para quem não tem categoria), restritas aos candidatos. Com
+    `restrict_trending=False`, as tendências valem para qualquer conteúdo já publicado, e não só para `content`.
+    `segments` (SegmentStore, opcional) atende os usuários sem curtidas com o top-n do seu segmento
+    demográfico, calculado uma vez por segmento; o fallback só preenche o que o segmento não cobrir.
+    """
 
     total_start = time.time()
     print("📥 Preparando dados...")
@@ -60,147 +122,60 @@ def recommendate(n, users, content, uwatchingcont, content_tags,
     content_categories = content["CONTCategory"].values.astype(np.int8)
     content_id_arr = content_tags["ContentID"].values.astype(np.int32)
     tags_arr = content_tags["CONTTag"].values.astype(np.int8)
-    rng = np.random.default_rng()
+    if rng is None:
+        rng = np.random.default_rng()
     print(f"🧾 Extração de colunas principais: {time.time() - start:.4f}s")
 
-    ## Etapa 2: processamento de tags
-    start = time.time()
-    content_tag_map = get_map(content_id_arr, tags_arr)
-    print(f"🏷️ Mapeamento de tags por conteúdo (Improved): {time.time() - start:.4f}s")
-
-    ## Etapa 3: categorias → conteúdos
-    start = time.time()
-    cat_to_content = {}
-    for cid, cat in zip(content_ids, content_categories):
-        cat_to_content.setdefault(cat, []).append(cid)
-    print(f"🗂️ Mapeamento de categoria → conteúdos: {time.time() - start:.4f}s")
-    
-    ## Etapa 4: conteúdo → categoria
-    start = time.time()
-    content_id_to_category = dict(zip(content_ids, content_categories))
-    print(f"📚 Mapeamento de conteúdo → categoria: {time.time() - start:.4f}s")
-
-    ## Etapa 5: conteúdos assistidos
+    ## Etapa 2: matriz de tags (conteúdos ordenados por categoria, em blocos contíguos)
     start = time.time()
-    watched_mask = uwatchingcont["UWatchDurationCONT"].values > 0
-    uw_user_ids = uwatchingcont["UserID"].values[watched_mask].astype(np.int32)
-    uw_content_ids = uwatchingcont["ContentID"].values[watched_mask].astype(np.int32)
-
-    user_watched_map = {}
-    for uid, cid in zip(uw_user_ids, uw_content_ids):
-        user_watched_map.setdefault(uid, []).append(cid)
-    print(f"🎬 Mapeamento de conteúdos assistidos: {time.time() - start:.4f}s")
-
-    ## Etapa 6: curtidas e merge
-    start = time.time()
-    likes = userinteraction[userinteraction["UINTType"] == 1][["UserID", "UINTID"]]
-    likes_with_content = likes.merge(ucontint, on="UINTID", how="inner")
-
-    like_map = {}
-    for uid, cid in zip(likes_with_content["UserID"], likes_with_content["ContentID"]):
-        like_map.setdefault(uid, []).append(cid)
-    print(f"❤️ Mapeamento de curtidas (com merge): {time.time() - start:.4f}s")
-
-    ## Total da preparação
-    print(f"✅ Dados mapeados em {time.time() - prep_start:.4f}s. Iniciando recomendação...\n")
+    tag_matrix = TagMatrix(content_ids, content_categories, content_id_arr, tags_arr)
+    print(f"🏷️ Matriz conteúdo × tag: {time.time() - start:.4f}s")
 
     num_users = len(user_ids)
     # Garantir que temos elementos suficientes
     if len(content_ids) < n:
         raise ValueError("Não há conteúdos suficientes para realizar fallback com replace=False.")
-
-    # Pré-gerar fallbacks únicos por usuário fora do loop
-    # Amostra única de shape (num_users, n), sem repetição por usuário
-    fallback_sample_init = time.time()
     fallback_global = rng.choice(content_ids, size=n, replace=False)
-    # Cria base com fallback para todos
-    user_ids_repeated = np.repeat(user_ids, n)
-    ranks = np.tile(np.arange(1, n + 1), num_users)
-    fallback_contents = np.tile(fallback_global, num_users)
-
-    # Shape (num_users * n, 3)
-    result_matrix = np.column_stack((user_ids_repeated, fallback_contents, ranks))
-    user_row_start = [idx * n for idx, _ in enumerate(user_ids)]
-    print(f'Finished fallback sample in: {time.time() - fallback_sample_init}s')
-
-    # Timers acumulativos
-    tag_time = 0.0
-    cat_time = 0.0
-    score_time = 0.0
-    fallback_time = 0.0
-    sort_time = 0.0
-    likes_time = 0.0
-    watch_time = 0.0
-    loop_start = time.time()
-
-    empty_array = np.zeros(16, dtype=np.int16)
-    seen_tags = empty_array.copy()
-
-    for user_idx, user_id in enumerate(user_ids):
-        likes_start = time.time()
-        liked = like_map.get(user_id, [])
-
-        if not hasattr(liked, '__len__') or len(liked) == 0:
-            fb_start = time.time()
-            fallback_time += time.time() - fb_start
-            likes_time += time.time() - likes_start
-            continue
-        
-        watch_start = time.time()
-        watched = user_watched_map.get(user_id, [])
-        seen_content = set(watched).union(liked)
-        watch_time += time.time() - watch_start
-        
-        # Contar tags
-        tag_start = time.time()
-        seen_tags[:] = 0
-        for cid in watched:
-            for tag in content_tag_map.get(cid, []):
-                seen_tags[tag] += 1
-        for cid in liked:
-            for tag in content_tag_map.get(cid, []):
-                seen_tags[tag] += 2
-        tag_time += time.time() - tag_start
-
-        # Categoria dominante
-        cat_start = time.time()
-        liked_cats = [content_id_to_category.get(cid) for cid in liked]
-        main_cat = liked_cats[np.argmax(np.bincount(liked_cats))]
-        candidate_cids = set(cat_to_content.get(main_cat, [])) - seen_content
-        cat_time += time.time() - cat_start
-
-        # Scoring
-        score_start = time.time()
-        scored = []
-        for cid in candidate_cids:
-            tags = content_tag_map.get(cid, [])
-            score = np.sum(seen_tags[tags])
-            if score > 0:
-                scored.append((cid, score))
-        score_time += time.time() - score_start
-
-        if not scored:
-            continue
-        else:
-            sort_start = time.time()
-            top_scored_ids = [cid for cid, _ in nlargest(n, scored, key=lambda x: x[1])]
-            start_idx = user_row_start[user_idx]
-            length = len(top_scored_ids)
-            result_matrix[start_idx:start_idx + length, 1] = top_scored_ids
-            sort_time += time.time() - sort_start
-
-    total_time = time.time() - total_start
-    loop_total_time = time.time() - loop_start
-
-    print("\n⏱️ Resumo de tempos:")
-    print(f"🔁 Loop total:         {loop_total_time:.4f}s")
-    print(f"   🏷️  Likes:           {likes_time:.4f}s")
-    print(f"   🏷️  Visualizações:   {watch_time:.4f}s")
-    print(f"   🏷️  Tags:            {tag_time:.4f}s")
-    print(f"   🗂️  Categorias:      {cat_time:.4f}s")
-    print(f"   📊 Scoring:         {score_time:.4f}s")
-    print(f"   📉 Ordenação:       {sort_time:.4f}s")
-    print(f"   🪂 Fallbacks:       {fallback_time:.4f}s")
-    print(f"\n⏳ Tempo total função: {total_time:.4f}s\n")
-
-    return np.array(result_matrix, dtype=np.int32)
\ No newline at end of file
+
+    ## Etapa 3: perfis dos usuários amostrados
+    start = time.time()
+    # Um mesmo usuário pode ter sido amostrado mais de uma vez: os perfis são calculados por usuário distinto
+    unique_user_ids, user_positions = np.unique(user_ids, return_inverse=True)
+    if profiles is not None:
+        user_state = profiles.lookup(unique_user_ids)
+    else:
+        user_state = _profiles_from_history(
+            tag_matrix, unique_user_ids, uwatchingcont, userinteraction, ucontint
+        )
+    print(f"👤 Perfis de tags: {time.time() - start:.4f}s")
+    print(f"✅ Dados mapeados em {time.time() - prep_start:.4f}s. Iniciando recomendação...\n")
+
+    ## Etapa 4: pontuação em lote por bloco de categoria e top-n
+    start = time.time()
+    recommend_top_n = BACKENDS[backend or DEFAULT_BACKEND]
+    index = CategoryIndex(tag_matrix)
+    fallback = fallback_global
+    if popularity is not None:
+        candidates = tag_matrix.sorted_ids if restrict_trending else None
+        fallback = popularity.fallback(user_state[1], candidates, fallback_global)
+    if cache is not None and profiles is not None:
+        top_n = _recommend_cached(
+            cache, profiles, recommend_top_n, tag_matrix, index, unique_user_ids, user_state, n, fallback
+        )
+        print(f"🗃️ Cache: {cache.stats()}")
+    else:
+        top_n = recommend_top_n(tag_matrix, *user_state, n, fallback, index=index)
+    if segments is not None:
+        _recommend_cold(segments, recommend_top_n, tag_matrix, index, unique_user_ids, user_state, n, top_n)
+    top_n = top_n[user_positions]
+    print(f"📊 Pontuação e top-n: {time.time() - start:.4f}s")
+
+    # Shape (num_users * n, 3): [usuário, conteúdo, rank]
+    result_matrix = np.column_stack((
+        np.repeat(user_ids, n),
+        top_n.ravel(),
+        np.tile(np.arange(1, n + 1, dtype=np.int32), num_users),
+    ))
+    print(f"\n⏳ Tempo total função: {time.time() - total_start:.4f}s\n")
+
+    return np.asarray(result_matrix, dtype=np.int32)
@@ -0,0 +1,198 @@
+"""
+Module: recommender
+-------------------
+
+Recomendador de baixa latência para consultas avulsas (por exemplo, atrás de um front-end).
+
+`recommendate` trabalha em lote sobre DataFrames e remonta a matriz de tags e o índice de categorias a cada
+chamada, então uma consulta de um único usuário custa o mesmo que um lote inteiro. O `Recommender` monta esses
+índices uma vez e os mantém entre consultas:
+
+- tags dos conteúdos e faixas por categoria (`TagMatrix` + `CategoryIndex`), remontados só quando o catálogo muda;
+- histórico e perfil de cada usuário (`ProfileStore`), atualizados de forma incremental por `update`;
+- cache de top-n por usuário (`RecommendationCache`), invalidado pela versão do perfil;
+- opcionalmente, tendências (`PopularityStore`) para o fallback e segmentos (`SegmentStore`) para a partida fria.
+
+O resultado é o mesmo de `recommendate` com os mesmos perfis e candidatos, exceto pelo fallback sorteado:
+aqui ele é sorteado uma vez por catálogo, e não a cada chamada.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.engine import TagMatrix
+from src.recommendation.category_index import CategoryIndex
+from src.recommendation.profiles import ProfileStore
+from src.recommendation.cache import RecommendationCache
+from src.recommendation.recommendate import BACKENDS, DEFAULT_BACKEND, _recommend_cached, _recommend_cold
+
+# Número padrão de recomendações por consulta
+DEFAULT_N = 10
+
+
+class Recommender:
+    """
+    Índices do recomendador montados uma vez, com consultas por usuário e atualização incremental.
+
+    Parâmetros:
+    - content (pd.DataFrame): Catálogo candidato (CONTENT: ContentID, CONTCategory).
+    - content_tags (pd.DataFrame): Tags do catálogo (CONTENT_CONTTag: ContentID, CONTTag).
+    - profiles (ProfileStore, opcional): Perfis já carregados (por exemplo, `ProfileStore.from_tables`).
+    - popularity (PopularityStore, opcional): Tendências usadas como fallback.
+    - segments (SegmentStore, opcional): Perfis por segmento para usuários sem curtidas.
+    - backend (str, opcional): Implementação do top-n ('numpy' ou 'numba').
+    - seed (int, opcional): Semente do fallback sorteado.
+    """
+
+    def __init__(
+        self,
+        content: pd.DataFrame,
+        content_tags: pd.DataFrame,
+        profiles: ProfileStore = None,
+        popularity=None,
+        segments=None,
+        backend: str = None,
+        seed: int = None
+    ):
+        self.profiles = profiles if profiles is not None else ProfileStore()
+        self.popularity = popularity
+        self.segments = segments
+        self.recommend_top_n = BACKENDS[backend or DEFAULT_BACKEND]
+        self.rng = np.random.default_rng(seed)
+        self._caches = {}
+
+        self._content_ids = np.empty(0, dtype=np.int32)
+        self._content_categories = np.empty(0, dtype=np.int8)
+        self._tag_content_ids = np.empty(0, dtype=np.int32)
+        self._tags = np.empty(0, dtype=np.int8)
+        self.add_content(content, content_tags)
+
+    def __len__(self) -> int:
+        """Número de conteúdos candidatos."""
+        return len(self.tag_matrix)
+
+    def add_content(self, content: pd.DataFrame, content_tags: pd.DataFrame = None):
+        """
+        Acrescenta conteúdos ao catálogo candidato e remonta a matriz de tags e o índice de categorias.
+
+        Parâmetros:
+        - content (pd.DataFrame): Conteúdos novos (ContentID, CONTCategory).
+        - content_tags (pd.DataFrame, opcional): Tags dos conteúdos novos (ContentID, CONTTag).
+        """
+        # Perfis carregados com `ProfileStore.from_tables` já conhecem o catálogo: as tags são somadas, então
+        # só os conteúdos ainda sem categoria são registrados
+        content_ids = content["ContentID"].to_numpy(dtype=np.int64)
+        categories = self.profiles.content_categories
+        known = content_ids < categories.shape[0]
+        known[known] = categories[content_ids[known]] >= 0
+        unknown = content[~known]
+        self.profiles.add_content(
+            unknown,
+            None if content_tags is None
+            else content_tags[content_tags["ContentID"].isin(unknown["ContentID"]).to_numpy()]
+        )
+        if self.popularity is not None:
+            self.popularity.add_content(content)
+        self._content_ids = np.concatenate((self._content_ids, content["ContentID"].to_numpy(dtype=np.int32)))
+        self._content_categories = np.concatenate(
+            (self._content_categories, content["CONTCategory"].to_numpy(dtype=np.int8))
+        )
+        if content_tags is not None:
+            self._tag_content_ids = np.concatenate(
+                (self._tag_content_ids, content_tags["ContentID"].to_numpy(dtype=np.int32))
+            )
+            self._tags = np.concatenate((self._tags, content_tags["CONTTag"].to_numpy(dtype=np.int8)))
+
+        self.tag_matrix = TagMatrix(self._content_ids, self._content_categories, self._tag_content_ids, self._tags)
+        self.index = CategoryIndex(self.tag_matrix)
+        # Fallback sorteado uma vez por catálogo: uma permutação, da qual cada consulta usa o prefixo
+        self._shuffled = self.rng.permutation(self._content_ids)
+
+    def add_users(self, users: pd.DataFrame):
+        """Registra o segmento de usuários novos (tabela `users`); sem `segments`, não faz nada."""
+        if self.segments is not None:
+            self.segments.add_users(users)
+
+    def update(
+        self,
+        new_watches: pd.DataFrame = None,
+        new_interactions: pd.DataFrame = None,
+        current_datetime: float = None
+    ):
+        """
+        Incorpora visualizações e interações novas aos perfis (e às tendências e segmentos, se houver).
+
+        Parâmetros:
+        - new_watches (pd.DataFrame, opcional): Linhas de UWATCHINGCONT (UserID, ContentID,
+          UWatchDurationCONT, UWatchCONTDateTime).
+        - new_interactions (pd.DataFrame, opcional): Uma linha por interação (UserID, ContentID, UINTType).
+        - current_datetime (float, opcional): Instante das interações, para as tendências (padrão: agora).
+        """
+        new = {}
+        if new_watches is not None:
+            new["UWATCHINGCONT"] = new_watches
+        if new_interactions is not None:
+            # Interações avulsas não têm UINTID: um identificador local liga as duas tabelas
+            interaction_ids = np.arange(new_interactions.shape[0], dtype=np.int64)
+            new["USERINTERACTION"] = pd.DataFrame({
+                "UINTType": new_interactions["UINTType"].to_numpy(),
+                "UINTID": interaction_ids,
+                "UserID": new_interactions["UserID"].to_numpy(),
+            })
+            new["UCONTINT"] = pd.DataFrame({
+                "UINTID": interaction_ids,
+                "ContentID": new_interactions["ContentID"].to_numpy(),
+            })
+
+        self.profiles.update(new)
+        if self.popularity is not None:
+            self.popularity.update(new, time.time() if current_datetime is None else current_datetime)
+        if self.segments is not None:
+            self.segments.update(new)
+
+    def recommend(self, user_id: int, n: int = DEFAULT_N) -> np.ndarray:
+        """
+        Top-n de um único usuário.
+
+        Retorno:
+        - np.ndarray: n ContentIDs (int32), do melhor para o pior.
+        """
+        return self.recommend_batch(np.array([user_id], dtype=np.int64), n)[0]
+
+    def recommend_batch(self, user_ids, n: int = DEFAULT_N) -> np.ndarray:
+        """
+        Top-n de um lote de usuários (pode ter repetidos).
+
+        Retorno:
+        - np.ndarray: `(usuários × n)` int32 com os ContentIDs recomendados, do melhor para o pior.
+        """
+        if len(self) < n:
+            raise ValueError("Não há conteúdos suficientes para recomendar n itens distintos.")
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        unique_user_ids, positions = np.unique(user_ids, return_inverse=True)
+        user_state = self.profiles.lookup(unique_user_ids)
+
+        fallback = self._shuffled[:n].astype(np.int32)
+        if self.popularity is not None:
+            fallback = self.popularity.fallback(user_state[1], self.tag_matrix.sorted_ids, fallback)
+        top_n = _recommend_cached(
+            self._cache(n), self.profiles, self.recommend_top_n, self.tag_matrix, self.index,
+            unique_user_ids, user_state, n, fallback
+        )
+        if self.segments is not None:
+            _recommend_cold(
+                self.segments, self.recommend_top_n, self.tag_matrix, self.index,
+                unique_user_ids, user_state, n, top_n
+            )
+        return top_n[positions]
+
+    def stats(self) -> dict:
+        """Contadores dos caches de recomendação, por n."""
+        return {n: cache.stats() for n, cache in self._caches.items()}
+
+    def _cache(self, n: int) -> RecommendationCache:
+        if n not in self._caches:
+            self._caches[n] = RecommendationCache(n)
+        return self._caches[n]
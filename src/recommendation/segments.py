@@ -0,0 +1,241 @@
+"""
+Module: segments
+----------------
+
+Recomendações de partida fria por segmento demográfico.
+
+Usuários sem curtidas não têm categoria dominante e, no recomendador, caem no fallback. São a maioria da
+simulação (inclusive os milhões de usuários criados a cada tick). Aqui eles são agrupados por segmento,
+`(user_location, user_language, faixa etária)` da tabela `users`, e cada segmento tem um perfil de tags e um
+histograma de categorias somando as visualizações e curtidas dos seus usuários (mesmos pesos do
+`ProfileStore`). O perfil do segmento é a "popularidade entre usuários parecidos".
+
+Por chamada do recomendador, o top-n é calculado uma única vez por segmento presente no lote, com o mesmo
+motor dos usuários (`recommend_top_n`), e os usuários frios recebem o top do seu segmento por uma indexação
+vetorizada. A exclusão de conteúdos já vistos não é feita por usuário: o custo por usuário fica em uma busca
+do seu segmento.
+
+As tags e categorias dos conteúdos vêm do `ProfileStore` do recomendador, que é atualizado antes. O estado
+depende apenas do histórico (usuários, visualizações e curtidas), então é reconstruído de forma determinística
+com `from_tables` ao retomar uma simulação.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.initialization.vocabularies import ISO3, LANGUAGE
+from src.recommendation.engine import TAG_SLOTS, accumulate_rows
+from src.recommendation.profiles import ProfileStore, _grow, LIKE, WATCH_WEIGHT, LIKE_WEIGHT
+
+# Limites (inclusivos à esquerda) das faixas etárias
+AGE_BUCKETS = np.array([13, 18, 25, 35, 45, 55, 65], dtype=np.int64)
+
+# Bits de cada idioma na chave da combinação de idiomas (até 3 por usuário, ver `generate_user_languages`)
+LANGUAGE_BITS = 10
+MAX_USER_LANGUAGES = 3
+
+# Maior peso de tag passado ao motor: perfis de segmento somam muitos usuários e são reescalados para int32
+MAX_PROFILE_WEIGHT = 1 << 20
+
+
+def segment_keys(users: pd.DataFrame) -> np.ndarray:
+    """
+    Chave de segmento de cada usuário: `(localização << 40) | (idiomas << 8) | faixa etária`.
+
+    Parâmetros:
+    - users (pd.DataFrame): Linhas da tabela `users` (user_location, user_language, user_age).
+    """
+    locations = ISO3.encode(users["user_location"]).astype(np.int64)
+    languages = language_keys(users["user_language"])
+    buckets = np.searchsorted(AGE_BUCKETS, users["user_age"].to_numpy(dtype=np.int64), side='right')
+    return (locations << 40) | (languages << 8) | buckets
+
+
+def language_keys(user_language) -> np.ndarray:
+    """
+    Chave da combinação de idiomas ("pt,en,es") de cada usuário, sem vocabulário de combinações: o código fixo
+    de cada idioma em `LANGUAGE` (mais 1; 0 = posição vazia) ocupa `LANGUAGE_BITS` bits, na ordem da lista.
+
+    Só as combinações distintas do lote são separadas; o restante é uma indexação vetorizada.
+
+    Parâmetros:
+    - user_language (pd.Series): Coluna `user_language` da tabela `users`.
+    """
+    codes, combinations = pd.factorize(np.asarray(user_language, dtype=object))
+    parts = pd.Series(combinations, dtype=object).str.split(',', n=MAX_USER_LANGUAGES - 1, expand=True)
+    keys = np.zeros(len(combinations), dtype=np.int64)
+    for position in range(parts.shape[1]):
+        column = parts[position]
+        present = column.notna().to_numpy()
+        language_codes = LANGUAGE.encode(column[present]).astype(np.int64) + 1
+        if language_codes.size and language_codes.max() >= 1 << LANGUAGE_BITS:
+            raise ValueError(f"Mais de {(1 << LANGUAGE_BITS) - 1} idiomas não cabem na chave de segmento.")
+        keys[present] |= language_codes << (position * LANGUAGE_BITS)
+    return keys[codes]
+
+
+class SegmentStore:
+    """
+    Perfis de tags e categorias por segmento demográfico, atualizados por tick.
+
+    Parâmetros:
+    - profiles (ProfileStore): Perfis dos usuários, de onde vêm as tags e categorias dos conteúdos.
+    """
+
+    def __init__(self, profiles: ProfileStore):
+        self.profiles = profiles
+
+        # Segmento de cada usuário (denso por UserID; -1 = usuário desconhecido)
+        self._user_segments = np.full(0, -1, dtype=np.int32)
+
+        # Segmentos: chaves ordenadas -> linha nos arrays abaixo (em ordem de chegada)
+        self._segment_keys = np.empty(0, dtype=np.int64)
+        self._segment_rows = np.empty(0, dtype=np.int64)
+        self._num_segments = 0
+        self._profiles = np.zeros((0, TAG_SLOTS), dtype=np.int64)
+        self._category_counts = np.zeros((0, TAG_SLOTS), dtype=np.int64)
+
+    @classmethod
+    def from_tables(cls, tables: dict, profiles: ProfileStore) -> 'SegmentStore':
+        """
+        Reconstrói os segmentos a partir do histórico.
+
+        Parâmetros:
+        - tables (dict): Tabelas com users, UWATCHINGCONT, USERINTERACTION e UCONTINT.
+        - profiles (ProfileStore): Perfis já atualizados com o catálogo de conteúdos.
+        """
+        store = cls(profiles)
+        store.update(tables)
+        return store
+
+    def __len__(self) -> int:
+        return self._num_segments
+
+    def update(self, new: dict):
+        """
+        Incorpora as linhas novas de um tick (users, UWATCHINGCONT, USERINTERACTION, UCONTINT), depois de
+        `ProfileStore.update`. Tabelas ausentes são ignoradas.
+        """
+        if "users" in new:
+            self.add_users(new["users"])
+        if "UWATCHINGCONT" in new:
+            self.add_watches(new["UWATCHINGCONT"])
+        if "USERINTERACTION" in new and "UCONTINT" in new:
+            self.add_interactions(new["USERINTERACTION"], new["UCONTINT"])
+
+    def add_users(self, users: pd.DataFrame):
+        """Registra o segmento de usuários novos."""
+        user_ids = users["user_id"].to_numpy(dtype=np.int64)
+        if user_ids.shape[0] == 0:
+            return
+        keys = segment_keys(users)
+        self._user_segments = _grow(self._user_segments, int(user_ids.max()) + 1, -1)
+        self._user_segments[user_ids] = self._rows(keys)
+
+    def add_watches(self, uwatchingcont: pd.DataFrame):
+        """Soma as visualizações novas (duração positiva) aos perfis dos segmentos."""
+        watched = uwatchingcont[uwatchingcont["UWatchDurationCONT"].to_numpy() > 0]
+        segments = self.segments(watched["UserID"].to_numpy(dtype=np.int64))
+        self._add_tags(segments, watched["ContentID"].to_numpy(dtype=np.int64), WATCH_WEIGHT)
+
+    def add_interactions(self, userinteraction: pd.DataFrame, ucontint: pd.DataFrame):
+        """Soma as curtidas novas (USERINTERACTION e UCONTINT do mesmo tick) aos perfis dos segmentos."""
+        likes = userinteraction[userinteraction["UINTType"].to_numpy() == LIKE]
+        positions = pd.Index(ucontint["UINTID"]).get_indexer(likes["UINTID"])
+        found = positions >= 0
+        segments = self.segments(likes["UserID"].to_numpy(dtype=np.int64)[found])
+        content_ids = ucontint["ContentID"].to_numpy(dtype=np.int64)[positions[found]]
+        self._add_tags(segments, content_ids, LIKE_WEIGHT)
+
+        content_categories = self.profiles.content_categories
+        known = (segments >= 0) & (content_ids < content_categories.shape[0])
+        categories = content_categories[content_ids[known]].astype(np.int64)
+        valid = categories >= 0
+        np.add.at(self._category_counts, (segments[known][valid], categories[valid]), 1)
+
+    def segments(self, user_ids) -> np.ndarray:
+        """Linha do segmento de cada usuário (-1 para usuários desconhecidos)."""
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        known = user_ids < self._user_segments.shape[0]
+        segments = np.full(user_ids.shape[0], -1, dtype=np.int64)
+        segments[known] = self._user_segments[user_ids[known]]
+        return segments
+
+    def lookup(self, segments: np.ndarray) -> tuple:
+        """
+        Estado de um lote de segmentos distintos, no formato esperado por `engine.recommend_top_n`
+        (sem conteúdos vistos).
+
+        Retorno:
+        - tuple: (profiles, main_categories, has_likes, seen_starts, seen_ends, seen_contents).
+        """
+        profiles = self._profiles[segments]
+        # Reescala para int32 preservando a ordem das tags (perfis de segmento somam muitos usuários)
+        largest = profiles.max(axis=1, initial=0)
+        scale = largest > MAX_PROFILE_WEIGHT
+        profiles[scale] = profiles[scale] * MAX_PROFILE_WEIGHT // largest[scale, None]
+
+        category_counts = self._category_counts[segments]
+        has_likes = category_counts.any(axis=1)
+        main_categories = np.where(has_likes, category_counts.argmax(axis=1), -1)
+        empty = np.zeros(segments.shape[0], dtype=np.int64)
+        return (profiles.astype(np.int32), main_categories, has_likes,
+                empty, empty, np.empty(0, dtype=np.int32))
+
+    def recommend(
+        self,
+        recommend_top_n,
+        tag_matrix,
+        index,
+        user_ids: np.ndarray,
+        n: int
+    ) -> np.ndarray:
+        """
+        Top-n do segmento de cada usuário, calculado uma vez por segmento presente no lote.
+
+        Parâmetros:
+        - recommend_top_n (callable): Backend do top-n (`engine.recommend_top_n` ou o Numba).
+        - tag_matrix (engine.TagMatrix): Candidatos da chamada.
+        - index (CategoryIndex): Índice de candidatos de `tag_matrix`.
+        - user_ids (np.ndarray): IDs dos usuários frios.
+        - n (int): Número de recomendações.
+
+        Retorno:
+        - np.ndarray: `(usuários × n)` int32, com -1 nas posições que o segmento não preenche
+          (segmento desconhecido, sem curtidas ou sem candidatos com pontuação positiva).
+        """
+        segments = self.segments(user_ids)
+        result = np.full((user_ids.shape[0], n), -1, dtype=np.int32)
+        known = segments >= 0
+        if not known.any():
+            return result
+        unique_segments, positions = np.unique(segments[known], return_inverse=True)
+        top = recommend_top_n(
+            tag_matrix, *self.lookup(unique_segments), n, np.full(n, -1, dtype=np.int32), index=index
+        )
+        result[known] = top[positions]
+        return result
+
+    def _rows(self, keys: np.ndarray) -> np.ndarray:
+        """Linha de cada chave de segmento, criando as que ainda não existem."""
+        positions = np.minimum(np.searchsorted(self._segment_keys, keys), max(self._segment_keys.shape[0] - 1, 0))
+        found = self._segment_keys[positions] == keys if self._segment_keys.shape[0] else np.zeros(keys.shape, bool)
+        if not found.all():
+            new_keys = np.unique(keys[~found])
+            new_rows = np.arange(self._num_segments, self._num_segments + new_keys.shape[0], dtype=np.int64)
+            self._num_segments += new_keys.shape[0]
+            self._profiles = _grow(self._profiles, self._num_segments)
+            self._category_counts = _grow(self._category_counts, self._num_segments)
+            insert_at = np.searchsorted(self._segment_keys, new_keys)
+            self._segment_keys = np.insert(self._segment_keys, insert_at, new_keys)
+            self._segment_rows = np.insert(self._segment_rows, insert_at, new_rows)
+            positions = np.searchsorted(self._segment_keys, keys)
+        return self._segment_rows[positions]
+
+    def _add_tags(self, segments: np.ndarray, content_ids: np.ndarray, weight: int):
+        content_tags = self.profiles.content_tags
+        known = (segments >= 0) & (content_ids < content_tags.shape[0])
+        if not known.any():
+            return
+        values = content_tags[content_ids[known]].astype(np.int64) * weight
+        accumulate_rows(self._profiles, segments[known], values)
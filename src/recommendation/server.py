@@ -0,0 +1,280 @@
+"""
+Module: server
+--------------
+
+Servidor local de recomendações com micro-lotes (asyncio, HTTP ou socket Unix).
+
+Cada requisição `recommend(user_id)` entra em uma fila. Um único consumidor junta as requisições que chegam
+juntas em um micro-lote, limitado por um tempo máximo de espera (`max_wait_ms`, contado a partir da primeira
+requisição do lote) e por um tamanho máximo (`max_batch_size`), e atende o lote com uma única chamada
+vetorizada de `Recommender.recommend_batch`. A chamada roda em uma thread à parte, então o laço de eventos
+continua aceitando requisições (que formam o próximo lote) enquanto o lote atual é pontuado. O `Recommender`
+não é thread-safe, mas só essa thread o usa.
+
+Rotas (HTTP/1.1, com keep-alive):
+- `GET /recommend?user_id=<id>&n=<n>`: `{"user_id": ..., "recommendations": [...]}`;
+- `GET /stats`: contadores de requisições e lotes, vazão e latência p50/p95/p99 (em ms) das últimas
+  `LATENCY_WINDOW` requisições, medida da chegada na fila até a resposta.
+
+O cliente de carga está em `src.recommendation.load_generator`.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.recommender import Recommender, DEFAULT_N
+
+# Endereço padrão do servidor HTTP
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Limites padrão de um micro-lote
+MAX_WAIT_MS = 2.0
+MAX_BATCH_SIZE = 1024
+
+# Conexões pendentes aceitas pelo socket (em sockets Unix, o padrão de 100 recusa rajadas de clientes)
+BACKLOG = 1024
+
+# Número de latências guardadas para os percentis (janela circular)
+LATENCY_WINDOW = 100_000
+
+# Percentis de latência reportados
+LATENCY_PERCENTILES = (50, 95, 99)
+
+STATUS_TEXT = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"
+}
+
+
+class MicroBatcher:
+    """
+    Fila de requisições atendidas em micro-lotes por um `Recommender`.
+
+    Parâmetros:
+    - recommender (Recommender): Recomendador já carregado.
+    - max_wait_ms (float): Espera máxima, a partir da primeira requisição, antes de fechar um lote.
+    - max_batch_size (int): Número máximo de requisições por lote.
+    """
+
+    def __init__(self, recommender: Recommender, max_wait_ms: float = MAX_WAIT_MS,
+                 max_batch_size: int = MAX_BATCH_SIZE):
+        self.recommender = recommender
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self._latencies = np.zeros(LATENCY_WINDOW)
+        self._started = time.perf_counter()
+        self._queue = None
+        self._worker = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        """Inicia o consumidor da fila no laço de eventos atual."""
+        self._queue = asyncio.Queue()
+        self._started = time.perf_counter()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        """Para o consumidor e a thread de pontuação."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def recommend(self, user_id: int, n: int = DEFAULT_N) -> np.ndarray:
+        """Top-n de um usuário, atendido no próximo micro-lote."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((int(user_id), int(n), time.perf_counter(), future))
+        return await future
+
+    def stats(self) -> dict:
+        """Contadores de requisições e lotes, vazão e percentis de latência (ms)."""
+        elapsed = time.perf_counter() - self._started
+        stats = {
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "requests_per_second": self.requests / elapsed if elapsed > 0 else 0.0,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+        latencies = self._latencies[:min(self.requests, LATENCY_WINDOW)]
+        values = np.percentile(latencies, LATENCY_PERCENTILES) if latencies.shape[0] else np.zeros(3)
+        for percentile, value in zip(LATENCY_PERCENTILES, values):
+            stats[f"latency_p{percentile}_ms"] = float(value) * 1000
+        return stats
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = batch[0][2] + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._serve(loop, batch)
+
+    async def _serve(self, loop, batch: list):
+        """Atende um lote: uma chamada vetorizada por valor de n presente no lote."""
+        self.batches += 1
+        by_n = {}
+        for request in batch:
+            by_n.setdefault(request[1], []).append(request)
+        for n, requests in by_n.items():
+            user_ids = np.array([request[0] for request in requests], dtype=np.int64)
+            try:
+                result = await loop.run_in_executor(self._executor, self.recommender.recommend_batch, user_ids, n)
+            except Exception as error:
+                self.errors += len(requests)
+                for request in requests:
+                    if not request[3].done():
+                        request[3].set_exception(error)
+                continue
+            now = time.perf_counter()
+            for request, recommendations in zip(requests, result):
+                self._latencies[self.requests % LATENCY_WINDOW] = now - request[2]
+                self.requests += 1
+                if not request[3].done():
+                    request[3].set_result(recommendations)
+
+
+def _response(status: int, body: dict) -> bytes:
+    payload = json.dumps(body).encode()
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "\r\n"
+    )
+    return head.encode() + payload
+
+
+async def _route(batcher: MicroBatcher, method: str, target: str) -> tuple:
+    """Resposta `(status, corpo)` de uma requisição."""
+    if method != "GET":
+        return 405, {"error": "only GET is supported"}
+    url = urlsplit(target)
+    if url.path == "/stats":
+        return 200, batcher.stats()
+    if url.path != "/recommend":
+        return 404, {"error": f"unknown path {url.path}"}
+    query = parse_qs(url.query)
+    try:
+        user_id = int(query["user_id"][0])
+        n = int(query.get("n", [DEFAULT_N])[0])
+    except (KeyError, ValueError):
+        return 400, {"error": "expected integer user_id (and optional n)"}
+    try:
+        recommendations = await batcher.recommend(user_id, n)
+    except ValueError as error:
+        return 400, {"error": str(error)}
+    except Exception as error:
+        # Qualquer outra falha do recomendador vira 500, sem derrubar a conexão
+        return 500, {"error": f"{type(error).__name__}: {error}"}
+    return 200, {"user_id": user_id, "recommendations": recommendations.tolist()}
+
+
+def connection_handler(batcher: MicroBatcher):
+    """Handler de conexões para `asyncio.start_server`/`start_unix_server`."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) < 2:
+                    writer.write(_response(400, {"error": "malformed request line"}))
+                    break
+                status, body = await _route(batcher, parts[0], parts[1])
+                writer.write(_response(status, body))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    return handle
+
+
+async def serve(
+    recommender: Recommender,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: str = None,
+    max_wait_ms: float = MAX_WAIT_MS,
+    max_batch_size: int = MAX_BATCH_SIZE
+):
+    """
+    Atende requisições até ser cancelado.
+
+    Parâmetros:
+    - recommender (Recommender): Recomendador já carregado.
+    - host (str), port (int): Endereço HTTP (ignorados se `path` for dado).
+    - path (str, opcional): Caminho de um socket Unix, no lugar de TCP.
+    - max_wait_ms (float): Espera máxima de um micro-lote.
+    - max_batch_size (int): Tamanho máximo de um micro-lote.
+    """
+    batcher = MicroBatcher(recommender, max_wait_ms, max_batch_size)
+    batcher.start()
+    handle = connection_handler(batcher)
+    if path is not None:
+        server = await asyncio.start_unix_server(handle, path=path, backlog=BACKLOG)
+    else:
+        server = await asyncio.start_server(handle, host, port, backlog=BACKLOG)
+    print(f"Servindo recomendações em {path or f'http://{host}:{port}'}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.close()
+
+
+def load_recommender(**kwargs) -> Recommender:
+    """
+    Monta um `Recommender` com o catálogo e o histórico salvos no disco.
+
+    Parâmetros:
+    - **kwargs: Repassados para `Recommender` (por exemplo, `backend`, `seed`).
+    """
+    from src.initialization.initialize_tables import TABLE_PATHS
+    from src.recommendation.profiles import ProfileStore
+
+    names = ["CONTENT", "CONTENT_CONTTag", "UWATCHINGCONT", "USERINTERACTION", "UCONTINT"]
+    tables = {name: pd.read_parquet(TABLE_PATHS[name]) for name in names}
+    profiles = ProfileStore.from_tables(tables)
+    return Recommender(tables["CONTENT"], tables["CONTENT_CONTTag"], profiles=profiles, **kwargs)
+
+
+if __name__ == '__main__':
+    asyncio.run(serve(load_recommender()))
@@ -0,0 +1,43 @@
+"""
+Fixtures compartilhadas dos testes da simulação.
+
+A simulação completa depende das extensões Cython compiladas e dos dados de `data/behavior_generated`;
+os testes que a executam são pulados quando algum deles não está disponível.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Usuários criados por tick nos testes (a simulação real usa `USERS_PER_TICK`)
+TEST_USERS_PER_TICK = 2_000
+
+
+def require_simulation():
+    """Importa os geradores da simulação, pulando o teste se as extensões ou os dados não existirem."""
+    try:
+        from src.iteration import iterate
+        from src.generators import user_generator, channel_generator, content_generator  # noqa: F401
+    except (ImportError, FileNotFoundError) as error:
+        pytest.skip(f"simulação indisponível: {error}")
+    return iterate
+
+
+@pytest.fixture
+def simulation(tmp_path, monkeypatch):
+    """
+    Módulo `iterate` com as tabelas redirecionadas para um diretório temporário e poucos usuários por tick.
+    """
+    from src import DATA_PATH
+    iterate = require_simulation()
+    for name, path in iterate.TABLE_PATHS.items():
+        target = tmp_path / os.path.relpath(path, DATA_PATH)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        monkeypatch.setitem(iterate.TABLE_PATHS, name, str(target))
+    monkeypatch.setattr(iterate, "USERS_PER_TICK", TEST_USERS_PER_TICK)
+    return iterate
@@ -0,0 +1,95 @@
+"""
+Motor do recomendador: `engine.recommend_top_n` (e o backend Numba) contra uma referência por força bruta,
+usuário a usuário, com muitos empates de pontuação e blocos de candidatos menores que uma categoria.
+"""
+
+import numpy as np
+import pytest
+
+from src.recommendation import engine
+from src.recommendation.category_index import CategoryIndex
+
+NUM_CONTENT = 240
+NUM_USERS = 80
+N = 5
+FALLBACK = np.arange(10_000, 10_000 + N, dtype=np.int32)
+
+
+def _dataset(seed: int = 0) -> tuple:
+    """Poucas tags e categorias, para que as pontuações empatem com frequência."""
+    rng = np.random.default_rng(seed)
+    content_ids = rng.permutation(NUM_CONTENT).astype(np.int32) * 3
+    categories = rng.integers(1, 4, NUM_CONTENT)
+    tags_per_content = rng.integers(0, 4, NUM_CONTENT)
+    tag_content_ids = np.repeat(content_ids, tags_per_content)
+    tags = rng.integers(1, 5, tag_content_ids.shape[0])
+    tag_matrix = engine.TagMatrix(content_ids, categories, tag_content_ids, tags)
+
+    watched_users = rng.integers(0, NUM_USERS, 6 * NUM_USERS)
+    watched_contents = rng.choice(content_ids, watched_users.shape[0])
+    # Os últimos usuários não curtem nada e ficam com o fallback
+    liked_users = rng.integers(0, NUM_USERS - 5, 2 * NUM_USERS)
+    liked_contents = rng.choice(content_ids, liked_users.shape[0])
+    user_state = engine.user_profiles(
+        tag_matrix, NUM_USERS, watched_users, watched_contents, liked_users, liked_contents
+    )
+    return tag_matrix, user_state
+
+
+def _brute_force(tag_matrix, profiles, main_categories, has_likes, seen_starts, seen_ends, seen_contents, n):
+    result = np.tile(FALLBACK, (profiles.shape[0], 1))
+    scores = tag_matrix.matrix.astype(np.int64) @ profiles.T.astype(np.int64)
+    for user in range(profiles.shape[0]):
+        if not has_likes[user] or main_categories[user] < 0:
+            continue
+        seen = set(seen_contents[seen_starts[user]:seen_ends[user]].tolist())
+        candidates = [
+            (-scores[row, user], int(tag_matrix.content_ids[row]))
+            for row in range(len(tag_matrix))
+            if tag_matrix.categories[row] == main_categories[user]
+            and scores[row, user] > 0 and tag_matrix.content_ids[row] not in seen
+        ]
+        top = [content_id for _, content_id in sorted(candidates)[:n]]
+        result[user, :len(top)] = top
+    return result
+
+
+@pytest.mark.parametrize("chunk", [engine.CANDIDATE_CHUNK, 7, 1])
+def test_engine_matches_brute_force(monkeypatch, chunk):
+    monkeypatch.setattr(engine, "CANDIDATE_CHUNK", chunk)
+    tag_matrix, user_state = _dataset()
+
+    expected = _brute_force(tag_matrix, *user_state, N)
+    result = engine.recommend_top_n(tag_matrix, *user_state, N, FALLBACK)
+
+    np.testing.assert_array_equal(result, expected)
+    assert (result[-5:] == FALLBACK).all()
+    assert (result[:-5] != FALLBACK).any()
+
+
+def test_ties_go_to_the_smallest_content_id():
+    # Todos os conteúdos da categoria têm a mesma tag e a mesma pontuação
+    content_ids = np.array([50, 7, 31, 12, 3, 44], dtype=np.int32)
+    tag_matrix = engine.TagMatrix(content_ids, np.ones(6), content_ids, np.full(6, 2))
+    user_state = engine.user_profiles(
+        tag_matrix, 1, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32), np.array([0]), np.array([12])
+    )
+
+    result = engine.recommend_top_n(tag_matrix, *user_state, 3, FALLBACK[:3])
+    np.testing.assert_array_equal(result, [[3, 7, 31]])
+
+
+def test_numba_backend_matches_engine():
+    pytest.importorskip("numba")
+    from src.recommendation import numba_backend
+    tag_matrix, user_state = _dataset(seed=1)
+    index = CategoryIndex(tag_matrix)
+
+    expected, expected_scores = engine.recommend_top_n(
+        tag_matrix, *user_state, N, FALLBACK, index=index, return_scores=True
+    )
+    result, scores = numba_backend.recommend_top_n(
+        tag_matrix, *user_state, N, FALLBACK, index=index, return_scores=True
+    )
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(scores, expected_scores)
@@ -0,0 +1,29 @@
+"""
+Métricas de ranking: precision, recall, NDCG e cobertura conferidos com valores calculados à mão, incluindo
+uma recomendação repetida (conta uma vez) e uma posição vazia (-1, nunca é acerto).
+"""
+
+import numpy as np
+import pytest
+
+from src.recommendation.evaluation import ranking_metrics, _pair_keys
+
+
+def test_ranking_metrics_by_hand():
+    user_ids = np.array([1, 2, 5])
+    recommendations = np.array([
+        [10, 11, 10],  # acerto na 1ª posição; o 10 repetido não conta de novo
+        [-1, 20, 21],  # a posição vazia não acerta o conteúdo 0, que é relevante; acerto na 3ª posição
+        [10, 30, -1],  # usuário sem relevantes
+    ])
+    relevant = np.sort(_pair_keys([1, 1, 2, 2], [10, 12, 0, 21]))
+
+    metrics = ranking_metrics(user_ids, recommendations, relevant, num_contents=10)
+
+    # Dois relevantes por usuário: DCG ideal em k = 3 é 1 + 1/log2(3)
+    ideal = 1 + 1 / np.log2(3)
+    assert metrics["precision"] == pytest.approx((1 / 3 + 1 / 3 + 0) / 3)
+    assert metrics["recall"] == pytest.approx((1 / 2 + 1 / 2 + 0) / 3)
+    assert metrics["ndcg"] == pytest.approx((1 / ideal + (1 / np.log2(4)) / ideal + 0) / 3)
+    # Conteúdos distintos recomendados: 10, 11, 20, 21 e 30
+    assert metrics["coverage"] == pytest.approx(5 / 10)
@@ -0,0 +1,57 @@
+"""
+Partes Parquet por tick: `consolidate_table` junta o arquivo da tabela e as partes em ordem, ignora partes
+posteriores a `max_tick` e trunca em `max_rows`.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.iteration.parquet_writer import write_part, part_path, parts_dir, consolidate_table, count_rows
+
+
+def _rows(start: int, num: int) -> pd.DataFrame:
+    ids = np.arange(start, start + num, dtype=np.int32)
+    return pd.DataFrame({'id': ids, 'value': ids.astype(np.float64) * 10})
+
+
+def _write_ticks(path: str, sizes: list) -> list:
+    os.makedirs(parts_dir(path), exist_ok=True)
+    chunks, start = [], 0
+    for tick, size in enumerate(sizes):
+        chunk = _rows(start, size)
+        write_part(chunk, part_path(path, tick))
+        chunks.append(chunk)
+        start += size
+    return chunks
+
+
+def test_consolidate_keeps_file_and_parts_in_order(tmp_path):
+    path = str(tmp_path / 'TABLE.parquet')
+    base = _rows(-3, 3)
+    base.to_parquet(path, index=False)
+    chunks = _write_ticks(path, [4, 2, 5])
+
+    assert count_rows(path) == 14
+    assert consolidate_table(path) == 14
+    expected = pd.concat([base] + chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+    assert not os.path.exists(parts_dir(path))
+
+
+def test_consolidate_ignores_parts_after_max_tick(tmp_path):
+    path = str(tmp_path / 'TABLE.parquet')
+    chunks = _write_ticks(path, [4, 2, 5])
+
+    assert consolidate_table(path, max_tick=1) == 6
+    pd.testing.assert_frame_equal(pd.read_parquet(path), pd.concat(chunks[:2], ignore_index=True))
+    assert not os.path.exists(parts_dir(path))
+
+
+def test_consolidate_truncates_at_max_rows(tmp_path):
+    path = str(tmp_path / 'TABLE.parquet')
+    chunks = _write_ticks(path, [4, 2, 5])
+
+    assert consolidate_table(path, max_tick=2, max_rows=5) == 5
+    pd.testing.assert_frame_equal(pd.read_parquet(path), pd.concat(chunks, ignore_index=True).iloc[:5])
@@ -0,0 +1,31 @@
+"""
+Fallback de tendências: restrito aos candidatos do recomendador ou, sem candidatos, aberto a qualquer conteúdo
+já publicado, completado com o sorteio do recomendador.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.recommendation.popularity import PopularityStore
+
+DEFAULT = np.array([90, 91, 92], dtype=np.int32)
+
+
+def _store() -> PopularityStore:
+    store = PopularityStore()
+    store.update({
+        "CONTENT": pd.DataFrame({"ContentID": np.arange(10), "CONTCategory": np.array([1] * 5 + [2] * 5)}),
+        # Conteúdo 3: três visualizações; 1: duas; 7: uma
+        "UWATCHINGCONT": pd.DataFrame({"ContentID": [3, 3, 3, 1, 1, 7], "UWatchCONTDateTime": np.zeros(6)}),
+    }, current_datetime=0.0)
+    return store
+
+
+def test_fallback_restricted_to_candidates():
+    fallback = _store().fallback(np.array([1, -1]), np.array([1, 7, 20]), DEFAULT)
+    np.testing.assert_array_equal(fallback, [[1, 90, 91], [1, 7, 90]])
+
+
+def test_fallback_without_candidates_uses_any_trending_content():
+    fallback = _store().fallback(np.array([1, 2, -1]), None, DEFAULT)
+    np.testing.assert_array_equal(fallback, [[3, 1, 90], [7, 90, 91], [3, 1, 7]])
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from src.recommendation.profiles import LIKE
+from src.recommendation.recommender import Recommender
+
+NUM_CONTENT = 300
+NUM_USERS = 50
+N = 5
+
+
+def make_recommender() -> Recommender:
+    rng = np.random.default_rng(0)
+    content_ids = np.arange(NUM_CONTENT, dtype=np.int32)
+    content = pd.DataFrame({
+        "ContentID": content_ids,
+        "CONTCategory": rng.integers(1, 16, NUM_CONTENT).astype(np.int8),
+    })
+    content_tags = pd.DataFrame({
+        "ContentID": np.repeat(content_ids, 2),
+        "CONTTag": rng.integers(1, 16, 2 * NUM_CONTENT).astype(np.int8),
+    })
+    recommender = Recommender(content, content_tags, backend='numpy', seed=0)
+    recommender.update(new_interactions=pd.DataFrame({
+        "UserID": np.arange(NUM_USERS),
+        "ContentID": rng.choice(content_ids, NUM_USERS),
+        "UINTType": np.full(NUM_USERS, LIKE),
+    }), current_datetime=0)
+    return recommender
+
+
+def test_repeated_queries_are_served_by_the_cache():
+    recommender = make_recommender()
+    user_ids = np.arange(NUM_USERS)
+    first = recommender.recommend_batch(user_ids, N)
+    second = recommender.recommend_batch(user_ids, N)
+
+    np.testing.assert_array_equal(first, second)
+    stats = recommender.stats()[N]
+    assert stats["misses"] == NUM_USERS
+    assert stats["hits"] == NUM_USERS
+
+
+def test_profile_change_invalidates_the_entry():
+    recommender = make_recommender()
+    user_ids = np.arange(NUM_USERS)
+    recommender.recommend_batch(user_ids, N)
+    recommender.update(new_watches=pd.DataFrame({
+        "UserID": [0],
+        "ContentID": [1],
+        "UWatchDurationCONT": [10],
+        "UWatchCONTDateTime": [0.0],
+    }), current_datetime=0)
+    recommender.recommend_batch(user_ids, N)
+
+    stats = recommender.stats()[N]
+    assert stats["hits"] == NUM_USERS - 1
+    assert stats["invalidations"] == 1
@@ -0,0 +1,50 @@
+"""
+Escalonador do tick: estruturas em memória alteradas no lugar são declaradas como tabelas, e nenhuma etapa
+que as lê cai na mesma onda da etapa que as escreve.
+"""
+
+from conftest import require_simulation
+from src.iteration.scheduler import Stage, plan_stages
+
+
+def _noop(inputs, rng):
+    return {}
+
+
+def _levels(stages: list) -> dict:
+    return {stage.name: level for level, wave in enumerate(plan_stages(stages)) for stage in wave}
+
+
+def test_store_readers_wait_for_the_writer():
+    stages = [
+        Stage("writer", _noop, writes={"A", "registry"}),
+        Stage("reader", _noop, reads={"registry"}, writes={"B"}),
+        Stage("independent", _noop, writes={"C"}),
+    ]
+    levels = _levels(stages)
+
+    assert levels["reader"] > levels["writer"]
+    assert levels["independent"] == levels["writer"]
+
+
+def test_tick_stages_declare_the_shared_stores():
+    iterate = require_simulation()
+    stores = {"content_types": object(), "content_attributes": object(), "segments": object()}
+    stages = {stage.name: stage for stage in iterate.build_tick_stages(None, None, {}, 0, 0.0, **stores)}
+
+    assert {"content_types", "content_attributes"} <= stages["content"].writes
+    assert {"content_attributes", "segments"} <= stages["watch"].reads
+    assert "segments" in stages["watch"].writes
+    assert "content_types" in stages["comments"].reads
+    assert not {"LIVE", "VIDEO", "SHORT"} & stages["comments"].reads
+    assert set(iterate.shared_stores(**stores)) == set(stores)
+
+
+def test_comments_read_the_type_tables_without_a_registry():
+    iterate = require_simulation()
+    stages = {stage.name: stage for stage in iterate.build_tick_stages(None, None, {}, 0, 0.0)}
+
+    assert {"LIVE", "VIDEO", "SHORT"} <= stages["comments"].reads
+    assert not {"content_types", "content_attributes", "segments"} & (
+        stages["content"].writes | stages["watch"].reads | stages["watch"].writes
+    )
@@ -0,0 +1,41 @@
+"""
+Servidor HTTP do recomendador: erros de validação do recomendador viram 400 e qualquer outra falha vira 500,
+com a mensagem no corpo e o contador de erros atualizado.
+"""
+
+import asyncio
+
+from src.recommendation.server import MicroBatcher, _route, _response
+
+
+class FailingRecommender:
+    def __init__(self, error: Exception):
+        self.error = error
+
+    def recommend_batch(self, user_ids, n):
+        raise self.error
+
+
+def _get(error: Exception, target: str = "/recommend?user_id=3") -> tuple:
+    async def run():
+        batcher = MicroBatcher(FailingRecommender(error), max_wait_ms=0)
+        batcher.start()
+        try:
+            return await _route(batcher, "GET", target), batcher.stats()
+        finally:
+            await batcher.close()
+    return asyncio.run(run())
+
+
+def test_validation_error_is_a_bad_request():
+    (status, body), _ = _get(ValueError("n must be positive"))
+    assert status == 400
+    assert body == {"error": "n must be positive"}
+
+
+def test_unexpected_error_is_an_internal_server_error():
+    (status, body), stats = _get(RuntimeError("boom"))
+    assert status == 500
+    assert body == {"error": "RuntimeError: boom"}
+    assert stats["errors"] == 1
+    assert _response(status, body).startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
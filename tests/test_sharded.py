@@ -0,0 +1,31 @@
+"""
+Simulação distribuída: depois de `shift_new_ids`, os IDs novos gerados por shards diferentes formam
+sequências únicas e contíguas em todas as tabelas de `NEW_ID_COLUMNS`.
+"""
+
+import numpy as np
+import pandas as pd
+
+NUM_TICKS = 3
+NUM_SHARDS = 2
+SEED = 7
+
+
+def test_shards_produce_unique_contiguous_ids(simulation):
+    from src.iteration.sharded import iterate_sharded, NEW_ID_COLUMNS, ID_SEQUENCES
+    iterate_sharded(NUM_TICKS, 300, 0, NUM_SHARDS, first_iteration=True, seed=SEED)
+    tables = {name: pd.read_parquet(simulation.TABLE_PATHS[name]) for name in NEW_ID_COLUMNS}
+    sequence_ids = {sequence: tables[sequence][next(iter(NEW_ID_COLUMNS[sequence]))] for sequence in ID_SEQUENCES}
+
+    # Cada sequência é contígua na tabela que a define
+    for sequence, ids in sequence_ids.items():
+        ids = ids.to_numpy()
+        assert ids.size > 0, sequence
+        np.testing.assert_array_equal(np.sort(ids), np.arange(ids.size), err_msg=sequence)
+
+    # As demais tabelas repetem IDs da sequência sem duplicá-los
+    for name, columns in NEW_ID_COLUMNS.items():
+        for column, sequence in columns.items():
+            ids = tables[name][column]
+            assert ids.is_unique, f"{name}.{column}"
+            assert ids.isin(sequence_ids[sequence]).all(), f"{name}.{column}"
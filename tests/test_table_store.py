@@ -0,0 +1,64 @@
+"""
+TableStore: appends em O(linhas novas) com buffers que dobram de capacidade, tabelas não retidas e views
+somente-leitura.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("src.iteration.cython.fast_concat")
+
+from src.iteration.table_store import TableStore
+
+
+def _chunk(start: int, num: int) -> pd.DataFrame:
+    ids = np.arange(start, start + num, dtype=np.int32)
+    return pd.DataFrame({
+        'id': ids,
+        'value': ids.astype(np.float64) / 2,
+        'flag': ids % 2 == 0,
+        'name': np.array([f'row{i}' for i in ids], dtype=object),
+    })
+
+
+def test_appends_across_buffer_growth_keep_rows_and_dtypes():
+    chunks = [_chunk(0, 3)] + [_chunk(start, 5) for start in range(3, 40, 5)]
+    store = TableStore({'t': chunks[0]}, initial_capacity=4)
+    for chunk in chunks[1:]:
+        store.append('t', chunk)
+
+    expected = pd.concat(chunks, ignore_index=True)
+    assert store.num_rows('t') == expected.shape[0]
+    pd.testing.assert_frame_equal(store.frame('t'), expected)
+
+
+def test_frame_is_rebuilt_only_after_an_append():
+    store = TableStore({'t': _chunk(0, 3)})
+    first = store.frame('t')
+    assert store.frame('t') is first
+
+    store.append('t', _chunk(3, 2))
+    second = store.frame('t')
+    assert second is not first
+    assert second['id'].tolist() == list(range(5))
+
+
+def test_unretained_table_counts_rows_but_has_no_frame():
+    store = TableStore({'kept': _chunk(0, 3), 'dropped': _chunk(0, 3)}, retain={'kept'},
+                       initial_rows={'dropped': 10})
+    store.append('dropped', _chunk(3, 4))
+
+    assert not store.is_retained('dropped')
+    assert store.num_rows('dropped') == 17
+    with pytest.raises(ValueError):
+        store.frame('dropped')
+
+
+def test_numeric_columns_are_read_only_views():
+    store = TableStore({'t': _chunk(0, 3)})
+    values = store.frame('t')['id'].to_numpy()
+
+    assert not values.flags.writeable
+    with pytest.raises(ValueError):
+        values[0] = 99
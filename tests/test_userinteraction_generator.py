@@ -0,0 +1,43 @@
+"""
+Gerador de interações: o limite mínimo de visualizações vale para as sessões ativas, não para as linhas
+novas do tick.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.generators.userinteraction_generator import create_random_user_interactions
+from src.indexes.interactions import InteractionIndex
+from src.initialization.schema import empty_frame
+
+
+def _watches(num: int, first_id: int = 0) -> pd.DataFrame:
+    ids = np.arange(first_id, first_id + num, dtype=np.int32)
+    return pd.DataFrame({
+        'UWatchDurationCONT': np.full(num, 600, dtype=np.int16),
+        'UWatchCONTDateTime': np.zeros(num),
+        'UIsWatchingCONTNow': np.ones(num, dtype=bool),
+        'UWATCHCONTID': ids,
+        'UserID': ids,
+        'ContentID': ids % 7,
+    })
+
+
+def test_few_new_watches_still_interact_with_active_sessions():
+    new_watches = _watches(3, first_id=100)
+    watching_now = pd.concat([_watches(100), new_watches], ignore_index=True)
+    userinteraction, ucontint = create_random_user_interactions(
+        0.5, new_watches, empty_frame('USERINTERACTION'), empty_frame('UCONTINT'),
+        np.random.default_rng(0), watching_now=watching_now, interaction_index=InteractionIndex()
+    )
+    assert userinteraction.shape[0] == int(watching_now.shape[0] * 0.5)
+    assert ucontint.shape[0] == userinteraction.shape[0]
+
+
+def test_too_few_active_sessions_yield_no_interactions():
+    watching_now = _watches(5)
+    userinteraction, ucontint = create_random_user_interactions(
+        0.5, watching_now, empty_frame('USERINTERACTION'), empty_frame('UCONTINT'),
+        np.random.default_rng(0), watching_now=watching_now, interaction_index=InteractionIndex()
+    )
+    assert userinteraction.empty and ucontint.empty